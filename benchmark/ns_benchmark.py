@@ -0,0 +1,243 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+benchmark suite of the main operations on neutrosophic sets and mappings
+
+usage:
+    python ns_benchmark.py [--sizes 10 100 ...] [--backend python|numpy] [--output results.json]
+    python ns_benchmark.py --compare old.json new.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_mapping import NSmapping
+from NS.pyns.ns_util import NSstringToTriplesList, NSstringToDict
+
+SIZES = [10, 100, 1000, 10000, 100000, 1000000]
+SEED = 20240601   # seme fissato per rendere riproducibili i dati generati
+
+#------------------ generazione dei dati
+
+# restituisce n triple casuali di gradi
+def randomTriples(rnd, n):
+    return [(round(rnd.random(), 3), round(rnd.random(), 3), round(rnd.random(), 3)) for i in range(n)]
+
+
+# restituisce un insieme neutrosofico casuale sull'universo U
+def randomSet(rnd, U):
+    return NSset(U, randomTriples(rnd, U.cardinality()))
+
+
+#------------------ casi di misura: ciascuno riceve la dimensione dell'universo e restituisce la funzione da misurare
+
+def benchUniverseString(n, rnd):
+    text = ", ".join(f"e{i}" for i in range(n))
+    return lambda: NSuniverse(text)
+
+def benchSetFromList(n, rnd):
+    U = NSuniverse([f"e{i}" for i in range(n)])
+    triples = randomTriples(rnd, n)
+    return lambda: NSset(U, triples)
+
+def benchSetFromString(n, rnd):
+    U = NSuniverse([f"e{i}" for i in range(n)])
+    text = ", ".join(f"({mu},{sigma},{omega})" for mu, sigma, omega in randomTriples(rnd, n))
+    return lambda: NSset(U, text)
+
+def benchSetFromArrays(n, rnd):
+    U = NSuniverse([f"e{i}" for i in range(n)])
+    mu, sigma, omega = zip(*randomTriples(rnd, n))
+    return lambda: NSset.fromArrays(U, mu, sigma, omega)
+
+def benchUnion(n, rnd):
+    U = NSuniverse([f"e{i}" for i in range(n)])
+    A, B = randomSet(rnd, U), randomSet(rnd, U)
+    return lambda: A.NSunion(B)
+
+def benchIntersection(n, rnd):
+    U = NSuniverse([f"e{i}" for i in range(n)])
+    A, B = randomSet(rnd, U), randomSet(rnd, U)
+    return lambda: A.NSintersection(B)
+
+def benchComplement(n, rnd):
+    U = NSuniverse([f"e{i}" for i in range(n)])
+    A = randomSet(rnd, U)
+    return lambda: A.NScomplement()
+
+def benchDifference(n, rnd):
+    U = NSuniverse([f"e{i}" for i in range(n)])
+    A, B = randomSet(rnd, U), randomSet(rnd, U)
+    return lambda: A.NSdifference(B)
+
+def benchSubset(n, rnd):   # caso peggiore: l'inclusione è verificata su tutti gli elementi
+    U = NSuniverse([f"e{i}" for i in range(n)])
+    A = randomSet(rnd, U)
+    B = A.NSunion(randomSet(rnd, U))
+    return lambda: A.isNSsubset(B)
+
+def benchDisjoint(n, rnd):   # caso peggiore: gli insiemi sono disgiunti
+    U = NSuniverse([f"e{i}" for i in range(n)])
+    A = NSset(U)
+    B = randomSet(rnd, U)
+    return lambda: A.isNSdisjoint(B)
+
+def randomMapping(n, rnd):
+    m = n // 10 + 1
+    domain = NSuniverse([f"e{i}" for i in range(n)])
+    codomain = NSuniverse([f"v{j}" for j in range(m)])
+    return NSmapping(domain, codomain, [f"v{rnd.randrange(m)}" for i in range(n)])
+
+def benchMappingFromString(n, rnd):
+    text = ", ".join(f"e{i}->v{rnd.randrange(n // 10 + 1)}" for i in range(n))
+    return lambda: NSmapping(text)
+
+def benchImage(n, rnd):
+    f = randomMapping(n, rnd)
+    A = randomSet(rnd, f.getDomain())
+    return lambda: f.NSimage(A)
+
+def benchCounterimage(n, rnd):
+    f = randomMapping(n, rnd)
+    B = randomSet(rnd, f.getCodomain())
+    return lambda: f.NScounterimage(B)
+
+def benchFibre(n, rnd):
+    f = randomMapping(n, rnd)
+    v = f.getCodomain()[0]
+    return lambda: f.getFibre(v)
+
+def benchParseTriples(n, rnd):
+    text = ", ".join(f"({mu},{sigma},{omega})" for mu, sigma, omega in randomTriples(rnd, n))
+    return lambda: NSstringToTriplesList(text)
+
+def benchParseDict(n, rnd):
+    text = ", ".join(f"e{i}->v{rnd.randrange(n // 10 + 1)}" for i in range(n))
+    return lambda: NSstringToDict(text)
+
+BENCHMARKS = {
+    "NSuniverse(str)": benchUniverseString,
+    "NSset(universe, list)": benchSetFromList,
+    "NSset(universe, str)": benchSetFromString,
+    "NSset.fromArrays": benchSetFromArrays,
+    "NSunion": benchUnion,
+    "NSintersection": benchIntersection,
+    "NScomplement": benchComplement,
+    "NSdifference": benchDifference,
+    "isNSsubset": benchSubset,
+    "isNSdisjoint": benchDisjoint,
+    "NSmapping(str)": benchMappingFromString,
+    "NSimage": benchImage,
+    "NScounterimage": benchCounterimage,
+    "getFibre": benchFibre,
+    "NSstringToTriplesList": benchParseTriples,
+    "NSstringToDict": benchParseDict,
+}
+
+#------------------ esecuzione delle misure
+
+# misura una funzione restituendo il tempo minimo e mediano di una chiamata
+def measure(f, repeat, mintime):
+    timer = timeit.Timer(f)
+    number = 1
+    while True:   # numero di chiamate per ripetizione tale da superare il tempo minimo
+        if timer.timeit(number) >= mintime or number >= 10**6:
+            break
+        number *= 10
+    times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {"number": number, "repeat": repeat, "best": min(times), "median": statistics.median(times)}
+
+
+# restituisce l'identificativo del commit corrente (se disponibile)
+def gitCommit():
+    try:
+        folder = os.path.dirname(os.path.abspath(__file__))
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=folder, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# esegue i casi di misura selezionati per tutte le dimensioni
+def run(names, sizes, repeat, mintime):
+    results = list()
+    for name in names:
+        for n in sizes:
+            rnd = random.Random(SEED)
+            f = BENCHMARKS[name](n, rnd)
+            result = {"name": name, "size": n, **measure(f, repeat, mintime)}
+            results.append(result)
+            print(f"{name:>24} {n:>9}   best {result['best']:.3e} s   median {result['median']:.3e} s", file=sys.stderr)
+    return results
+
+
+# confronta due file di risultati segnalando i peggioramenti oltre una soglia
+def compare(old, new, threshold):
+    before = {(r["name"], r["size"]): r["best"] for r in old["results"]}
+    regressions = 0
+    print(f"{'benchmark':>24} {'size':>9} {'before':>11} {'after':>11} {'ratio':>7}")
+    for r in new["results"]:
+        key = (r["name"], r["size"])
+        if key in before:
+            ratio = r["best"] / before[key]
+            flag = "  <-- slower" if ratio > 1 + threshold else ""
+            regressions += flag != ""
+            print(f"{r['name']:>24} {r['size']:>9} {before[key]:>11.3e} {r['best']:>11.3e} {ratio:>7.2f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark suite of the pyns package")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="cardinalities of the universes")
+    parser.add_argument("--bench", nargs="+", default=list(BENCHMARKS), choices=list(BENCHMARKS), metavar="NAME", help="benchmarks to run")
+    parser.add_argument("--backend", default=NSset.backend, choices=["python", "numpy"], help="storage of the degrees")
+    parser.add_argument("--repeat", type=int, default=5, help="number of repetitions of every measure")
+    parser.add_argument("--mintime", type=float, default=0.2, help="minimum duration in seconds of a repetition")
+    parser.add_argument("--output", help="JSON file of the results (default: standard output)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two JSON files of results")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown reported as a regression")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f_old, open(args.compare[1]) as f_new:
+            regressions = compare(json.load(f_old), json.load(f_new), args.threshold)
+        sys.exit(1 if regressions else 0)
+
+    NSset.backend = args.backend
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    report = {
+        "metadata": {
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": gitCommit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": numpy_version,
+            "backend": args.backend,
+            "dtype": NSset.dtype,
+        },
+        "results": run(args.bench, sorted(args.sizes), args.repeat, args.mintime),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
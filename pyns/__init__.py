@@ -0,0 +1,3 @@
+from .ns_profile import NSprofile, profile
+from .ns_cache import NScache, cache
+from .ns_expression import NSexpression
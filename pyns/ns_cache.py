@@ -0,0 +1,314 @@
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+
+
+class NScache:
+    """
+    Package Python Neutrosophic Sets (PYNS)
+    ns_cache.py
+    Class of a bounded LRU cache of the results of the operations on neutrosophic sets and mappings
+    (union, intersection, complement, difference, image and counterimage) keyed by the name of the
+    operation and by the fingerprints of its operands, which is used while it is active
+    ----------------------------------------------------------------------------------
+    author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+    www.nordo.it   |  giorgio.nordo@unime.it
+    """
+
+    #------------------ variabili di classe
+    # le operazioni consultano la cache solo se ne è stata attivata una, in modo che
+    # a cache disattivata il costo aggiuntivo sia un solo controllo
+    __current = None   # cache attualmente attiva
+    __switch = Lock()
+
+    # costruttore
+    def __init__(self, maxentries=1024, maxbytes=256 * 1024 * 1024):
+        """
+        Constructor of an empty cache, which is used by the operations when it is activated
+        by the method enable or entered as a context manager.
+        ----
+        Parameters:
+        - maxentries: maximum number of results kept (default 1024)
+        - maxbytes: maximum number of bytes of the degrees of the results kept (default 256 MiB)
+        """
+        if maxentries < 0 or maxbytes < 0:
+            raise ValueError("the limits of the cache cannot be negative")
+        self.maxentries = maxentries
+        self.maxbytes = maxbytes
+        self.__entries = OrderedDict()   # chiave -> (risultato, byte, universi), dal meno al più recentemente usato
+        self.__bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__lock = Lock()
+        self.__previous = list()   # cache attive prima dei blocchi with annidati
+
+
+    # attiva la cache all'ingresso del blocco with
+    def __enter__(self):
+        with NScache.__switch:
+            self.__previous.append(NScache.__current)
+            NScache.__current = self
+        return self
+
+
+    # ripristina la cache precedente all'uscita del blocco with
+    def __exit__(self, *exc):
+        with NScache.__switch:
+            NScache.__current = self.__previous.pop()
+        return False
+
+
+    # attiva la cache
+    def enable(self):
+        """
+        Method that makes the current cache the one used by the operations until it is disabled.
+        ----
+        Returns: the current cache
+        """
+        with NScache.__switch:
+            NScache.__current = self
+        return self
+
+
+    # disattiva la cache
+    def disable(self):
+        """
+        Method that stops the use of the current cache by the operations (its results are kept).
+        """
+        with NScache.__switch:
+            if NScache.__current is self:
+                NScache.__current = None
+
+
+    # restituisce la cache attiva
+    @staticmethod
+    def active():
+        """
+        Returns the cache currently used by the operations.
+        ----
+        Returns: the active NScache object or None
+        """
+        return NScache.__current
+
+
+    #------------------------------------------------------------------------------------
+
+    # crea il decoratore che fa passare un'operazione attraverso la cache attiva
+    @staticmethod
+    def cached(operation, commutative=False):
+        """
+        Returns a decorator of a method of NSset or NSmapping which, while a cache is active, looks up
+        the result in it by the fingerprints and the storages (list, numpy array or sparse) of the object
+        and of the other operands, and stores it after computing it. A result is returned only if the
+        operands are also defined on the same universes of those it was computed from; since the content
+        of the operands is identified by its 64-bit fingerprint, two different operands with the same
+        universes and the same fingerprint (with probability about 2^-64 for each pair) would share
+        the result. The results are copied both when they are stored and when they are returned,
+        so that changing them never alters the cache.
+        ----
+        Parameters:
+        - operation: name of the operation
+        - commutative: True if the result does not depend on the order of the two operands
+                       (they share an entry only when they have the same storage)
+        ----
+        Returns: the decorator
+        """
+        def decorator(f):
+            @wraps(f)
+            def wrapper(*args):
+                cache = NScache.__current
+                if cache is None:
+                    return f(*args)
+                try:
+                    operands = [(obj.fingerprint(), NScache.__storage(obj)) for obj in args]
+                    universes = tuple(NScache.__universes(obj) for obj in args)
+                except AttributeError:   # operando non valido: l'errore viene segnalato dall'operazione
+                    return f(*args)
+                # il risultato usa la memorizzazione del primo operando: gli operandi si scambiano solo se è la stessa
+                if commutative and operands[0][1] == operands[1][1] and operands[1] < operands[0]:
+                    operands.reverse()
+                    universes = universes[::-1]
+                key = (operation, *operands)
+                result = cache.__lookup(key, universes)
+                if result is None:
+                    result = f(*args)
+                    cache.__store(key, universes, type(result)(result))
+                return result
+            return wrapper
+        return decorator
+
+
+    # metodo privato che restituisce il tipo di memorizzazione di un operando
+    @staticmethod
+    def __storage(obj):
+        """ private method that returns the storage of an operand, on which the storage of the result depends.
+        ----
+        Parameters:
+        - obj: neutrosophic set or mapping
+        ----
+        Returns: "sparse" or the name of the type of the degrees for a neutrosophic set, None for a mapping
+        """
+        if not hasattr(obj, "isSparse"):
+            return None
+        return "sparse" if obj.isSparse() else type(obj.getDegrees()).__name__   # gradi restituiti senza copia
+
+
+    # metodo privato che restituisce gli universi di un operando
+    @staticmethod
+    def __universes(obj):
+        """ private method that returns the universes on which an operand is defined.
+        ----
+        Parameters:
+        - obj: neutrosophic set or mapping
+        ----
+        Returns: the tuple of the universe of a neutrosophic set or of the domain and the codomain of a mapping
+        """
+        if hasattr(obj, "getUniverseSet"):
+            return (obj.getUniverseSet(),)
+        return (obj.getDomain(), obj.getCodomain())
+
+
+    # metodo privato che cerca un risultato nella cache
+    def __lookup(self, key, universes):
+        """ private method that looks up the result of an operation, marking it as the most recently used.
+        ----
+        Parameters:
+        - key: tuple of the name of the operation and of the fingerprints and storages of its operands
+        - universes: tuple of the universes of the operands
+        ----
+        Returns: a copy of the result or None if it is not in the cache
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            # gli universi condivisi si confrontano in tempo costante
+            if entry is None or any(u != v for u, v in zip(entry[2], universes)):
+                self.__misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+        return type(entry[0])(entry[0])   # la copia viene fatta fuori dal blocco
+
+
+    # metodo privato che memorizza un risultato nella cache
+    def __store(self, key, universes, result):
+        """ private method that stores the result of an operation, evicting the least recently used ones
+        while the limits of the cache are exceeded.
+        ----
+        Parameters:
+        - key: tuple of the name of the operation and of the fingerprints and storages of its operands
+        - universes: tuple of the universes of the operands
+        - result: the neutrosophic set to store (not copied)
+        """
+        size = result.nbytes()
+        if size > self.maxbytes or self.maxentries == 0:
+            return
+        with self.__lock:
+            old = self.__entries.pop(key, None)
+            if old is not None:   # calcolato nel frattempo da un altro thread
+                self.__bytes -= old[1]
+            self.__entries[key] = (result, size, universes)
+            self.__bytes += size
+            self.__shrink()
+
+
+    # metodo privato che elimina i risultati meno recentemente usati finché i limiti sono superati
+    def __shrink(self):
+        """ private method that evicts the least recently used results while the number of entries
+        or of bytes exceeds the limits of the cache (it must be called holding the lock).
+        """
+        while self.__entries and (len(self.__entries) > self.maxentries or self.__bytes > self.maxbytes):
+            _, (result, size, universes) = self.__entries.popitem(last=False)
+            self.__bytes -= size
+            self.__evictions += 1
+
+
+    #------------------------------------------------------------------------------------
+
+    # elimina tutti i risultati memorizzati
+    def clear(self):
+        """
+        Method that removes all the results from the cache (the statistics are kept).
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__bytes = 0
+
+
+    # modifica i limiti della cache
+    def resize(self, maxentries=None, maxbytes=None):
+        """
+        Method that changes the limits of the cache, evicting the least recently used results if needed.
+        ----
+        Parameters:
+        - maxentries: new maximum number of results or None to keep the current one
+        - maxbytes: new maximum number of bytes or None to keep the current one
+        """
+        if (maxentries is not None and maxentries < 0) or (maxbytes is not None and maxbytes < 0):
+            raise ValueError("the limits of the cache cannot be negative")
+        with self.__lock:
+            if maxentries is not None:
+                self.maxentries = maxentries
+            if maxbytes is not None:
+                self.maxbytes = maxbytes
+            self.__shrink()
+
+
+    # restituisce le statistiche della cache
+    def stats(self):
+        """
+        Method that returns the statistics of the cache.
+        ----
+        Returns: the dictionary with the number of hits, misses and evictions, the hit rate
+        and the number of entries and of bytes currently kept
+        """
+        with self.__lock:
+            lookups = self.__hits + self.__misses
+            return {"hits": self.__hits, "misses": self.__misses, "evictions": self.__evictions,
+                    "hitrate": self.__hits / lookups if lookups else 0.0,
+                    "entries": len(self.__entries), "bytes": self.__bytes}
+
+
+    # azzera le statistiche
+    def resetStats(self):
+        """
+        Method that clears the number of hits, misses and evictions.
+        """
+        with self.__lock:
+            self.__hits = self.__misses = self.__evictions = 0
+
+
+    # restituisce il numero di risultati memorizzati col metodo speciale __len__
+    def __len__(self):
+        with self.__lock:
+            return len(self.__entries)
+
+
+    # restituisce le statistiche come stringa col metodo speciale __str__
+    def __str__(self):
+        """ Method that returns the statistics of the cache as a string.
+        ----
+        Returns: string containing the statistics
+        """
+        s = self.stats()
+        return (f"entries: {s['entries']}/{self.maxentries}   bytes: {s['bytes']}/{self.maxbytes}   "
+                f"hits: {s['hits']}   misses: {s['misses']}   evictions: {s['evictions']}   hit rate: {s['hitrate']:.2%}")
+
+
+# crea una cache da attivare come gestore di contesto o col metodo enable
+def cache(maxentries=1024, maxbytes=256 * 1024 * 1024):
+    """
+    Returns a new cache of the results of the operations on neutrosophic sets and mappings,
+    used inside a with block or after calling its method enable:
+
+        with pyns.cache(maxentries=4096) as c:
+            ...
+        print(c.stats())
+    ----
+    Parameters:
+    - maxentries: maximum number of results kept (default 1024)
+    - maxbytes: maximum number of bytes of the degrees of the results kept (default 256 MiB)
+    ----
+    Returns: the new NScache object
+    """
+    return NScache(maxentries, maxbytes)
@@ -0,0 +1,507 @@
+from .ns_set import NSset
+#----
+try:
+    import numpy as np
+except ImportError:   # numpy è una dipendenza opzionale richiesta solo dal motore colonnare
+    np = None
+
+class NSexpression:
+    """
+    Package Python Neutrosophic Sets (PYNS)
+    ns_expression.py
+    Class that defines an expression of union, intersection, complement and difference of neutrosophic sets
+    over the same universe which is evaluated only on demand, simplifying it and computing all its operations
+    in a single pass over the universe without creating intermediate neutrosophic sets
+    ----------------------------------------------------------------------------------
+    author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+    www.nordo.it   |  giorgio.nordo@unime.it
+    """
+
+    #------------------ variabili di classe
+    blockelements = 1 << 16   # numero di elementi valutati alla volta dal motore numpy
+    __constants = {"empty": [0.0, 0.0, 1.0], "absolute": [1.0, 1.0, 0.0]}
+
+    # costruttore
+    def __init__(self, nset):
+        """
+        Constructor of the expression made of a single neutrosophic set (expressions are also built
+        by the operators +, &, ~, - of neutrosophic sets when the class variable NSset.lazy is True).
+        ----
+        Parameters:
+        - nset: neutrosophic set
+        """
+        if type(nset) != NSset:
+            raise ValueError("obj not compatible with the type neutrosophic set")
+        # ogni nodo è una foglia ("set") oppure un'operazione ("complement", "union", "intersection")
+        # i cui operandi sono a loro volta espressioni
+        self.__operation = "set"
+        self.__operands = (nset,)
+        self.__universe = nset.getUniverseSet()
+
+
+    # metodo privato che crea il nodo di un'operazione
+    @staticmethod
+    def __node(operation, operands):
+        """ private method that returns the expression of an operation on other expressions
+        or neutrosophic sets defined on the same universe.
+        ----
+        Parameters:
+        - operation: "complement", "union" or "intersection"
+        - operands: tuple of expressions or neutrosophic sets
+        ----
+        Returns: the new expression
+        """
+        operands = tuple(NSexpression.__expression(e) for e in operands)
+        universe = operands[0].__universe
+        for e in operands[1:]:
+            if e.__universe != universe:   # confronto in tempo costante tra universi condivisi
+                raise ValueError("the neutrosophic sets cannot be defined on different universe sets")
+        E = NSexpression.__new__(NSexpression)
+        E.__operation = operation
+        E.__operands = operands
+        E.__universe = universe
+        return E
+
+
+    # metodo privato che converte un operando in espressione
+    @staticmethod
+    def __expression(obj):
+        """ private method that converts an operand into an expression.
+        ----
+        Parameters:
+        - obj: expression or neutrosophic set
+        ----
+        Returns: the expression
+        """
+        if isinstance(obj, NSexpression):
+            return obj
+        elif type(obj) == NSset:
+            return NSexpression(obj)
+        raise ValueError("the operand must be a neutrosophic set or a neutrosophic expression")
+
+
+    #------------------------------------------------------------------------------------
+
+    # operatore unione (+) con overloading sul metodo __add__
+    def __add__(self, e):
+        """ lazy neutrosophic union
+        """
+        return NSexpression.__node("union", (self, e))
+
+
+    # operatore intersezione (&) con overloading sul metodo __and__
+    def __and__(self, e):
+        """ lazy neutrosophic intersection
+        """
+        return NSexpression.__node("intersection", (self, e))
+
+
+    # operatore complementare (~ = tilde) con overloading sul metodo __invert__
+    def __invert__(self):
+        """ lazy neutrosophic complement
+        """
+        return NSexpression.__node("complement", (self,))
+
+
+    # operatore differenza (-) con overloading sul metodo __sub__
+    def __sub__(self, e):
+        """ lazy neutrosophic difference, i.e. the intersection with the complement of the second operand
+        """
+        return NSexpression.__node("intersection", (self, NSexpression.__node("complement", (e,))))
+
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che semplifica l'espressione
+    def __simplified(self, leaves, negated=False):
+        """ private method that returns the simplified form of the expression, where the complements are
+        moved onto the neutrosophic sets by the De Morgan laws (so that double complements cancel),
+        nested unions and intersections are flattened, repeated operands are removed (idempotence),
+        the empty and the absolute sets are absorbed, and so are the intersections (unions) containing
+        an operand of the enclosing union (intersection).
+        ----
+        Parameters:
+        - leaves: dictionary id -> position of the distinct neutrosophic sets, which is filled in
+        - negated: True if the expression is complemented
+        ----
+        Returns: the tuple ("constant", "empty" | "absolute"), ("set", position, negated)
+        or (operation, tuple of simplified operands)
+        """
+        operation = self.__operation
+        if operation == "set":
+            nset = self.__operands[0]
+            empty = nset.isEmpty()
+            if empty or nset.isAbsolute():   # insiemi vuoti o assoluti verificati in tempo costante se sparsi
+                return ("constant", "absolute" if empty == negated else "empty")
+            return ("set", leaves.setdefault(id(nset), len(leaves)), negated)
+        if operation == "complement":
+            return self.__operands[0].__simplified(leaves, not negated)
+        if negated:   # leggi di De Morgan
+            operation = "intersection" if operation == "union" else "union"
+        dual = "intersection" if operation == "union" else "union"
+        absorbing, neutral = ("absolute", "empty") if operation == "union" else ("empty", "absolute")
+        operands = list()
+        for e in self.__operands:
+            s = e.__simplified(leaves, negated)
+            nested = s[1] if s[0] == operation else (s,)
+            for t in nested:
+                if t == ("constant", absorbing):
+                    return t
+                if t != ("constant", neutral) and t not in operands:   # elemento neutro e idempotenza
+                    operands.append(t)
+        # assorbimento: A + (A & B) = A e A & (A + B) = A
+        operands = [t for t in operands if not (t[0] == dual and any(u in operands for u in t[1]))]
+        if not operands:
+            return ("constant", neutral)
+        if len(operands) == 1:
+            return operands[0]
+        return (operation, tuple(operands))
+
+
+    # metodo privato che costruisce la funzione che calcola un grado di un'espressione semplificata
+    @staticmethod
+    def __degree(node, j):
+        """ private method that builds, as a tree of nested functions mirroring the simplified expression,
+        the function computing the j-th (j=0,1,2) degree of an element from the triples of that element
+        in the neutrosophic sets of the expression.
+        ----
+        Parameters:
+        - node: simplified expression
+        - j: index of the degree
+        ----
+        Returns: the function of the tuple of the triples of the element in the neutrosophic sets
+        """
+        if node[0] == "set":
+            i, negated = node[1], node[2]
+            if negated and j == 1:
+                return lambda T: 1 - T[i][1]
+            k = (2, 1, 0)[j] if negated else j   # il complementare scambia appartenenza e non appartenenza
+            return lambda T: T[i][k]
+        f = max if (node[0] == "union") != (j == 2) else min
+        operands = node[1]
+        if len(operands) > 2:   # l'operazione su più operandi viene divisa in due metà di uguale profondità
+            half = len(operands) // 2
+            operands = ((node[0], operands[:half]) if half > 1 else operands[0],
+                        (node[0], operands[half:]) if len(operands) - half > 1 else operands[-1])
+        # i gradi letti direttamente da un insieme non richiedono la chiamata di un'altra funzione
+        (a, (p, k)), (b, (q, h)) = (NSexpression.__operand(t, j) for t in operands)
+        if a is None and b is None:
+            return lambda T: f(T[p][k], T[q][h])
+        elif a is None:
+            return lambda T: f(T[p][k], b(T))
+        elif b is None:
+            return lambda T: f(a(T), T[q][h])
+        return lambda T: f(a(T), b(T))
+
+
+    # metodo privato che restituisce come leggere il grado di un operando
+    @staticmethod
+    def __operand(node, j):
+        """ private method that returns how the j-th (j=0,1,2) degree of an operand of a simplified
+        expression is obtained: directly from the triple of one of its neutrosophic sets, or by a function.
+        ----
+        Parameters:
+        - node: simplified expression
+        - j: index of the degree
+        ----
+        Returns: the pair (None, (position of the set, index of the degree)) or (function, (None, None))
+        """
+        if node[0] == "set" and not (node[2] and j == 1):
+            return None, (node[1], (2, 1, 0)[j] if node[2] else j)
+        return NSexpression.__degree(node, j), (None, None)
+
+
+    # metodo privato che costruisce la funzione che calcola la tripla di un elemento
+    @staticmethod
+    def __row(node):
+        """ private method that builds the function computing the triple of an element of a simplified
+        expression from the triples of that element in its neutrosophic sets.
+        ----
+        Parameters:
+        - node: simplified expression
+        ----
+        Returns: the function of the tuple of the triples of the element in the neutrosophic sets
+        """
+        mu, sigma, omega = (NSexpression.__degree(node, j) for j in range(3))
+        return lambda T: [mu(T), sigma(T), omega(T)]
+
+
+    # metodo privato che calcola una colonna di gradi di un'espressione semplificata con numpy
+    @staticmethod
+    def __column(node, j, blocks, out, buffers, depth=0):
+        """ private method that writes into out the j-th (j=0,1,2) degrees of a block of elements of a
+        simplified expression, accumulating every operation in place and using one buffer per level of nesting.
+        ----
+        Parameters:
+        - node: simplified expression
+        - j: index of the degree
+        - blocks: list of the (b,3) blocks of degrees of the neutrosophic sets
+        - out: (b,) array receiving the degrees
+        - buffers: list of the auxiliary arrays of the levels of nesting, which is extended if needed
+        - depth: level of nesting of node
+        """
+        if node[0] == "set":
+            i, negated = node[1], node[2]
+            if negated and j == 1:
+                np.subtract(1, blocks[i][:, 1], out=out)
+            else:
+                np.copyto(out, blocks[i][:, (2, 1, 0)[j] if negated else j])
+            return
+        ufunc = np.maximum if (node[0] == "union") != (j == 2) else np.minimum
+        operands = node[1]
+        NSexpression.__column(operands[0], j, blocks, out, buffers, depth + 1)
+        for t in operands[1:]:
+            if t[0] == "set" and not (t[2] and j == 1):   # il grado di un insieme viene usato senza copiarlo
+                ufunc(out, blocks[t[1]][:, (2, 1, 0)[j] if t[2] else j], out=out)
+            else:
+                if len(buffers) <= depth:
+                    buffers.append(np.empty_like(out))
+                buffer = buffers[depth][:len(out)]
+                NSexpression.__column(t, j, blocks, buffer, buffers, depth + 1)
+                ufunc(out, buffer, out=out)
+
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che semplifica l'espressione e ne raccoglie gli insiemi neutrosofici
+    def __prepared(self):
+        """ private method that simplifies the expression and collects its distinct neutrosophic sets.
+        ----
+        Returns: the pair of the simplified expression and of the list of the neutrosophic sets
+        in the order of their positions
+        """
+        leaves = dict()
+        node = self.__simplified(leaves)
+        nsets = dict()
+        self.__collect(nsets)
+        keys = list(leaves)   # i dizionari conservano l'ordine di inserimento
+        used = dict()         # gli insiemi eliminati dalle semplificazioni vengono esclusi e gli altri rinumerati
+        node = NSexpression.__renumbered(node, used)
+        return node, [nsets[keys[i]] for i in used]
+
+
+    # metodo privato che rinumera gli insiemi neutrosofici di un'espressione semplificata
+    @staticmethod
+    def __renumbered(node, used):
+        """ private method that numbers the neutrosophic sets of a simplified expression
+        in order of first appearance.
+        ----
+        Parameters:
+        - node: simplified expression
+        - used: dictionary old position -> new position, which is filled in
+        ----
+        Returns: the simplified expression with the new positions
+        """
+        if node[0] == "set":
+            return ("set", used.setdefault(node[1], len(used)), node[2])
+        elif node[0] == "constant":
+            return node
+        return (node[0], tuple(NSexpression.__renumbered(t, used) for t in node[1]))
+
+
+    # metodo privato che raccoglie gli insiemi neutrosofici dell'espressione
+    def __collect(self, nsets):
+        """ private method that collects the neutrosophic sets of the expression.
+        ----
+        Parameters:
+        - nsets: dictionary id -> neutrosophic set, which is filled in
+        """
+        if self.__operation == "set":
+            nsets[id(self.__operands[0])] = self.__operands[0]
+        else:
+            for e in self.__operands:
+                e.__collect(nsets)
+
+
+    # valuta l'espressione
+    def evaluate(self):
+        """
+        Method that evaluates the expression on the current degrees of its neutrosophic sets:
+        the expression is simplified and all its operations are computed in a single pass over the universe
+        (by blocks of NSexpression.blockelements elements with numpy) without intermediate neutrosophic sets.
+        ----
+        Returns: the new neutrosophic set
+        """
+        node, nsets = self.__prepared()
+        if node[0] == "constant":
+            C = NSset(self.__universe)
+            if node[1] == "absolute":
+                C.setAbsolute()
+            return C
+        degrees = [nset.getDegrees() for nset in nsets]
+        if np is not None and any(isinstance(D, np.ndarray) for D in degrees):
+            # come per le operazioni, il motore numpy viene usato se almeno un insieme è memorizzato in un array
+            degrees = [np.asarray(D, dtype=np.float64).reshape(-1, 3) if not isinstance(D, np.ndarray) else D for D in degrees]
+            n = self.__universe.cardinality()
+            result = np.empty((n, 3), dtype=np.result_type(*degrees))
+            buffers = list()
+            for start in range(0, n, NSexpression.blockelements):
+                stop = min(start + NSexpression.blockelements, n)
+                blocks = [D[start:stop] for D in degrees]
+                for j in range(3):
+                    NSexpression.__column(node, j, blocks, result[start:stop, j], buffers)
+            return NSset.fromMatrix(self.__universe, result)
+        row = NSexpression.__row(node)   # un'unica scansione degli elementi di tutti gli insiemi
+        return NSset(self.__universe, [row(T) for T in zip(*degrees)])
+
+
+    # restituisce la lista dei gradi di appartenenza, indeterminazione e non appartenenza
+    def getElement(self, u):
+        """
+        Method that evaluates the expression only on a given element.
+        ----
+        Parameters:
+        - u: element of the universe
+        ----
+        Returns: the list of the membership, indeterminacy and non-membership degrees of u
+        """
+        node, nsets = self.__prepared()
+        if node[0] == "constant":
+            self.__universe.indexOf(u)   # controlla che l'elemento appartenga all'universo
+            return list(NSexpression.__constants[node[1]])
+        row = NSexpression.__row(node)
+        return row(tuple(nset.getElement(u) for nset in nsets))
+
+
+    # restituisce il grado di appartenenza
+    def getMembership(self, u):
+        """
+        Method that evaluates the membership degree of a given element.
+        ----
+        Parameters:
+        - u: element of the universe
+        ----
+        Returns: the membership degree of u
+        """
+        return self.getElement(u)[0]
+
+
+    # restituisce il grado di indeterminazione
+    def getIndeterminacy(self, u):
+        """
+        Method that evaluates the indeterminacy degree of a given element.
+        ----
+        Parameters:
+        - u: element of the universe
+        ----
+        Returns: the indeterminacy degree of u
+        """
+        return self.getElement(u)[1]
+
+
+    # restituisce il grado di non appartenenza
+    def getNonMembership(self, u):
+        """
+        Method that evaluates the non-membership degree of a given element.
+        ----
+        Parameters:
+        - u: element of the universe
+        ----
+        Returns: the non-membership degree of u
+        """
+        return self.getElement(u)[2]
+
+
+    # metodo che restituisce l'universo come oggetto insieme universo
+    def getUniverseSet(self):
+        """
+        Method that returns the universe of the expression as an object
+        ----
+        Returns: the universe set object
+        """
+        return self.__universe
+
+
+    # metodo che restituisce la cardinalità dell'universo dell'espressione
+    def cardinality(self):
+        """
+        Method that returns the cardinality of the universe of the expression
+        ----
+        Returns: the number of elements of the universe
+        """
+        return self.__universe.cardinality()
+
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che valuta un operando di un confronto
+    @staticmethod
+    def __evaluated(obj):
+        """ private method that evaluates an operand of a comparison.
+        ----
+        Parameters:
+        - obj: expression or neutrosophic set
+        ----
+        Returns: the neutrosophic set
+        """
+        return obj.evaluate() if isinstance(obj, NSexpression) else obj
+
+
+    # confronta col metodo speciale __eq__ il valore dell'espressione con un insieme neutrosofico o un'altra espressione
+    def __eq__(self, e):
+        """ Checks if the value of the expression is equal to a neutrosophic set or to the value of another expression.
+        """
+        return self.evaluate() == NSexpression.__evaluated(e)
+
+
+    # confronta col metodo speciale __ne__ il valore dell'espressione con un insieme neutrosofico o un'altra espressione
+    def __ne__(self, e):
+        """ Checks if the value of the expression is different from a neutrosophic set or from the value of another expression.
+        """
+        return self.evaluate() != NSexpression.__evaluated(e)
+
+
+    # operatore sottoinsieme (<=) con overloading sul metodo __le__
+    def __le__(self, e):
+        """ neutrosophic subset of the values
+        """
+        return self.evaluate().isNSsubset(NSexpression.__evaluated(e))
+
+
+    # operatore sovrainsieme (>=) con overloading sul metodo __ge__
+    def __ge__(self, e):
+        """ neutrosophic superset of the values
+        """
+        return self.evaluate().isNSsuperset(NSexpression.__evaluated(e))
+
+
+    __hash__ = None   # le espressioni dipendono dai gradi correnti dei loro insiemi neutrosofici
+
+
+    # restituisce il valore dell'espressione come stringa col metodo speciale __str__
+    def __str__(self):
+        """ Method that returns the value of the expression as a string.
+        ----
+        Returns: string containing the neutrosophic set obtained by evaluating the expression
+        """
+        return str(self.evaluate())
+
+
+    # restituisce la struttura dell'espressione col metodo speciale __repr__
+    def __repr__(self):
+        """ Method that returns the structure of the expression, where the neutrosophic sets
+        are numbered in order of first appearance.
+        ----
+        Returns: string containing the structure of the expression
+        """
+        nsets = dict()
+        self.__collect(nsets)
+        positions = {key: i for i, key in enumerate(nsets)}
+        return f"NSexpression({self.__format(positions)})"
+
+
+    # metodo privato che restituisce la struttura di un'espressione
+    def __format(self, positions):
+        """ private method that returns the structure of the expression in terms of the operators +, &, ~.
+        ----
+        Parameters:
+        - positions: dictionary id -> position of the neutrosophic sets
+        ----
+        Returns: string containing the structure of the expression
+        """
+        if self.__operation == "set":
+            return f"S{positions[id(self.__operands[0])]}"
+        if self.__operation == "complement":
+            return "~" + self.__operands[0].__format(positions)
+        symbol = " + " if self.__operation == "union" else " & "
+        return "(" + symbol.join(e.__format(positions) for e in self.__operands) + ")"
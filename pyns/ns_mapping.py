@@ -1,7 +1,18 @@
+from array import array
+from bisect import bisect_left, insort
+from weakref import WeakValueDictionary
+#--
 from .ns_universe import NSuniverse
 from .ns_set import NSset
+from .ns_cache import NScache
+#--
+from .ns_util import NSstringToList, NSstringToDict, NSisExtDict, NSwriteBinary, NSreadBinary
+from .ns_util import NS_MASK64, NS_VALUEKEY, NSmix64, NSpositionWeights, NSweightedSum
 #--
-from .ns_util import NSreplace, NSstringToDict, NSisExtDict
+try:
+    import numpy as np
+except ImportError:   # numpy è una dipendenza opzionale richiesta solo dal motore colonnare
+    np = None
 
 class NSmapping:
     """
@@ -13,6 +24,14 @@ class NSmapping:
     www.nordo.it   |  giorgio.nordo@unime.it
     """
 
+    #------------------ variabili di classe
+    __magic = b"PYNSMAP\0"   # identificativo dei file binari di funzioni
+    __fibreindex = WeakValueDictionary()   # impronta -> funzione le cui fibre possono essere condivise
+    __fibres = None            # indice inverso, costruito (o condiviso) alla prima richiesta
+    __sharedfibres = False     # True se le fibre sono condivise con un'altra funzione uguale
+    __fingerprint = None       # somma pesata degli hash delle posizioni (None finché non viene richiesta)
+    reprelements = 20    # massimo numero di elementi mostrati (i primi e gli ultimi) dalla rappresentazione __repr__
+
     # costruttore
     def __init__(self, *args):
         """
@@ -40,11 +59,11 @@ class NSmapping:
         elif length == 1:
             if type(args[0]) == NSmapping:  # se è un oggetto NSmapping lo ricopia
                 domain = args[0].getDomain()
-                codomain = args[0].getDomain()
-                map = args[0].getMap()
+                codomain = args[0].getCodomain()
+                map = dict(args[0].getMap())
             # -------------------------------------------------------
             elif type(args[0]) == dict:  # se è un dizionario
-                map = args[0]
+                map = {str(k): str(v) for k, v in args[0].items()}   # elementi e valori vengono trattati come stringhe
                 domain = NSuniverse(list(map.keys()))
                 codomain = NSuniverse(list(set(map.values())))  # elimina gli elementi ripetuti nei valori
             elif type(args[0]) == str:  # se è una stringa prova a prelevarne gli elementi conme dizionario esteso
@@ -102,22 +121,20 @@ class NSmapping:
                 if type(values) in [list, tuple]:  # tratta il sottocaso liste o tuple
                     values = [str(e) for e in values]  # converti in lista di stringhe
                 else:                    # tratta il sottocaso stringa contenente lista o tupla
-                    sostituz = {"[": "", "]": "", "(": "", ")": "",
-                                ",": " ", ";": " "}
-                    values = NSreplace(values, sostituz).split()  # sostituisce i valori e riduce a lista
+                    values = NSstringToList(values)  # separa i valori in un'unica scansione
                 #----------- operazioni comuni ai due casi
                 # controlla che il numero di valori sia pari alla cardinalità del dominio
                 if len(values) != card_domain:
                     raise IndexError("the number of values passed does not coincide with the cardinality of the declared domain")
                 # controlla che tra i values non ci siano elementi estranei al codominio
                 values_set = set(values)
-                codomain_set = set(codomain.get())
+                codomain_set = set(codomain)
                 if not values_set.issubset(codomain_set):
                     raise ValueError("one or more values do not belong to the declared codomain")
                 # procede col preparare l'associazione dei valori nel dizionario map
                 # trattandosi di lista o di una tupla segue l'ordine naturale
-                for i in range(card_domain):
-                    map[domain.get()[i]] = values[i]
+                for u, v in zip(domain, values):
+                    map[u] = v
 
             else:   # in tutti gli altri casi solleva una eccezione
                 raise ValueError("the third parameter of the constructor method must express a value match")
@@ -126,9 +143,78 @@ class NSmapping:
         else:
             raise IndexError("the number of parameters do not match those of the constructor method")
         # memorizza i valori ottenuti nelle proprietà dell'oggetto
+        # la funzione viene memorizzata come array delle posizioni nel codominio dei valori degli elementi del dominio
         self.__domain = domain
         self.__codomain = codomain
-        self.__map = map
+        self.__positions = self.__buildPositions(map)
+
+
+    # metodo privato che costruisce l'array delle posizioni dei valori nel codominio
+    def __buildPositions(self, map):
+        """ private method that builds the array containing, for each element of the domain
+        (in its order), the position of its value in the codomain.
+        ----
+        Parameters:
+        - map: dictionary of the element-value pairs of the mapping
+        ----
+        Returns: a list of integers or, for the numpy backend of neutrosophic sets, an integer numpy array
+        """
+        positions = [self.__codomain.indexOf(map[u]) for u in self.__domain]
+        if NSset.backend == "numpy" and np is not None:
+            positions = np.array(positions, dtype=np.intp)
+        return positions
+
+
+    # metodo privato che crea una funzione direttamente dall'array delle posizioni dei valori
+    @staticmethod
+    def __fromPositions(domain, codomain, positions):
+        """ private method that returns a new mapping between two universes given the array
+        of the positions in the codomain of the values of the elements of the domain.
+        ----
+        Parameters:
+        - domain, codomain: universe sets
+        - positions: list of integers or integer numpy array (which is not copied)
+        ----
+        Returns: the new mapping
+        """
+        f = NSmapping.__new__(NSmapping)   # evita di ricostruire e validare il dizionario dei valori
+        f.__domain = domain
+        f.__codomain = codomain
+        f.__positions = positions
+        return f
+
+
+    # metodo privato che costruisce l'indice inverso (le fibre) della funzione
+    def __buildFibres(self):
+        """ private method that builds the inverse index of the mapping, i.e. the list of the fibres
+        of all the elements of the codomain, each of them expressed as the ordered list of
+        the positions in the domain of its elements.
+        ----
+        Returns: the list of the fibres in the same order of the codomain
+        """
+        fibres = [list() for i in range(self.__codomain.cardinality())]
+        for i, k in enumerate(self.__positions):   # scorrendo il dominio in ordine ogni fibra risulta ordinata
+            fibres[k].append(i)
+        return fibres
+
+
+    # metodo privato che restituisce l'indice inverso (le fibre) della funzione
+    def __fibreIndex(self):
+        """ private method that returns the inverse index of the mapping, building it at the first request
+        or sharing it with an equal mapping (recognized by its fingerprint) which has already built it.
+        ----
+        Returns: the list of the fibres in the same order of the codomain
+        """
+        if self.__fibres is None:
+            key = self.fingerprint()
+            other = NSmapping.__fibreindex.get(key)
+            if other is not None and other.__fibres is not None and other == self:
+                self.__fibres = other.__fibres   # le fibre condivise vengono copiate alla prima modifica
+                self.__sharedfibres = other.__sharedfibres = True
+            else:
+                self.__fibres = self.__buildFibres()
+                NSmapping.__fibreindex[key] = self
+        return self.__fibres
 
 
     # ------------------------------------------------------------------------------------
@@ -139,7 +225,7 @@ class NSmapping:
         ----
         Returns: the universe set corresponding to the domain of the current mapping
         """
-        return NSuniverse(self.__domain.get())
+        return self.__domain
 
 
     # restituisce il codominio della funzione
@@ -148,7 +234,7 @@ class NSmapping:
         ----
         Returns: the universe set corresponding to the codomain of the current mapping
         """
-        return NSuniverse(self.__codomain.get())
+        return self.__codomain
 
 
     # restituisce le coppie elemento-valorej come dizionario
@@ -157,7 +243,9 @@ class NSmapping:
         ----
         Returns: the dictionary containing the element-value pairs of the mapping
         """
-        return self.__map
+        codomain = self.__codomain
+        map = {u: codomain[k] for u, k in zip(self.__domain, self.__positions)}
+        return map
 
 
     # ------------------------------------------------------------------------------------
@@ -173,11 +261,26 @@ class NSmapping:
         """
         u = str(u)
         v = str(v)  # converte in stringa per confrontarla con gli elementi dell'universo che è lista di stringhe
-        if u not in self.__domain.get():
+        if not self.__domain.contains(u):
             raise IndexError("non-existent element in the domain of the mapping")
-        if v not in self.__codomain.get():
+        if not self.__codomain.contains(v):
             raise IndexError("non-existent element in the codomain of the mapping")
-        self.__map[u] = v
+        i = self.__domain.indexOf(u)
+        k = self.__codomain.indexOf(v)
+        old = int(self.__positions[i])
+        if old != k:   # aggiorna in modo incrementale l'indice inverso spostando u dalla vecchia alla nuova fibra
+            if self.__fibres is not None:
+                if self.__sharedfibres:
+                    self.__fibres = [list(fibre) for fibre in self.__fibres]
+                    self.__sharedfibres = False
+                fibre = self.__fibres[old]
+                del fibre[bisect_left(fibre, i)]
+                insort(self.__fibres[k], i)
+            if self.__fingerprint is not None:   # aggiorna l'impronta in tempo costante
+                weight = int(NSpositionWeights(self.__domain.cardinality())[i])
+                change = NSmapping.__valueHash(k) - NSmapping.__valueHash(old)
+                self.__fingerprint = (self.__fingerprint + weight * change) & NS_MASK64
+            self.__positions[i] = k
 
 
     # ------------------------------------------------------------------------------------
@@ -193,9 +296,9 @@ class NSmapping:
         Returns: the value of u by the current mapping
         """
         u = str(u)  # converte in stringa per confrontarla con gli elementi dell'universo che è lista di stringhe
-        if u not in self.__domain.get():
+        if not self.__domain.contains(u):
             raise IndexError("non-existent element in the domain of the mapping")
-        return self.__map[u]
+        return self.__codomain[self.__positions[self.__domain.indexOf(u)]]
 
 
     # ------------------------------------------------------------------------------------
@@ -212,18 +315,30 @@ class NSmapping:
         Returns: the fibre of v expressed as list of elements of the domain
         """
         v = str(v)  # converte in stringa per confrontarla con gli elementi dell'universo che è lista di stringhe
-        if v not in self.__codomain.get():
+        if not self.__codomain.contains(v):
             raise IndexError("non-existent element in the codomain of the mapping")
-        fibre = list()
-        for e in self.__map:
-            if self.__map[e] == v:
-                fibre.append(e)
+        domain = self.__domain
+        fibre = [domain[i] for i in self.__fibreIndex()[self.__codomain.indexOf(v)]]
         return fibre
 
 
+    # ottiene tutte le fibre della funzione
+    def getFibres(self):
+        """
+        Get the fibres by the neutrosophic mapping of all the elements of the codomain.
+        ----
+        Returns: the dictionary having as keys the elements of the codomain and as values
+        their fibres expressed as lists of elements of the domain
+        """
+        domain = self.__domain
+        fibres = {v: [domain[i] for i in fibre] for v, fibre in zip(self.__codomain, self.__fibreIndex())}
+        return fibres
+
+
     # ------------------------------------------------------------------------------------
 
     # restituisce l'immagine di un insieme neutrosofico mediante una funzione
+    @NScache.cached("NSimage")
     def NSimage(self, nset):
         """
         Method that returns the neutrosophic image of a neutrosophic set by a mapping.
@@ -233,25 +348,73 @@ class NSmapping:
         ----
         Returns: neutrosophic image of nset by the current mapping
         """
-        result = NSset(self.__codomain)
-        for v in self.getCodomain():
-            fibre = self.getFibre(v)
-            if fibre == []:
-                triple = [1,1,0]
-            else:
-                mu_values = list()
-                sigma_values = list()
-                omega_values = list()
-                for u in fibre:
-                    mu_values.append(nset.getMembership(u))
-                    sigma_values.append(nset.getIndeterminacy(u))
-                    omega_values.append(nset.getNonMembership(u))
-                triple = [max(mu_values), max(sigma_values), min(omega_values)]  # i.e. (mu, sigma, omega)
-            result.setElement(v, triple)
+        degrees = self.__degreesOn(nset, self.__domain)
+        image = NSmapping.__imageDegrees(degrees, self.__positions, self.__codomain.cardinality())
+        result = NSset(self.__codomain, image)
         return result
 
 
+    # metodo privato che calcola i gradi dell'immagine con una riduzione raggruppata sulle posizioni dei valori
+    @staticmethod
+    def __imageDegrees(degrees, positions, m):
+        """ private method that returns the degrees of the neutrosophic image computed in a single pass
+        by a grouped reduction of the degrees of the domain keyed by the positions of their values.
+        ----
+        Parameters:
+        - degrees: list of triples or (n,3) numpy array of the degrees in the order of the domain
+        - positions: positions in the codomain of the values of the elements of the domain
+        - m: cardinality of the codomain
+        ----
+        Returns: the list of triples or the (m,3) numpy array of the degrees of the image
+        """
+        if np is not None and isinstance(degrees, np.ndarray):
+            # riduzione raggruppata vettoriale: ogni grado viene accumulato nella posizione del proprio valore
+            positions = np.asarray(positions, dtype=np.intp)
+            image = np.empty((m, 3), dtype=degrees.dtype)
+            image[:, :2] = 0     # elementi neutri del massimo
+            image[:, 2] = 1      # elemento neutro del minimo
+            np.maximum.at(image[:, 0], positions, degrees[:, 0])
+            np.maximum.at(image[:, 1], positions, degrees[:, 1])
+            np.minimum.at(image[:, 2], positions, degrees[:, 2])
+            image[np.bincount(positions, minlength=m) == 0] = [1,1,0]   # elementi con fibra vuota
+        else:
+            # unica scansione del dominio accumulando i gradi nella posizione del proprio valore
+            image = [None] * m
+            for (mu, sigma, omega), k in zip(degrees, positions):
+                triple = image[k]
+                if triple is None:
+                    image[k] = [mu, sigma, omega]
+                else:
+                    if mu > triple[0]:
+                        triple[0] = mu
+                    if sigma > triple[1]:
+                        triple[1] = sigma
+                    if omega < triple[2]:
+                        triple[2] = omega
+            image = [[1,1,0] if triple is None else triple for triple in image]   # elementi con fibra vuota
+        return image
+
+
+    # metodo privato che restituisce i gradi di un insieme neutrosofico nell'ordine del dominio o del codominio
+    def __degreesOn(self, nset, universe):
+        """ private method that returns the degrees of a neutrosophic set defined on the domain
+        (or on the codomain) in the same order of the elements of such universe.
+        ----
+        Parameters:
+        - nset: neutrosophic set on the domain or on the codomain
+        - universe: the domain or the codomain of the current mapping
+        ----
+        Returns: the list of triples or the (n,3) numpy array of the degrees of nset
+        """
+        if nset.getUniverseSet() == universe:   # confronto in tempo costante tra universi condivisi
+            degrees = nset.getDegrees()    # i gradi sono già nell'ordine dell'universo
+        else:
+            degrees = [nset.getElement(u) for u in universe]
+        return degrees
+
+
     # restituisce la controimmagine di un insieme neutrosofico mediante una funzione
+    @NScache.cached("NScounterimage")
     def NScounterimage(self, nset):
         """
         Method that returns the neutrosophic counterimage of a neutrosophic set by a mapping.
@@ -261,18 +424,183 @@ class NSmapping:
         ----
         Returns: neutrosophic counterimage of nset by the current mapping
         """
-        result = NSset(self.__domain)
-        for u in self.getDomain():
-            value = self.getValue(u)
-            triple = nset.getElement(value)   # i.e. (mu, sigma, omega)
-            result.setElement(u, triple)
+        degrees = self.__degreesOn(nset, self.__codomain)
+        if np is not None and isinstance(degrees, np.ndarray):
+            # un'unica raccolta vettoriale dei gradi dei valori di tutti gli elementi del dominio
+            counterimage = degrees[np.asarray(self.__positions, dtype=np.intp)]
+        else:
+            counterimage = [list(degrees[k]) for k in self.__positions]   # i.e. (mu, sigma, omega)
+        result = NSset(self.__domain, counterimage)
         return result
 
 
     # ------------------------------------------------------------------------------------
 
+    # metodo privato che restituisce le posizioni dei valori di una seconda funzione
+    # nell'ordine del codominio della funzione corrente
+    def __positionsAfter(self, g):
+        """ private method that returns the positions of the values by a second mapping g of the
+        elements of the codomain of the current mapping, in the same order of such codomain.
+        ----
+        Parameters:
+        - g: second mapping whose domain contains the codomain of the current mapping
+        ----
+        Returns: the list of integers or the integer numpy array of the positions in the codomain of g
+        """
+        if not self.__codomain.isSubset(g.__domain):
+            raise ValueError("the codomain of the first mapping must be contained in the domain of the second one")
+        positions = g.__positions
+        if self.__codomain != g.__domain:   # riordina le posizioni secondo il codominio corrente
+            positions = [positions[g.__domain.indexOf(v)] for v in self.__codomain]
+        if np is not None and isinstance(self.__positions, np.ndarray):
+            positions = np.asarray(positions, dtype=np.intp)
+        elif np is not None and isinstance(positions, np.ndarray):
+            positions = positions.tolist()
+        return positions
+
+
+    # composizione di funzioni
+    def compose(self, g):
+        """
+        Method that returns the composition of the current mapping f with a second mapping g,
+        i.e. the mapping g∘f which applies first f and then g, obtained by composing their
+        arrays of positions without passing through the values.
+        ----
+        Parameters:
+        - g: second mapping whose domain contains the codomain of the current mapping
+        ----
+        Returns: the composite mapping g∘f from the domain of f to the codomain of g
+        """
+        after = self.__positionsAfter(g)
+        if np is not None and isinstance(after, np.ndarray):
+            positions = after[self.__positions]
+        else:
+            positions = [after[k] for k in self.__positions]
+        h = NSmapping.__fromPositions(self.__domain, g.__codomain, positions)
+        return h
+
+
+    # operatore composizione (@) con overloading sul metodo __matmul__
+    def __matmul__(self, f):
+        """ composition g @ f = g∘f (first f and then g)
+        """
+        return f.compose(self)
+
+
+    # immagine o controimmagine di un insieme neutrosofico mediante una catena di funzioni
+    @staticmethod
+    def chain(mappings, nset, counterimage=False):
+        """
+        Method that applies successively the neutrosophic image (or counterimage) by a chain of mappings
+        f1, f2, ..., fn (where the codomain of each mapping is contained in the domain of the following one)
+        composing their arrays of positions and materializing only the final neutrosophic set.
+        Elements of the domain of a mapping which do not belong to the codomain of the previous one are ignored.
+        ----
+        Parameters:
+        - mappings: list of mappings in the order of application
+        - nset: neutrosophic set on the domain of f1 (or on the codomain of fn for the counterimage)
+        - counterimage: boolean value:
+          * if it is false the method returns the image fn(...f2(f1(nset)))
+          * if it is true the method returns the counterimage f1^-1(f2^-1(...fn^-1(nset)))
+        ----
+        Returns: the neutrosophic image or counterimage of nset by the chain of mappings
+        """
+        mappings = list(mappings)
+        if mappings == []:
+            raise ValueError("the chain must contain at least a mapping")
+        first = mappings[0]
+        last = mappings[-1]
+        array = np is not None and isinstance(first.__positions, np.ndarray)
+        # compone le posizioni: positions associa ad ogni elemento del primo dominio la posizione
+        # del suo valore nel codominio dell'ultima funzione considerata
+        positions = first.__positions
+        if array:
+            saturated = np.bincount(positions, minlength=first.__codomain.cardinality()) == 0
+        else:
+            saturated = [fibre == [] for fibre in first.__fibreIndex()]
+        for f, g in zip(mappings, mappings[1:]):
+            after = f.__positionsAfter(g)
+            if array:
+                positions = after[positions]
+            else:
+                positions = [after[k] for k in positions]
+            if not counterimage:
+                # nelle immagini successive un elemento di fibra vuota assume il grado [1,1,0] che, essendo
+                # il massimo, satura i valori su cui viene trasportato dalle funzioni seguenti
+                m = g.__codomain.cardinality()
+                if array:
+                    saturated_next = np.bincount(after, minlength=m) == 0
+                    saturated_next[after[saturated]] = True
+                else:
+                    saturated_next = [True] * m
+                    for k, w in enumerate(after):
+                        saturated_next[w] = False
+                    for k, w in enumerate(after):
+                        if saturated[k]:
+                            saturated_next[w] = True
+                saturated = saturated_next
+        #----
+        if counterimage:
+            degrees = last.__degreesOn(nset, last.__codomain)
+            if np is not None and isinstance(degrees, np.ndarray):
+                result_degrees = degrees[np.asarray(positions, dtype=np.intp)]
+            else:
+                result_degrees = [list(degrees[k]) for k in positions]
+            result = NSset(first.__domain, result_degrees)
+        else:
+            degrees = first.__degreesOn(nset, first.__domain)
+            result_degrees = NSmapping.__imageDegrees(degrees, positions, last.__codomain.cardinality())
+            if np is not None and isinstance(result_degrees, np.ndarray):
+                result_degrees[np.asarray(saturated, dtype=bool)] = [1,1,0]
+            else:
+                for w in range(len(result_degrees)):
+                    if saturated[w]:
+                        result_degrees[w] = [1,1,0]
+            result = NSset(last.__codomain, result_degrees)
+        return result
+
+    # ------------------------------------------------------------------------------------
+
+    # salva la funzione in un file binario
+    def save(self, path):
+        """
+        Saves the current mapping in a binary file containing the elements of its domain and
+        codomain and the array of the positions in the codomain of the values of the elements of the domain.
+        ----
+        Parameters:
+        - path: name of the file
+        """
+        typecode = "i" if self.__codomain.cardinality() < 2**31 else "q"   # posizioni a 32 bit quando possibile
+        if np is not None and isinstance(self.__positions, np.ndarray):
+            positions = np.ascontiguousarray(self.__positions, dtype=typecode)
+        else:
+            positions = array(typecode, self.__positions)
+        NSwriteBinary(path, NSmapping.__magic, [self.__domain.get(), self.__codomain.get(), (typecode, positions)])
+
+
+    # carica una funzione da un file binario
+    @staticmethod
+    def load(path, mmap=True):
+        """
+        Generic constructor of a mapping saved in a binary file by the method save.
+        If numpy is installed the array of the positions is memory-mapped in copy-on-write mode.
+        ----
+        Parameters:
+        - path: name of the file
+        - mmap: True (default) to map the positions in memory, False to read them
+        ----
+        Returns: the mapping saved in the file
+        """
+        domain, codomain, positions = NSreadBinary(path, NSmapping.__magic, mmap)
+        domain = NSuniverse(domain)
+        codomain = NSuniverse(codomain)
+        if np is None or not isinstance(positions, np.ndarray):
+            positions = list(positions)
+        if len(positions) != domain.cardinality() or (len(positions) > 0 and not 0 <= min(positions) <= max(positions) < codomain.cardinality()):
+            raise ValueError("the file does not contain a valid mapping")
+        return NSmapping.__fromPositions(domain, codomain, positions)
+
 
-    # confronta due funzioni col metodo speciale __eq__
     # sovraccaricando l'operatore di uguaglianza == e restituisce True se sono uguali
     def __eq__(self, g):
         """ Checks if the current mapping is equal to another one.
@@ -282,15 +610,66 @@ class NSmapping:
         ----
         Returns: True if the current mapping coincides with the second one
         """
-        if self.getDomain() != g.getDomain() or self.getCodomain() != g.getCodomain():
+        if self.__domain != g.__domain or self.__codomain != g.__codomain:
             return False
+        elif self.__fingerprint is not None and g.__fingerprint is not None and self.__fingerprint != g.__fingerprint:
+            return False   # impronte diverse (già calcolate) implicano funzioni diverse
+        # i valori coincidono se coincidono le loro posizioni, confrontate senza copiarle
+        A, B = self.__positions, g.__positions
+        if np is not None and (isinstance(A, np.ndarray) or isinstance(B, np.ndarray)):
+            equal = bool(np.array_equal(A, B))
+        elif type(A) == type(B):   # liste oppure array di interi
+            equal = A == B
         else:
-            equal = True
-            for e in self.getDomain():
-                if self.getValue(e) != g.getValue(e):
-                    equal = False
-                    break
-            return equal
+            equal = len(A) == len(B) and all(a == b for a, b in zip(A, B))
+        return equal
+
+
+    # restituisce l'impronta a 64 bit del contenuto della funzione
+    def fingerprint(self):
+        """
+        Method that returns a 64-bit fingerprint of the domain, the codomain and the values of the mapping:
+        equal mappings have the same fingerprint, which is the same in every process.
+        It is computed at the first request and then updated in constant time by the method setValue.
+        ----
+        Returns: the fingerprint as an integer in [0, 2^64)
+        """
+        if self.__fingerprint is None:
+            positions = self.__positions
+            if np is not None:
+                hashes = np.asarray(positions).astype(np.uint64)
+                hashes += np.uint64(NS_VALUEKEY)
+                self.__fingerprint = NSweightedSum(NSmix64(hashes))
+            else:
+                cache = dict()   # i valori si ripetono: ogni posizione distinta viene codificata una sola volta
+                for k in positions:
+                    if k not in cache:
+                        cache[k] = NSmapping.__valueHash(k)
+                self.__fingerprint = NSweightedSum([cache[k] for k in positions])
+        return self.__fingerprint ^ self.__domain.fingerprint() ^ NSmix64(self.__codomain.fingerprint())
+
+
+    # metodo privato che restituisce l'hash a 64 bit della posizione di un valore nel codominio
+    @staticmethod
+    def __valueHash(k):
+        """ private method that returns the 64-bit hash of the position of a value in the codomain.
+        ----
+        Parameters:
+        - k: position in the codomain
+        ----
+        Returns: the hash as an integer in [0, 2^64)
+        """
+        return NSmix64((int(k) + NS_VALUEKEY) & NS_MASK64)
+
+
+    # restituisce l'hash della funzione col metodo speciale __hash__
+    def __hash__(self):
+        """ Method that returns the hash of the mapping, derived from its fingerprint, so that
+        it can be used as a key of dictionaries or as an element of sets (it must not be modified meanwhile).
+        ----
+        Returns: the hash of the current mapping
+        """
+        return hash(self.fingerprint())
 
 
     # confronta due funzioni col metodo speciale __ne__
@@ -315,12 +694,57 @@ class NSmapping:
         ----
         Returns: string containing a map of the current mapping
         """
+        s = "\n".join(self.iterLines())   # le righe sono prodotte in tempo lineare
+        return s
+
+
+    # restituisce una per volta le righe della rappresentazione testuale della funzione
+    def iterLines(self, limit=None):
+        """ Method that generates one at a time the lines of the textual representation of the mapping,
+        in linear time and without building the whole text.
+        ----
+        Parameters:
+        - limit: maximum number of elements of the domain (and of the codomain) to show,
+                 the first and the last ones, or None (default) to show all of them
+        ----
+        Returns: an iterator of the lines (without line terminators) whose join by newlines gives str(self)
+        """
         unvwidth = 28               # larghezza in colonne del dominio e del codominio
         totwidth = unvwidth*2 + 8   # calcolo della larghezza totale
-        s = f"\n {self.getDomain():>{unvwidth}}   ->   {self.getCodomain():<{unvwidth}}\n" + "-" * totwidth + "\n"
-        for e in self.__domain:     # per consentire la stampa degli elementi nell'ordine definito nel dominio
-            s += f" {e:>{unvwidth}}  |->  {self.__map[e]:<{unvwidth}}\n"
-        return s
+        domain, codomain = self.__domain, self.__codomain
+        n = domain.cardinality()
+        if limit is not None:
+            domainstr, codomainstr = domain.preview(limit), codomain.preview(limit)
+        else:
+            domainstr, codomainstr = str(domain), str(codomain)
+        yield ""
+        yield f" {domainstr:>{unvwidth}}   ->   {codomainstr:<{unvwidth}}"
+        yield "-" * totwidth
+        if limit is not None and n > limit:   # anteprima troncata: primi ed ultimi elementi
+            head = (limit + 1) // 2
+            parts = [(0, head), (n - (limit - head), n)]
+        else:
+            parts = [(0, n)]
+        for i, (start, stop) in enumerate(parts):
+            if i > 0:
+                yield f" {'...':>{unvwidth}}  |->  ...({n - limit} more)..."
+            # gli elementi vengono stampati nell'ordine definito nel dominio
+            for e, k in zip(domain[start:stop], self.__positions[start:stop]):
+                yield f" {e:>{unvwidth}}  |->  {codomain[k]:<{unvwidth}}"
+        yield ""
+
+
+    # scrive la rappresentazione testuale della funzione su un flusso
+    def write(self, stream, limit=None):
+        """ Method that writes the textual representation of the mapping to a file-like object
+        one line at a time (as print does, the text is followed by a newline).
+        ----
+        Parameters:
+        - stream: text file object
+        - limit: maximum number of elements to show or None (default) to show all of them
+        """
+        for line in self.iterLines(limit):
+            stream.write(line + "\n")
 
 
     # restituisce la rappresentazione funzione neutrosofica come stringa col metodo speciale __repr__
@@ -329,6 +753,8 @@ class NSmapping:
         """ Method that returns the mapping for other implementations
         (e.g., for use in other classes).
         ----
-        Returns: a detailed representation of the current mapping
+        Returns: a detailed representation of the current mapping, showing
+        at most reprelements elements (the first and the last ones)
         """
-        return f"Neutrosophic mapping: {str(self)}"
+        preview = "\n".join(self.iterLines(self.reprelements))
+        return f"Neutrosophic mapping: {preview}"
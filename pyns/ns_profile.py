@@ -0,0 +1,258 @@
+from functools import wraps
+from threading import Lock, local
+from time import perf_counter
+import json
+#----
+from . import ns_util, ns_universe, ns_set, ns_mapping
+from .ns_universe import NSuniverse
+from .ns_set import NSset
+from .ns_mapping import NSmapping
+from .ns_topology import NStopology
+from .ns_expression import NSexpression
+
+class NSprofile:
+    """
+    Package Python Neutrosophic Sets (PYNS)
+    ns_profile.py
+    Class that records, while it is active as a context manager, the number of calls, the number of
+    elements processed and the cumulative wall time of the operations on universes, neutrosophic sets
+    and mappings and of the parsing functions.
+    Profiling is process-wide: while a profile is active the methods and functions are replaced for all
+    the threads, and every active profile records the operations called by any thread
+    ----------------------------------------------------------------------------------
+    author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+    www.nordo.it   |  giorgio.nordo@unime.it
+    """
+
+    #------------------ variabili di classe
+    # i metodi vengono sostituiti da versioni strumentate solo finché almeno un profilo è attivo,
+    # in modo che a profilo disattivato non ci sia alcun costo aggiuntivo
+    __active = list()     # profili attualmente attivi
+    __users = 0           # numero di blocchi with aperti: i metodi restano sostituiti finché è positivo
+    __originals = list()  # (oggetto, nome, valore originale) degli attributi sostituiti
+    __lock = Lock()
+    __measuring = local()   # indica, per ogni thread, se si sta calcolando il numero di elementi di un oggetto
+    classes = [NSuniverse, NSset, NSmapping, NStopology, NSexpression]
+    specialmethods = ["__new__", "__init__", "__eq__", "__str__"]   # metodi speciali misurati oltre a quelli pubblici
+    accessors = ["cardinality", "contains", "indexOf", "getDomain", "getCodomain", "getUniverseSet", "isSparse"]   # metodi in tempo costante non misurati
+    modules = [ns_util, ns_universe, ns_set, ns_mapping]           # moduli che utilizzano le funzioni di ns_util
+    functions = ["NSstringToTriplesList", "NSstringToList", "NSstringToDict", "NSsplitText",
+                 "NSwriteBinary", "NSreadBinary"]
+
+    # costruttore
+    def __init__(self):
+        """
+        Constructor of an empty profile, which starts recording when it is entered as a context manager.
+        """
+        self.__stats = dict()   # operazione -> [chiamate, elementi, tempo]
+
+
+    # attiva il profilo all'ingresso del blocco with
+    def __enter__(self):
+        with NSprofile.__lock:
+            if NSprofile.__users == 0:
+                try:
+                    NSprofile.__install()
+                except BaseException:   # ripristina gli attributi già sostituiti prima dell'errore
+                    NSprofile.__uninstall()
+                    raise
+            NSprofile.__users += 1
+            NSprofile.__active.append(self)
+        return self
+
+
+    # disattiva il profilo all'uscita del blocco with
+    def __exit__(self, *exc):
+        with NSprofile.__lock:
+            if self not in NSprofile.__active:
+                raise RuntimeError("the profile is not active")
+            try:
+                NSprofile.__active.remove(self)
+            finally:   # l'ultimo blocco ripristina comunque i metodi originali
+                NSprofile.__users -= 1
+                if NSprofile.__users == 0:
+                    NSprofile.__uninstall()
+        return False
+
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che sostituisce metodi e funzioni con le loro versioni strumentate
+    @staticmethod
+    def __install():
+        """ private method that replaces the public methods of the classes and the parsing functions
+        with wrappers recording their calls into the active profiles (it must be called holding the lock).
+        """
+        for cls in NSprofile.classes:
+            for name, value in list(vars(cls).items()):
+                if (name.startswith("_") and name not in NSprofile.specialmethods) or name in NSprofile.accessors:
+                    continue
+                if isinstance(value, staticmethod):
+                    wrapper = staticmethod(NSprofile.__wrap(value.__func__, f"{cls.__name__}.{name}", False))
+                elif callable(value):
+                    wrapper = NSprofile.__wrap(value, f"{cls.__name__}.{name}", name != "__new__")
+                else:
+                    continue
+                NSprofile.__originals.append((cls, name, value))
+                setattr(cls, name, wrapper)
+        for name in NSprofile.functions:
+            f = getattr(ns_util, name)
+            wrapper = NSprofile.__wrap(f, name, False)
+            for module in NSprofile.modules:   # le funzioni importate per nome vanno sostituite in ogni modulo
+                if getattr(module, name, None) is f:
+                    NSprofile.__originals.append((module, name, f))
+                    setattr(module, name, wrapper)
+
+
+    # metodo privato che ripristina metodi e funzioni originali
+    @staticmethod
+    def __uninstall():
+        """ private method that restores the original methods and functions
+        (it must be called holding the lock).
+        """
+        while NSprofile.__originals:
+            obj, name, value = NSprofile.__originals.pop()
+            setattr(obj, name, value)
+
+
+    # metodo privato che crea la versione strumentata di una funzione
+    @staticmethod
+    def __wrap(f, operation, method):
+        """ private method that returns a wrapper of a function which records its calls,
+        the number of elements processed and its wall time into all the active profiles.
+        ----
+        Parameters:
+        - f: function to wrap
+        - operation: name of the operation
+        - method: True if the elements are counted on the object the method is called on,
+                  False if they are counted on the returned value
+        ----
+        Returns: the wrapper of f
+        """
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            if getattr(NSprofile.__measuring, "value", False):   # chiamata interna al conteggio degli elementi
+                return f(*args, **kwargs)
+            start = perf_counter()
+            result = None
+            try:
+                result = f(*args, **kwargs)
+                return result
+            finally:
+                elapsed = perf_counter() - start
+                elements = NSprofile.__size(args[0] if method and args else result)
+                for profile in list(NSprofile.__active):
+                    profile.__record(operation, elements, elapsed)
+        return wrapper
+
+
+    # metodo privato che restituisce il numero di elementi di un oggetto
+    @staticmethod
+    def __size(obj):
+        """ private method that returns the number of elements processed by an operation.
+        ----
+        Parameters:
+        - obj: universe set, neutrosophic set, mapping or sized result
+        ----
+        Returns: the cardinality of obj (of the domain for a mapping) or 0 if it cannot be determined
+        """
+        NSprofile.__measuring.value = True
+        try:
+            if isinstance(obj, (NSuniverse, NSset)):
+                return obj.cardinality()
+            elif isinstance(obj, NSmapping):
+                return obj.getDomain().cardinality()
+            elif isinstance(obj, (list, tuple, dict)):
+                return len(obj)
+        except AttributeError:   # oggetto non inizializzato (costruttore interrotto da una eccezione)
+            pass
+        finally:
+            NSprofile.__measuring.value = False
+        return 0
+
+
+    # metodo privato che registra una chiamata
+    def __record(self, operation, elements, elapsed):
+        """ private method that records a call of an operation.
+        ----
+        Parameters:
+        - operation: name of the operation
+        - elements: number of elements processed
+        - elapsed: wall time of the call in seconds
+        """
+        with NSprofile.__lock:
+            stats = self.__stats.setdefault(operation, [0, 0, 0.0])
+            stats[0] += 1
+            stats[1] += elements
+            stats[2] += elapsed
+
+
+    #------------------------------------------------------------------------------------
+
+    # restituisce il riepilogo delle operazioni registrate
+    def summary(self):
+        """
+        Method that returns the summary of the recorded operations.
+        Nested operations (e.g. a constructor called by a union) are recorded too,
+        so that times are cumulative.
+        ----
+        Returns: the dictionary having as keys the names of the operations and as values dictionaries
+        with the number of calls, the number of elements processed and the cumulative time in seconds
+        """
+        with NSprofile.__lock:
+            return {operation: {"calls": calls, "elements": elements, "time": time}
+                    for operation, (calls, elements, time) in sorted(self.__stats.items())}
+
+
+    # restituisce il riepilogo in formato JSON
+    def toJSON(self, path=None):
+        """
+        Method that returns the summary of the recorded operations in JSON format.
+        ----
+        Parameters:
+        - path: optional name of a file where the summary is saved
+        ----
+        Returns: the JSON string of the summary
+        """
+        text = json.dumps(self.summary(), indent=2)
+        if path is not None:
+            with open(path, "w") as file:
+                file.write(text + "\n")
+        return text
+
+
+    # azzera le statistiche registrate
+    def reset(self):
+        """
+        Method that clears the recorded operations.
+        """
+        with NSprofile.__lock:
+            self.__stats.clear()
+
+
+    # restituisce il riepilogo come tabella col metodo speciale __str__
+    def __str__(self):
+        """ Method that returns the summary of the recorded operations as a table sorted by cumulative time.
+        ----
+        Returns: string containing the table
+        """
+        rows = sorted(self.summary().items(), key=lambda item: -item[1]["time"])
+        s = f"{'operation':<36} {'calls':>10} {'elements':>12} {'time (s)':>12}\n" + "-" * 73 + "\n"
+        for operation, stats in rows:
+            s += f"{operation:<36} {stats['calls']:>10} {stats['elements']:>12} {stats['time']:>12.6f}\n"
+        return s
+
+
+# crea un profilo da utilizzare come gestore di contesto
+def profile():
+    """
+    Returns a new profile recording, inside a with block, the calls of the operations on universes,
+    neutrosophic sets and mappings and of the parsing functions made by all the threads of the process:
+
+        with pyns.profile() as p:
+            ...
+        print(p.summary())
+    ----
+    Returns: the new NSprofile object
+    """
+    return NSprofile()
@@ -1,6 +1,20 @@
 from .ns_universe import NSuniverse
+from .ns_cache import NScache
 #----
-from .ns_util import NSreplace, NSstringToTriplesList, NSsplitText
+from .ns_util import NSstringToList, NSstringToTriplesList, NSisNumber, NSwrapWords, NSisVectorizable, NSwriteBinary, NSreadBinary, NSrelationMatrix
+from .ns_util import NS_MASK64, NStripleHash, NStripleHashes, NSpositionWeights, NSweightSum, NSweightedSum
+#----
+import csv
+import math
+import os
+import sys
+from array import array
+from itertools import chain, islice
+#----
+try:
+    import numpy as np
+except ImportError:   # numpy è una dipendenza opzionale richiesta solo dal motore colonnare
+    np = None
 
 class NSset:
     """
@@ -15,6 +29,15 @@ class NSset:
     #------------------ variabili di classe
     degreename = ["membership", "indeterminacy", "non-membership"]   # nomi dei gradi
     reprmaxlength = 64   # massima lunghezza in caratteri della stampa semplificata di un NS-set
+    reprelements = 20    # massimo numero di elementi mostrati (i primi e gli ultimi) dalla rappresentazione __repr__
+    backend = "python"   # motore di memorizzazione dei gradi: "python" (liste) oppure "numpy" (array colonnare)
+    dtype = "float64"    # tipo dei gradi per il motore numpy ("float64" oppure "float32")
+    relationelements = 1 << 22   # massimo numero di triple confrontate alla volta dalle matrici di relazione
+    lazy = False         # se True gli operatori +, &, ~, - costruiscono espressioni valutate su richiesta (NSexpression)
+    __fingerprint = None     # somma pesata degli hash delle triple (None finché non viene richiesta)
+    __magic = b"PYNSSET\0"   # identificativo dei file binari di insiemi neutrosofici
+    __firstblock = 256      # dimensione del primo e dell'ultimo blocco di elementi esaminati dai predicati
+    __lastblock = 65536     # (isNSsubset, isNSdisjoint, ==) che si fermano al primo controesempio
 
     # costruttore
     def __init__(self, *args):
@@ -28,32 +51,35 @@ class NSset:
                 or a pair constituted by an element attributable to a universe set
                 and a list of tuples of real values representing the membership degrees of the various elements
         """
-        neutrosophicset = dict()    # dizionario di liste che contiene i valori dell'insieme neutrosofico
+        # i gradi sono memorizzati nell'ordine dell'universo: come lista di triple [mu, sigma, omega]
+        # per il motore "python" o come array (n,3) contiguo per il motore "numpy"; un insieme sparso memorizza
+        # invece in un dizionario posizione -> tripla solo gli elementi che differiscono dalla tripla di default
+        default = None
         #--------------------
         length = len(args)
         if length == 1:
             element = args[0]
             if type(element) in [list, tuple, str, NSuniverse]:   # viene passato un oggetto riconducibile a universo e generato un insieme neutrosofico vuoto
                 universe = NSuniverse(element)   # altri tipi vengono convertiti in oggetto universo
-                for e in universe.get():
-                    neutrosophicset[e] = [0,0,1]  # lista di tre elementi corrispondenti a appartenenza, indeterminatezza, non appartenenza
+                # tripla corrispondente a appartenenza, indeterminatezza, non appartenenza
+                degrees = NSset.__newDegrees(universe.cardinality(), [0,0,1], NSset.__useArray())
             elif type(element) == NSset:
-                universe = element.getUniverse() # viene copiato un oggetto insieme neutrosofico
-                for e in universe:
-                    neutrosophicset[e] = element.getElement(e)
+                universe = element.__universe   # viene copiato un oggetto insieme neutrosofico (l'universo è condiviso)
+                degrees = element.__copyDegrees()
+                default = element.__default
             else:
                 raise ValueError("obj not compatible with the type universe set")
         elif length == 2:
             # ricava i due parametri (insieme universo e lista dei valori)
             nset = NSset(args[0])  # utilizza lo stesso costruttore
-            universe = nset.getUniverse()  # preleva l'insieme universo come lista
+            universe = nset.__universe  # preleva l'insieme universo
             values = args[1]   # preleva la lista dei valori
             # ---- tratta il caso in cui il secondo parametro è una lista o una tupla
             if type(values) in [list ,tuple]:
                 if len(values) != len(universe):
                     raise IndexError("the number of obj triples does not correspond with the number of elements")
+                degrees = list()
                 for i in range(len(universe)):
-                    elem = universe[i]
                     t = values[i]  # prende la tripla della lista corrispondente all'elemento secondo lo stesso ordine
                     if type(t) not in [tuple,list] or len(t) !=3:
                         raise IndexError("the second parameter of the constructor method must contain only triple")
@@ -61,19 +87,217 @@ class NSset:
                     for j in range(3):   # controlla che i valori della tripla siano compatibili
                         if not 0 <= t[j] <= 1:
                             raise ValueError(f"incompatible {self.degreename[j]} degree obj")
-                    neutrosophicset[elem] = t
+                    degrees.append(t)
+                if NSset.__useArray():
+                    degrees = np.array(degrees, dtype=NSset.dtype)
             # ---- tratta il caso in cui il secondo parametro è una stringa
             elif type(values) == str:   # preleva le triple (liste o tuple) dalla stringa fornita come secondo parametro
                 tpl_list = NSstringToTriplesList(values)
                 nset = NSset(universe, tpl_list)  # utilizza lo stesso costruttore
-                neutrosophicset = nset.get()
+                degrees = nset.__degrees
+            # ---- tratta il caso in cui il secondo parametro è un array numpy (n,3) che viene adottato senza copia
+            elif np is not None and isinstance(values, np.ndarray):
+                degrees = NSset.fromMatrix(universe, values).__degrees
             else:
                 raise ValueError("the second parameter of the constructor method must contain a list of triples of real numbers")
         else:
             raise IndexError("the number of parameters do not match those of the constructor method")
-        # memorizza i valori ottenuti nelle proprietà dell'oggetto
+        # memorizza i valori ottenuti nelle proprietà dell'oggetto (l'universo, immutabile, è condiviso)
         self.__universe = NSuniverse(universe)
-        self.__neutrosophicset = neutrosophicset
+        self.__degrees = degrees
+        self.__default = default
+        if length == 1 and type(args[0]) == NSset:
+            self.__fingerprint = args[0].__fingerprint
+
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che stabilisce, in base alla variabile di classe backend,
+    # se un nuovo insieme neutrosofico deve essere memorizzato in un array numpy
+    @staticmethod
+    def __useArray():
+        """ private method that returns True if the degrees of a new neutrosophic set
+        must be stored in a columnar numpy array according to the class variable backend.
+        ----
+        Returns: True for the "numpy" backend and False for the "python" one
+        """
+        if NSset.backend == "numpy":
+            if np is None:
+                raise ImportError("the numpy backend of neutrosophic sets requires the numpy package")
+            return True
+        elif NSset.backend == "python":
+            return False
+        else:
+            raise ValueError("the backend of neutrosophic sets must be 'python' or 'numpy'")
+
+
+    # metodo privato che crea la struttura dei gradi di n elementi tutti uguali ad una tripla
+    @staticmethod
+    def __newDegrees(n, triple, array, dtype=None):
+        """ private method that returns the storage of the degrees of n elements
+        all equal to a given triple.
+        ----
+        Parameters:
+        - n: number of elements
+        - triple: membership, indeterminacy and non-membership degree of every element
+        - array: True for a columnar numpy array, False for a list of triples
+        - dtype: type of the degrees of the numpy array (default: the class variable dtype)
+        ----
+        Returns: an (n,3) numpy array or a list of n triples
+        """
+        if array:
+            degrees = np.empty((n, 3), dtype=dtype or NSset.dtype)
+            degrees[:] = triple
+        else:
+            degrees = [list(triple) for i in range(n)]
+        return degrees
+
+
+    # metodo privato che indica se i gradi sono memorizzati in un array numpy
+    def __isArray(self):
+        """ private method that checks if the degrees of the current neutrosophic set
+        are stored in a columnar numpy array.
+        ----
+        Returns: True if the current neutrosophic set uses the numpy backend
+        """
+        return np is not None and isinstance(self.__degrees, np.ndarray)
+
+
+    # metodo privato che restituisce una copia indipendente della struttura dei gradi
+    def __copyDegrees(self):
+        """ private method that returns an independent copy of the storage of the degrees.
+        ----
+        Returns: the copy of the array or of the list of triples of the current neutrosophic set
+        """
+        if self.__isArray():
+            return self.__degrees.copy()
+        elif self.__default is not None:
+            return {k: list(t) for k, t in self.__degrees.items()}
+        return [list(t) for t in self.__degrees]
+
+
+    # metodo privato che restituisce i gradi di un altro insieme nello stesso formato di quello corrente
+    def __degreesOf(self, nset):
+        """ private method that returns the degrees of a second neutrosophic set
+        with the same storage (list or numpy array) of the current one.
+        ----
+        Parameters:
+        - nset: second neutrosophic set
+        ----
+        Returns: the storage of the degrees of nset, converted if necessary
+        """
+        if nset.__default is not None:
+            nset = nset.__densified(self.__isArray())
+        degrees = nset.__degrees
+        if self.__isArray():
+            if not nset.__isArray():
+                degrees = np.array(degrees, dtype=self.__degrees.dtype)
+        elif nset.__isArray():
+            degrees = degrees.tolist()
+        return degrees
+
+
+    # metodo privato che restituisce i gradi come lista di triple nell'ordine dell'universo
+    def __rows(self):
+        """ private method that returns the degrees of all the elements as a list of triples
+        in the same order of the universe.
+        ----
+        Returns: the list of the triples [mu, sigma, omega] of the current neutrosophic set
+        """
+        if self.__isArray():
+            return self.__degrees.tolist()
+        elif self.__default is not None:
+            return self.__densified(False).__degrees
+        return self.__degrees
+
+
+    # metodo privato che restituisce una copia non sparsa dell'insieme neutrosofico corrente
+    def __densified(self, array):
+        """ private method that returns a non-sparse copy of the current sparse neutrosophic set.
+        ----
+        Parameters:
+        - array: True for a columnar numpy array, False for a list of triples
+        ----
+        Returns: the neutrosophic set with all the degrees explicitly stored
+        """
+        degrees = NSset.__newDegrees(self.cardinality(), self.__default, array)
+        for k, triple in self.__degrees.items():
+            degrees[k] = list(triple)
+        return self.__newSet(degrees)
+
+
+    # metodo privato per operazione generica su due insiemi neutrosofici sparsi
+    def __sparseOperation(self, nset, op):
+        """ private method that returns the sparse neutrosophic set obtained by applying a function
+        to the triples of two sparse neutrosophic sets, merging only their explicit elements.
+        ----
+        Parameters:
+        - nset: second sparse neutrosophic set
+        - op: function of two triples which returns a triple
+        ----
+        Returns: the sparse neutrosophic set whose default is obtained by applying op to the defaults
+        """
+        A, defaultA = self.__degrees, self.__default
+        B, defaultB = nset.__degrees, nset.__default
+        default = op(defaultA, defaultB)   # valore assunto dagli elementi non espliciti in entrambi gli insiemi
+        explicit = dict()
+        for k in A.keys() | B.keys():
+            triple = op(A.get(k, defaultA), B.get(k, defaultB))
+            if triple != default:
+                explicit[k] = triple
+        return self.__newSet(explicit, default)
+
+
+    # metodo privato che verifica una proprietà su tutte le coppie di triple di due insiemi neutrosofici sparsi
+    def __sparseAll(self, nset, pred):
+        """ private method that checks if a predicate holds for all the pairs of corresponding triples
+        of two sparse neutrosophic sets, examining the defaults only once.
+        ----
+        Parameters:
+        - nset: second sparse neutrosophic set
+        - pred: boolean function of two triples
+        ----
+        Returns: True if pred holds for every element of the universe
+        """
+        A, defaultA = self.__degrees, self.__default
+        B, defaultB = nset.__degrees, nset.__default
+        keys = A.keys() | B.keys()
+        if len(keys) < self.cardinality() and not pred(defaultA, defaultB):
+            return False
+        result = all(pred(A.get(k, defaultA), B.get(k, defaultB)) for k in keys)
+        return result
+
+
+    # metodo privato che verifica una proprietà su tutte le coppie di triple di due insiemi neutrosofici
+    # esaminandole a blocchi di dimensione crescente e fermandosi al primo controesempio
+    def __allPairs(self, nset, pred, vpred):
+        """ private method that checks if a predicate holds for all the pairs of corresponding triples
+        of two neutrosophic sets in a single pass, without building any intermediate neutrosophic set.
+        The triples are examined in blocks of growing size, so that a counterexample among the first
+        elements is found in constant time.
+        ----
+        Parameters:
+        - nset: second neutrosophic set
+        - pred: boolean function of two triples
+        - vpred: boolean function of two (k,3) numpy arrays which is True if pred holds for all their rows
+        ----
+        Returns: True if pred holds for every element of the universe
+        """
+        if self.__default is not None and nset.__default is not None:
+            return self.__sparseAll(nset, pred)
+        vectorized = self.__isArray() and nset.__isArray()
+        n = self.cardinality()
+        start, size = 0, NSset.__firstblock
+        while start < n:
+            stop = min(start + size, n)
+            if vectorized:
+                holds = vpred(self.__degrees[start:stop], nset.__degrees[start:stop])
+            else:
+                holds = all(map(pred, self.__triples(start, stop), nset.__triples(start, stop)))
+            if not holds:
+                return False
+            start, size = stop, min(2 * size, NSset.__lastblock)
+        return True
 
 
     #------------------------------------------------------------------------------------
@@ -88,13 +312,40 @@ class NSset:
         - i: index of the degree (i=0: membership, i=1: indeterminacy, i=2: non-membership
         . r: obj of the i-th degree
         """
-        u = str(u)  # converte in stringa per confrontarla con gli elementi dell'universo che è lista di stringhe
-        if u not in self.getUniverse():
-            raise IndexError("non-existent element")
+        k = self.__universe.indexOf(u)   # posizione dell'elemento (solleva una eccezione se non esiste)
         r = float(r)
         if not (0 <= r <= 1):
             raise ValueError(f"incompatible {self.degreename[i]} degree obj")
-        self.__neutrosophicset[u][i] = r
+        old = self.__tripleAt(k) if self.__fingerprint is not None else None
+        if self.__default is not None:   # negli insiemi sparsi si memorizzano solo le triple diverse dal default
+            triple = list(self.__degrees.get(k, self.__default))
+            triple[i] = r
+            if triple == self.__default:
+                self.__degrees.pop(k, None)
+            else:
+                self.__degrees[k] = triple
+        else:
+            self.__degrees[k][i] = r
+        if old is not None:   # aggiorna l'impronta in tempo costante con la tripla riletta dalla memoria
+            new = self.__tripleAt(k)   # (un array float32 arrotonda il grado assegnato)
+            weight = int(NSpositionWeights(self.cardinality())[k])
+            self.__fingerprint = (self.__fingerprint + weight * (NStripleHash(new) - NStripleHash(old))) & NS_MASK64
+
+
+    # metodo privato che restituisce la tripla dell'elemento di posizione k
+    def __tripleAt(self, k):
+        """ private method that returns the triple of degrees of the element in a given position.
+        ----
+        Parameters:
+        - k: position of the element in the universe
+        ----
+        Returns: the list [mu, sigma, omega]
+        """
+        if self.__default is not None:
+            return list(self.__degrees.get(k, self.__default))
+        elif self.__isArray():
+            return self.__degrees[k].tolist()
+        return list(self.__degrees[k])
 
 
     #------------------------------------------------------------------------------------
@@ -149,8 +400,7 @@ class NSset:
         """
 
         if type(triple) == str:   # se il parametro è una stringa lo converte in lista
-            sostituz = { "(":"", ")":"", ",":" ", ";":" " }
-            triple = NSreplace(triple, sostituz).split()
+            triple = NSstringToList(triple)
         else:
             triple = list(triple)   # converte in lista in caso fosse una tupla
         if len(triple) != 3:
@@ -166,16 +416,146 @@ class NSset:
         """
         Method that returns the universe of the neutrosophic set as a list of string.
         ---
-        Returns: list of the elements of the universe
+        Returns: list of the elements of the universe (a new list at each call: use getUniverseSet()
+        to access the shared universe set without copying it)
         """
         return self.__universe.get()
 
 
+    # metodo che restituisce l'universo come oggetto insieme universo
+    def getUniverseSet(self):
+        """
+        Method that returns the universe of the neutrosophic set as a universe set object
+        (shared with all the neutrosophic sets and mappings defined on it).
+        ---
+        Returns: the universe set of the current neutrosophic set
+        """
+        return self.__universe
+
+
     # metodo che restituisce l'intero insieme neutrosofico come dizionario
     def get(self):
         """ method that returns the dictionary containg the degrees of each element
         """
-        return self.__neutrosophicset
+        rows = self.__rows()
+        if rows is self.__degrees:   # le triple memorizzate vengono copiate per non alterare l'insieme (e la sua impronta)
+            rows = [list(t) for t in rows]
+        return dict(zip(self.__universe, rows))
+
+
+    # metodo che restituisce i gradi di tutti gli elementi nell'ordine dell'universo
+    def getDegrees(self):
+        """ Method that returns the degrees of all the elements of the neutrosophic set
+        in the same order of its universe, without copying them.
+        ----
+        Returns: the list of triples [mu, sigma, omega] (not to be modified) or,
+        for the numpy backend, a read-only (n,3) array; for sparse sets a new list is built
+        """
+        degrees = self.__degrees
+        if self.__default is not None:
+            degrees = self.__rows()
+        elif self.__isArray():
+            degrees = degrees.view()
+            degrees.flags.writeable = False
+        return degrees
+
+
+    # restituisce i gradi di tutti gli elementi come matrice (n,3) di sola lettura
+    def toArray(self):
+        """ Method that returns the degrees of all the elements of the neutrosophic set as a read-only
+        (n,3) matrix in the same order of its universe. For the numpy backend the matrix is a view
+        of the storage of the set (without copying); otherwise it is built once from the triples.
+        ----
+        Returns: a read-only (n,3) numpy array or, if numpy is not installed,
+        a read-only 2-dimensional memoryview of floats
+        """
+        if self.__default is None and self.__isArray():
+            degrees = self.__degrees.view()
+        elif np is not None:
+            rows = self.__densified(True).__degrees if self.__default is not None else self.__degrees
+            degrees = np.array(rows, dtype=NSset.dtype).reshape(-1, 3)
+        else:
+            flat = array("d", [x for triple in self.__rows() for x in triple])
+            return NSset.__readOnlyView(flat, (len(flat) // 3, 3))
+        degrees.flags.writeable = False
+        return degrees
+
+
+    # metodo privato che restituisce la j-esima (j=0,1,2) colonna dei gradi
+    def __column(self, j):
+        """ private method that returns the j-th column of degrees (j=0,1,2) in the order of the universe.
+        ----
+        Parameters:
+        - j: index of the degree
+        ----
+        Returns: a read-only numpy array (a strided view of the storage for the numpy backend)
+        or, if numpy is not installed, a read-only memoryview of floats
+        """
+        if np is not None:
+            return self.toArray()[:, j]
+        return NSset.__readOnlyView(array("d", [triple[j] for triple in self.__rows()]))
+
+
+    # metodo privato che restituisce una memoryview di sola lettura di un array di reali
+    @staticmethod
+    def __readOnlyView(flat, shape=None):
+        """ private method that returns a read-only memoryview of an array of floats.
+        ----
+        Parameters:
+        - flat: array.array of type "d"
+        - shape: optional shape of the memoryview (default: one-dimensional)
+        ----
+        Returns: the read-only memoryview
+        """
+        view = memoryview(flat).toreadonly()
+        if shape is not None and len(flat) > 0:
+            view = view.cast("B").cast("d", shape)
+        return view
+
+
+    # restituisce i gradi di appartenenza di tutti gli elementi
+    def memberships(self):
+        """ Method that returns the membership degrees of all the elements in the order of the universe.
+        ----
+        Returns: a read-only numpy array or memoryview (see toArray)
+        """
+        return self.__column(0)
+
+
+    # restituisce i gradi di indeterminazione di tutti gli elementi
+    def indeterminacies(self):
+        """ Method that returns the indeterminacy degrees of all the elements in the order of the universe.
+        ----
+        Returns: a read-only numpy array or memoryview (see toArray)
+        """
+        return self.__column(1)
+
+
+    # restituisce i gradi di non appartenenza di tutti gli elementi
+    def nonMemberships(self):
+        """ Method that returns the non-membership degrees of all the elements in the order of the universe.
+        ----
+        Returns: a read-only numpy array or memoryview (see toArray)
+        """
+        return self.__column(2)
+
+
+    # conversione in array numpy col metodo speciale __array__ (usato da np.asarray)
+    def __array__(self, dtype=None, copy=None):
+        """ Method that allows numpy to convert the neutrosophic set into its (n,3) matrix of degrees.
+        ----
+        Parameters:
+        - dtype: optional type of the resulting array
+        - copy: True to always obtain a writable copy
+        ----
+        Returns: the read-only matrix of degrees returned by toArray, converted or copied if requested
+        """
+        degrees = self.toArray()
+        if dtype is not None:
+            degrees = degrees.astype(dtype, copy=False)
+        if copy:
+            degrees = degrees.copy()
+        return degrees
 
 
     # restituisce la lista dei gradi di appartenenza, indeterminazione e non appartenenza
@@ -189,10 +569,13 @@ class NSset:
         Returns: the list of floats containing the three degrees (membership, indeterminacy and non-membership)
         of the element u
         """
-        u = str(u)  # converte in stringa per confrontarla con gli elementi dell'universo che è lista di stringhe
-        if u not in self.getUniverse():
-            raise IndexError("non-existent element")
-        return self.__neutrosophicset[u]
+        k = self.__universe.indexOf(u)   # posizione dell'elemento (solleva una eccezione se non esiste)
+        if self.__default is not None:
+            return list(self.__degrees.get(k, self.__default))
+        triple = self.__degrees[k]
+        if self.__isArray():
+            return triple.tolist()
+        return list(triple)   # copia della tripla memorizzata, che non deve essere modificata dall'esterno
 
     #------------------------------------
 
@@ -208,10 +591,13 @@ class NSset:
         ----
         Returns: i-th degree of u
         """
-        u = str(u)  # converte in stringa per confrontarla con gli elementi dell'universo che è lista di stringhe
-        if u not in self.getUniverse():
-            raise IndexError("non-existent element")
-        return self.__neutrosophicset[u][i]
+        k = self.__universe.indexOf(u)   # posizione dell'elemento (solleva una eccezione se non esiste)
+        if self.__default is not None:
+            return self.__degrees.get(k, self.__default)[i]
+        degree = self.__degrees[k][i]
+        if self.__isArray():
+            degree = float(degree)
+        return degree
 
 
     #------------------------------------
@@ -264,8 +650,14 @@ class NSset:
         """
         Makes the neutrosophic set equal to the null neutrosophic set.
         """
-        for e in self.__universe.get():
-            self.__neutrosophicset[e] = [0, 0, 1]
+        if self.__default is not None:    # basta cambiare il default e rimuovere gli elementi espliciti
+            self.__degrees = dict()
+            self.__default = [0, 0, 1]
+        elif self.__isArray():
+            self.__degrees[:] = [0, 0, 1]
+        else:
+            self.__degrees = NSset.__newDegrees(self.cardinality(), [0, 0, 1], False)
+        self.__fingerprint = None
 
 
     # pone l'insieme neutrosofico uguale all'insieme neutrosofico assoluto
@@ -273,8 +665,441 @@ class NSset:
         """
         Makes the neutrosophic set equal to the absolute neutrosophic set.
         """
-        for e in self.__universe.get():
-            self.__neutrosophicset[e] = [1, 1, 0]
+        if self.__default is not None:
+            self.__degrees = dict()
+            self.__default = [1, 1, 0]
+        elif self.__isArray():
+            self.__degrees[:] = [1, 1, 0]
+        else:
+            self.__degrees = NSset.__newDegrees(self.cardinality(), [1, 1, 0], False)
+        self.__fingerprint = None
+
+
+    #------------------------------------------------------------------------------------
+
+
+    # crea un insieme neutrosofico sparso
+    @staticmethod
+    def sparse(universe, default="empty"):
+        """
+        Generic constructor of a sparse neutrosophic set, i.e. a neutrosophic set which stores only
+        the elements whose degrees differ from a declared default (the empty or the absolute one),
+        so that its memory depends only on the number of such elements.
+        ----
+        Parameters:
+        - universe: element referable to an object universe (list, tuple, string, universe set object)
+        - default: "empty" (default value) or "absolute"
+        ----
+        Returns: the sparse neutrosophic set equal to the empty or to the absolute neutrosophic set
+        """
+        defaults = {"empty": [0, 0, 1], "absolute": [1, 1, 0]}
+        if default not in defaults:
+            raise ValueError("the default of a sparse neutrosophic set must be 'empty' or 'absolute'")
+        C = NSset.__new__(NSset)
+        C.__universe = NSuniverse(universe)
+        C.__degrees = dict()
+        C.__default = defaults[default]
+        return C
+
+
+    # restituisce True se l'insieme neutrosofico è sparso
+    def isSparse(self):
+        """
+        Checks if the current neutrosophic set is stored in sparse mode.
+        ----
+        Returns: True if only the elements different from a default are stored
+        """
+        return self.__default is not None
+
+
+    # restituisce True se l'insieme neutrosofico è uguale all'insieme neutrosofico vuoto
+    def isEmpty(self):
+        """
+        Checks if the current neutrosophic set is the empty neutrosophic set (in constant time for a sparse
+        set without explicit elements, otherwise stopping at the first element which is not empty).
+        ----
+        Returns: True if all the elements have degrees (0,0,1)
+        """
+        return self.__isUniform([0, 0, 1])
+
+
+    # restituisce True se l'insieme neutrosofico è uguale all'insieme neutrosofico assoluto
+    def isAbsolute(self):
+        """
+        Checks if the current neutrosophic set is the absolute neutrosophic set (in constant time for a sparse
+        set without explicit elements, otherwise stopping at the first element which is not absolute).
+        ----
+        Returns: True if all the elements have degrees (1,1,0)
+        """
+        return self.__isUniform([1, 1, 0])
+
+
+    # metodo privato che verifica se tutti gli elementi hanno la stessa tripla
+    def __isUniform(self, triple):
+        """ private method that checks if all the elements of the current neutrosophic set have the given triple.
+        ----
+        Parameters:
+        - triple: list of the three degrees
+        ----
+        Returns: True if the degrees of every element coincide with triple
+        """
+        A = self.__degrees
+        if self.__default is not None:
+            return self.__default == triple and all(t == triple for t in A.values())
+        if self.__isArray():
+            return len(A) == 0 or (bool(np.all(A[0] == triple)) and bool(np.all(A == triple)))
+        return all(t == triple for t in A)
+
+
+    # restituisce una copia non sparsa dell'insieme neutrosofico
+    def toDense(self):
+        """
+        Method that returns a copy of the current neutrosophic set storing explicitly the degrees of all its elements
+        (according to the class variable backend if the current set is sparse).
+        ----
+        Returns: the non-sparse copy of the current neutrosophic set
+        """
+        if self.__default is not None:
+            return self.__densified(NSset.__useArray())
+        return NSset(self)
+
+
+    # crea un insieme neutrosofico a partire da tre colonne di gradi
+    @staticmethod
+    def fromArrays(universe, mu, sigma, omega):
+        """
+        Generic constructor of a neutrosophic set from three columns containing the membership,
+        indeterminacy and non-membership degrees of all the elements in the order of the universe.
+        Every column is validated as a whole instead of one degree at a time and the degrees are stored
+        according to the class variable backend (as a list of triples for the "python" one).
+        ----
+        Parameters:
+        - universe: element referable to an object universe (list, tuple, string, universe set object)
+        - mu, sigma, omega: columns of real values (numpy arrays, array.array, memoryviews, lists or tuples)
+        ----
+        Returns: the neutrosophic set having the given degrees
+        """
+        universe = NSuniverse(universe)
+        columns = [mu, sigma, omega]
+        if NSset.__adoptsBuffers(columns):
+            columns = [np.asarray(c).reshape(-1) for c in columns]
+            for c in columns:
+                if len(c) != len(universe):
+                    raise IndexError("the number of obj degrees does not correspond with the number of elements")
+            dtype = np.result_type(*columns)
+            if dtype not in (np.float32, np.float64):
+                dtype = NSset.dtype
+            degrees = np.empty((len(universe), 3), dtype=dtype)   # unica copia delle tre colonne nella matrice (n,3)
+            for j in range(3):
+                degrees[:, j] = columns[j]
+            NSset.__checkedMatrix(degrees)
+            if not NSset.__useArray():   # il motore python memorizza i gradi controllati come lista di triple
+                degrees = degrees.tolist()
+        else:
+            columns = [NSset.__checkedColumn(c, j, len(universe)) for j, c in enumerate(columns)]
+            degrees = list(map(list, zip(*columns)))
+        return NSset.__fromDegrees(universe, degrees)
+
+
+    # crea un insieme neutrosofico a partire da una matrice (n,3) di gradi
+    @staticmethod
+    def fromMatrix(universe, matrix):
+        """
+        Generic constructor of a neutrosophic set from a matrix whose rows are the triples of
+        membership, indeterminacy and non-membership degrees of the elements in the order of the universe.
+        The whole matrix is validated at once and a writable numpy array or buffer of floats
+        is adopted without copying, so that later changes of the set are visible in it.
+        ----
+        Parameters:
+        - universe: element referable to an object universe (list, tuple, string, universe set object)
+        - matrix: (n,3) array-like (numpy array, 2-dimensional memoryview, list of triples)
+                  or flat buffer of 3n values (array.array, memoryview) stored row by row
+        ----
+        Returns: the neutrosophic set having the given degrees
+        """
+        universe = NSuniverse(universe)
+        n = len(universe)
+        if NSset.__adoptsBuffers([matrix]):
+            degrees = np.asarray(matrix)
+            if degrees.ndim == 1 and degrees.size == 3 * n:
+                degrees = degrees.reshape(n, 3)   # vista senza copia del buffer piatto
+            if degrees.shape != (n, 3):
+                raise IndexError("the number of obj triples does not correspond with the number of elements")
+            if degrees.dtype not in (np.float32, np.float64):
+                degrees = degrees.astype(NSset.dtype)
+            elif not degrees.flags.writeable:   # un buffer di sola lettura viene copiato
+                degrees = degrees.copy()
+            NSset.__checkedMatrix(degrees)
+        elif isinstance(matrix, (list, tuple)):
+            return NSset(universe, matrix)
+        else:
+            flat = memoryview(matrix)
+            if flat.ndim > 1:
+                flat = flat.cast("B").cast(flat.format)   # linearizza il buffer riga per riga
+            if len(flat) != 3 * n:
+                raise IndexError("the number of obj triples does not correspond with the number of elements")
+            columns = [NSset.__checkedColumn(flat[j::3], j, n) for j in range(3)]
+            degrees = list(map(list, zip(*columns)))
+        return NSset.__fromDegrees(universe, degrees)
+
+
+    # salva l'insieme neutrosofico in un file binario
+    def save(self, path):
+        """
+        Saves the current neutrosophic set in a binary file containing the elements of its universe
+        and its degrees stored as floats (float32 or float64 according to its storage).
+        Sparse neutrosophic sets are saved in sparse form, together with their default.
+        ----
+        Parameters:
+        - path: name of the file
+        """
+        sections = [self.__universe.get()]
+        if self.__default is not None:
+            positions = sorted(self.__degrees)
+            degrees = [x for k in positions for x in self.__degrees[k]]
+            sections += [("d", array("d", degrees)), ("q", array("q", positions)), ("d", array("d", self.__default))]
+        elif self.__isArray():
+            degrees = np.ascontiguousarray(self.__degrees)
+            sections.append(("f" if degrees.dtype == np.float32 else "d", degrees))
+        else:
+            sections.append(("d", array("d", [x for triple in self.__degrees for x in triple])))
+        NSwriteBinary(path, NSset.__magic, sections)
+
+
+    # carica un insieme neutrosofico da un file binario
+    @staticmethod
+    def load(path, mmap=True):
+        """
+        Generic constructor of a neutrosophic set saved in a binary file by the method save.
+        If numpy is installed the degrees are memory-mapped in copy-on-write mode (or read, if mmap is False)
+        and checked with the single vectorized comparison of fromMatrix; for the "numpy" backend they are
+        then adopted without copying them, while for the "python" one they are converted into a list of triples.
+        Without numpy they are read and checked as in fromMatrix.
+        The positions and the default of a sparse neutrosophic set are checked as well.
+        ----
+        Parameters:
+        - path: name of the file
+        - mmap: True (default) to map the degrees in memory, False to read them
+        ----
+        Returns: the neutrosophic set saved in the file
+        """
+        sections = NSreadBinary(path, NSset.__magic, mmap)
+        universe = NSuniverse(sections[0])
+        if len(sections) == 4:   # insieme sparso: gradi degli elementi espliciti, loro posizioni e default
+            default = list(map(float, sections[3]))
+            defaults = {(0, 0, 1): "empty", (1, 1, 0): "absolute"}
+            if tuple(default) not in defaults:
+                raise ValueError("the default of a sparse neutrosophic set must be 'empty' or 'absolute'")
+            C = NSset.sparse(universe, defaults[tuple(default)])
+            flat, positions = sections[1], list(map(int, sections[2]))
+            if positions and not (0 <= min(positions) and max(positions) < len(universe)):
+                raise IndexError("non-existent element")
+            columns = [NSset.__checkedColumn(flat[j::3], j, len(positions)) for j in range(3)]
+            C.__degrees = {k: list(t) for k, t in zip(positions, zip(*columns))}
+            return C
+        degrees = sections[1]
+        if np is None:
+            return NSset.fromMatrix(universe, degrees)
+        degrees = degrees.reshape(-1, 3)
+        if len(degrees) != len(universe):
+            raise IndexError("the number of obj triples does not correspond with the number of elements")
+        NSset.__checkedMatrix(degrees)   # la mappa resta condivisa: il controllo legge i gradi senza copiarli
+        if not NSset.__useArray():   # il motore python memorizza i gradi controllati come lista di triple
+            degrees = degrees.tolist()
+        return NSset.__fromDegrees(universe, degrees)
+
+
+    # legge un insieme neutrosofico da un file di testo delimitato (CSV o TSV)
+    @staticmethod
+    def readCSV(source, chunksize=65536, delimiter=","):
+        """
+        Generic constructor of a neutrosophic set from a delimited text file whose rows contain
+        an element followed by its membership, indeterminacy and non-membership degrees.
+        The rows are read in chunks and accumulated directly into compact columns of floats,
+        without building a list of triples; an initial header row is skipped.
+        The degrees are stored according to the class variable backend, as in fromArrays.
+        ----
+        Parameters:
+        - source: name of the file or text file object
+        - chunksize: number of rows read at a time (default 65536)
+        - delimiter: separator of the fields (default ",", use "\\t" for TSV files)
+        ----
+        Returns: the neutrosophic set over the universe of the elements of the file
+        """
+        elements = list()
+        columns = [array("d"), array("d"), array("d")]
+        for chunk in NSset.__csvChunks(source, chunksize, delimiter):
+            elements += chunk[0]
+            for j in range(3):
+                columns[j] += chunk[j+1]
+        return NSset.fromArrays(elements, *columns)
+
+
+    # legge un file di testo delimitato restituendo un insieme neutrosofico per ogni blocco di righe
+    @staticmethod
+    def iterCSV(source, chunksize=65536, delimiter=","):
+        """
+        Reads a delimited text file as readCSV, but yields a separate neutrosophic set for each chunk
+        of rows (defined over the universe of the elements of the chunk), so that the whole file
+        is never kept in memory.
+        ----
+        Parameters:
+        - source: name of the file or text file object
+        - chunksize: number of rows of every neutrosophic set (default 65536)
+        - delimiter: separator of the fields (default ",", use "\\t" for TSV files)
+        ----
+        Returns: an iterator of neutrosophic sets
+        """
+        for elements, mu, sigma, omega in NSset.__csvChunks(source, chunksize, delimiter):
+            yield NSset.fromArrays(elements, mu, sigma, omega)
+
+
+    # metodo privato che legge un file di testo delimitato a blocchi di righe
+    @staticmethod
+    def __csvChunks(source, chunksize, delimiter):
+        """ private method that reads a delimited text file in chunks of rows.
+        ----
+        Parameters:
+        - source: name of the file or text file object
+        - chunksize: maximum number of rows of every chunk
+        - delimiter: separator of the fields
+        ----
+        Returns: an iterator of quadruples formed by the list of the elements and the three columns of degrees
+        """
+        if chunksize < 1:
+            raise ValueError("the size of the chunks must be a positive integer")
+        file = open(source, newline="") if isinstance(source, (str, os.PathLike)) else source
+        try:
+            rows = (row for row in csv.reader(file, delimiter=delimiter) if row)   # ignora le righe vuote
+            first = next(rows, None)
+            if first is not None and not NSset.__isHeader(first):
+                rows = chain([first], rows)
+            while True:
+                chunk = list(islice(rows, chunksize))
+                if not chunk:
+                    break
+                if any(len(row) != 4 for row in chunk):
+                    raise ValueError("every row of the file must contain an element and three degrees")
+                elements, mu, sigma, omega = zip(*chunk)
+                yield [e.strip() for e in elements], array("d", map(float, mu)), array("d", map(float, sigma)), array("d", map(float, omega))
+        finally:
+            if file is not source:
+                file.close()
+
+
+    # metodo privato che verifica se una riga di un file di testo delimitato è una riga di intestazione
+    @staticmethod
+    def __isHeader(row):
+        """ private method that checks if a row of a delimited text file is a header,
+        i.e. if none of the fields following the first one represents a real number.
+        ----
+        Parameters:
+        - row: list of strings
+        ----
+        Returns: True if the row contains the names of the fields
+        """
+        return not any(NSisNumber(field) for field in row[1:])
+
+
+    # scrive l'insieme neutrosofico in un file di testo delimitato (CSV o TSV)
+    def writeCSV(self, target, chunksize=65536, delimiter=",", header=True):
+        """
+        Writes the current neutrosophic set in a delimited text file, one element with its three degrees
+        per row, producing the rows in chunks instead of building a single string.
+        ----
+        Parameters:
+        - target: name of the file or text file object
+        - chunksize: number of rows written at a time (default 65536)
+        - delimiter: separator of the fields (default ",", use "\\t" for TSV files)
+        - header: True (default) to write an initial row with the names of the fields
+        """
+        if chunksize < 1:
+            raise ValueError("the size of the chunks must be a positive integer")
+        file = open(target, "w", newline="") if isinstance(target, (str, os.PathLike)) else target
+        try:
+            writer = csv.writer(file, delimiter=delimiter, lineterminator="\n")
+            if header:
+                writer.writerow(["element"] + self.degreename)
+            universe = self.__universe
+            for start in range(0, len(universe), chunksize):
+                stop = min(start + chunksize, len(universe))
+                writer.writerows([u] + list(t) for u, t in zip(universe[start:stop], self.__triples(start, stop)))
+        finally:
+            if file is not target:
+                file.close()
+
+
+    # metodo privato che stabilisce se i gradi forniti ai costruttori vettoriali vanno adottati in un array numpy
+    @staticmethod
+    def __adoptsBuffers(columns):
+        """ private method that checks if the degrees passed to the array constructors
+        must be collected and checked in a numpy array, i.e. if numpy is available and either the backend is
+        "numpy" or some of them is already a buffer (numpy array, array.array or memoryview).
+        ----
+        Parameters:
+        - columns: list of the arguments containing the degrees
+        ----
+        Returns: True if the degrees must be collected in a numpy array
+        """
+        if np is None:
+            return False
+        if NSset.backend == "numpy":
+            return True
+        return any(not isinstance(c, (list, tuple)) for c in columns)
+
+
+    # metodo privato che controlla con un'unica operazione vettoriale tutti i gradi di una matrice (n,3)
+    @staticmethod
+    def __checkedMatrix(degrees):
+        """ private method that checks that all the degrees of an (n,3) numpy array belong to [0,1]
+        with a single vectorized comparison.
+        ----
+        Parameters:
+        - degrees: (n,3) numpy array of degrees
+        """
+        valid = ((degrees >= 0) & (degrees <= 1)).all(axis=0)   # NaN non supera nessuno dei due confronti
+        for j in range(3):
+            if not valid[j]:
+                raise ValueError(f"incompatible {NSset.degreename[j]} degree obj")
+
+
+    # metodo privato che converte in reali e controlla una colonna di gradi senza numpy
+    @staticmethod
+    def __checkedColumn(column, j, n):
+        """ private method that converts to real numbers the j-th column of degrees and checks
+        that it contains n values belonging to [0,1] by means of its minimum and maximum.
+        ----
+        Parameters:
+        - column: sequence or buffer of real values
+        - j: index of the degree (0,1,2)
+        - n: number of elements of the universe
+        ----
+        Returns: the list of the degrees of the column
+        """
+        column = list(map(float, column))
+        if len(column) != n:
+            raise IndexError("the number of obj degrees does not correspond with the number of elements")
+        if column and not (0 <= min(column) and max(column) <= 1) or any(map(math.isnan, column)):
+            raise ValueError(f"incompatible {NSset.degreename[j]} degree obj")
+        return column
+
+
+    # metodo privato che crea un insieme neutrosofico adottando una struttura di gradi già controllata
+    @staticmethod
+    def __fromDegrees(universe, degrees):
+        """ private method that returns a new neutrosophic set adopting an already checked storage of degrees.
+        ----
+        Parameters:
+        - universe: universe set object
+        - degrees: list of triples or (n,3) numpy array of degrees
+        ----
+        Returns: the new neutrosophic set
+        """
+        C = NSset.__new__(NSset)
+        C.__universe = universe
+        C.__degrees = degrees
+        C.__default = None
+        return C
 
 
     #------------------------------------------------------------------------------------
@@ -290,6 +1115,23 @@ class NSset:
         return self.__universe.cardinality()
 
 
+    # restituisce la memoria occupata dai gradi dell'insieme neutrosofico
+    def nbytes(self):
+        """
+        Method that returns the approximate number of bytes of memory used by the degrees of the
+        neutrosophic set (the universe, which is shared by all the sets defined on it, is not counted).
+        ----
+        Returns: the number of bytes
+        """
+        A = self.__degrees
+        if self.__isArray():
+            return int(A.nbytes)
+        triple = sys.getsizeof([0.0, 0.0, 0.0]) + 3 * sys.getsizeof(0.0)   # lista di tre reali distinti
+        if self.__default is not None:
+            return sys.getsizeof(A) + len(A) * (triple + sys.getsizeof(len(A))) + triple
+        return sys.getsizeof(A) + len(A) * triple
+
+
     #------------------------------------------------------------------------------------
 
     # restituisce True se l'insieme neutrosofico corrente è contenuto in quello
@@ -303,19 +1145,17 @@ class NSset:
         ----
         Returns: True if the current neutrosophic set is neutrosofically contained in the second one
         """
-        if self.getUniverse() != nset.getUniverse():
+        nset = NSset.__evaluated(nset)
+        if self.__universe != nset.__universe:   # confronto in tempo costante tra universi condivisi
             raise ValueError("the two neutrosophic sets cannot be defined on different universe sets")
-        if self.getUniverse() != nset.getUniverse():
-            return False
-        else:
-            result = True
-            for e in self.getUniverse():
-                (muA, sigmaA, omegaA) = self.getElement(e)
-                (muB, sigmaB, omegaB) = nset.getElement(e)
+        if self.__default is None and nset.__default is None and not self.__isArray() and not nset.__isArray():
+            for (muA, sigmaA, omegaA), (muB, sigmaB, omegaB) in zip(self.__degrees, nset.__degrees):
                 if (muA > muB) or (sigmaA > sigmaB) or (omegaA < omegaB):
-                    result = False
-                    break
-            return result
+                    return False
+            return True
+        included = self.__allPairs(nset, lambda a, b: a[0] <= b[0] and a[1] <= b[1] and a[2] >= b[2],
+                                   lambda A, B: not (np.any(A[:, 0] > B[:, 0]) or np.any(A[:, 1] > B[:, 1]) or np.any(A[:, 2] < B[:, 2])))
+        return included
 
 
     # restituisce True se l'insieme neutrosofico corrente contiene in quello
@@ -329,7 +1169,8 @@ class NSset:
         ----
         Returns: True if the current neutrosophic set neutrosofically contains the second one
         """
-        if self.getUniverse() != nset.getUniverse():
+        nset = NSset.__evaluated(nset)
+        if self.__universe != nset.__universe:   # confronto in tempo costante tra universi condivisi
             raise ValueError("the two neutrosophic sets cannot be defined on different universe sets")
         return nset.isNSsubset(self)
 
@@ -348,21 +1189,127 @@ class NSset:
         Returns: the neutrosophic set obtained by the current one with the second one by
         applying the functions fm, fs and fo to their respective degrees
         """
-        if self.getUniverse() != nset.getUniverse():
+        if self.__universe != nset.__universe:   # confronto in tempo costante tra universi condivisi
             raise ValueError("the two neutrosophic sets cannot be defined on different universe sets")
         if callable(fm) == False or callable(fs) == False or callable(fo) == False:
             raise  ValueError("the last three parameters must be functions")
-        C = NSset(self.__universe)
-        for e in self.getUniverse():
-            (muA, sigmaA, omegaA) = self.getElement(e)
-            (muB, sigmaB, omegaB) = nset.getElement(e)
-            #----
-            triple = [fm(muA, muB), fs(sigmaA, sigmaB), fo(omegaA, omegaB)]   # i.e. (muC, sigmaC, omegaC)
-            C.setElement(e, triple)
+        if self.__default is not None:
+            if nset.__default is not None:
+                op = lambda a, b: self.__checkedTriple([fm(a[0], b[0]), fs(a[1], b[1]), fo(a[2], b[2])])
+                return self.__sparseOperation(nset, op)
+            return self.__densified(nset.__isArray()).__NSoperation(nset, fm, fs, fo)
+        A = self.__degrees
+        B = self.__degreesOf(nset)
+        ufuncs = [NSset.__ufunc(f) for f in (fm, fs, fo)]
+        if self.__isArray() and None not in ufuncs:
+            # le funzioni vengono applicate una sola volta alle intere colonne dei gradi
+            degrees = np.empty_like(A)
+            for j in range(3):
+                degrees[:, j] = ufuncs[j](A[:, j], B[:, j])
+                if not np.all((degrees[:, j] >= 0) & (degrees[:, j] <= 1)):   # controllo vettoriale dei valori ottenuti
+                    raise ValueError(f"incompatible {self.degreename[j]} degree obj")
+        else:
+            if self.__isArray():   # funzioni generiche: si procede elemento per elemento
+                B = B.tolist()
+            degrees = list()
+            for (muA, sigmaA, omegaA), (muB, sigmaB, omegaB) in zip(self.__rows(), B):
+                triple = [fm(muA, muB), fs(sigmaA, sigmaB), fo(omegaA, omegaB)]   # i.e. (muC, sigmaC, omegaC)
+                degrees.append(self.__checkedTriple(triple))
+            if self.__isArray():
+                degrees = np.array(degrees, dtype=A.dtype)
+        return self.__newSet(degrees)
+
+
+    # metodo privato che converte in reali i gradi di una tripla controllandone la compatibilità
+    def __checkedTriple(self, triple):
+        """ private method that converts the degrees of a triple to floats checking that they belong to [0,1].
+        ----
+        Parameters:
+        - triple: list of membership, indeterminacy and non-membership degree
+        ----
+        Returns: the list of the three degrees as floats
+        """
+        triple = [float(triple[j]) for j in range(3)]
+        for j in range(3):   # controlla che i valori della tripla siano compatibili
+            if not 0 <= triple[j] <= 1:
+                raise ValueError(f"incompatible {self.degreename[j]} degree obj")
+        return triple
+
+
+    # metodo privato che restituisce la funzione vettoriale numpy corrispondente ad una funzione binaria
+    @staticmethod
+    def __ufunc(f):
+        """ private method that returns the numpy vectorized function equivalent
+        to a given binary function on degrees, if any.
+        ----
+        Parameters:
+        - f: binary function
+        ----
+        Returns: the corresponding numpy ufunc or None if f cannot be applied to whole columns
+        """
+        if np is None:
+            return None
+        if isinstance(f, np.ufunc) or NSisVectorizable(f):
+            return f
+        return {max: np.maximum, min: np.minimum}.get(f)
+
+
+    # operazione generica su insiemi neutrosofici definita da tre funzioni
+    def combine(self, nset, fm, fs, fo):
+        """ Calculates and returns the neutrosophic set obtained by combining the current set with
+        the second one passed as parameter by means of three binary functions applied respectively
+        to their membership, indeterminacy and non-membership degrees (e.g. t-norms and t-conorms).
+        With the numpy backend, numpy ufuncs and functions marked by the NSvectorizable decorator
+        are applied once to whole columns of degrees, while other functions are applied element by element.
+        ----
+        Parameters:
+        - nset second neutrosophic set
+        - fm, fs, fo: functions of two degrees returning a value in [0,1]
+        ----
+        Returns: the neutrosophic set obtained by the current one with the second one by
+        applying the functions fm, fs and fo to their respective degrees
+        """
+        C = self.__NSoperation(nset, fm, fs, fo)
         return C
 
 
+    # metodo privato che crea un nuovo insieme neutrosofico sullo stesso universo a partire dai gradi
+    def __newSet(self, degrees, default=None):
+        """ private method that returns a new neutrosophic set over the same universe
+        of the current one having the given storage of degrees (which is not copied).
+        ----
+        Parameters:
+        - degrees: list of triples or (n,3) numpy array in the order of the universe
+          or, for a sparse set, dictionary of the triples different from the default
+        - default: triple of the elements not explicitly stored in a sparse set (None for non-sparse sets)
+        ----
+        Returns: the new neutrosophic set
+        """
+        C = NSset.__new__(NSset)   # evita di inizializzare dei gradi che verrebbero subito sostituiti
+        C.__universe = self.__universe
+        C.__degrees = degrees
+        C.__default = default
+        return C
+
+
+    # metodo privato che calcola il valore di un operando che sia un'espressione
+    @staticmethod
+    def __evaluated(nset):
+        """ private method that evaluates an operand which is a lazy expression (NSexpression),
+        so that operations and comparisons accept expressions too.
+        ----
+        Parameters:
+        - nset: neutrosophic set or expression
+        ----
+        Returns: the neutrosophic set itself or the value of the expression
+        """
+        if isinstance(nset, NSexpression):
+            return nset.evaluate()
+        return nset
+
+
     # unione neutrosofica
+    @NScache.cached("NSunion", commutative=True)
     def NSunion(self, nset):
         """ Calculates and returns the neutrosophic union of the current set with the second one
         passed as parameter.
@@ -372,11 +1319,13 @@ class NSset:
         ----
         Returns: the neutrosophic union of the current neutrosophic set with the second one
         """
+        nset = NSset.__evaluated(nset)
         C = self.__NSoperation(nset, max, max, min)
         return C
 
 
     # intersezione neutrosofica
+    @NScache.cached("NSintersection", commutative=True)
     def NSintersection(self, nset):
         """ Calculates and returns the neutrosophic intersection of the current set with the second one
         passed as parameter.
@@ -386,10 +1335,196 @@ class NSset:
         ----
         Returns: the neutrosophic intersection of the current neutrosophic set with the second one
         """
+        nset = NSset.__evaluated(nset)
         C = self.__NSoperation(nset, min, min, max)
         return C
 
 
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che riduce una sequenza di insiemi neutrosofici accumulando i gradi in un'unica struttura
+    @staticmethod
+    def __NSreduction(nsets, fm, fs, fo):
+        """ private method that folds a sequence of neutrosophic sets defined on the same universe
+        by three functions applied to their membership, indeterminacy and non-membership degrees respectively,
+        accumulating the result in a single storage of degrees.
+        ----
+        Parameters:
+        - nsets: iterable (e.g. list or generator) of neutrosophic sets
+        - fm, fs, fo: the functions max or min to apply to the respective degrees
+        ----
+        Returns: the neutrosophic set obtained by folding all the neutrosophic sets of nsets
+        """
+        iterator = iter(nsets)
+        try:
+            first = next(iterator)
+        except StopIteration:
+            raise ValueError("at least one neutrosophic set is required")
+        universe = first.__universe
+        result = first.__newSet(first.__copyDegrees(), first.__default)   # unico accumulatore per l'intera riduzione
+        acc = result.__degrees
+        if np is not None:
+            ufuncs = [NSset.__ufunc(f) for f in (fm, fs, fo)]
+        for nset in iterator:
+            if nset.__universe != universe:
+                raise ValueError("the neutrosophic sets cannot be defined on different universe sets")
+            if result.__default is not None:
+                if nset.__default is not None:   # finché gli insiemi sono sparsi l'accumulatore resta sparso
+                    result = result.__sparseOperation(nset, lambda a, b: [float(fm(a[0], b[0])), float(fs(a[1], b[1])), float(fo(a[2], b[2]))])
+                    continue
+                result = result.__densified(nset.__isArray())
+                acc = result.__degrees
+            B = result.__degreesOf(nset)
+            if result.__isArray():
+                for j in range(3):   # aggiorna l'accumulatore in loco colonna per colonna
+                    ufuncs[j](acc[:, j], B[:, j], out=acc[:, j])
+            else:
+                for t, (mu, sigma, omega) in zip(acc, B):
+                    t[0] = float(fm(t[0], mu))
+                    t[1] = float(fs(t[1], sigma))
+                    t[2] = float(fo(t[2], omega))
+        return result
+
+
+    # unione neutrosofica di una famiglia di insiemi neutrosofici
+    @staticmethod
+    def unionAll(nsets):
+        """ Calculates and returns the neutrosophic union of a family of neutrosophic sets
+        defined on the same universe, streaming over them without creating intermediate sets.
+        ----
+        Parameters:
+        - nsets: iterable (e.g. list or generator) of neutrosophic sets
+        ----
+        Returns: the neutrosophic union of all the neutrosophic sets of the family
+        """
+        C = NSset.__NSreduction(nsets, max, max, min)
+        return C
+
+
+    # intersezione neutrosofica di una famiglia di insiemi neutrosofici
+    @staticmethod
+    def intersectionAll(nsets):
+        """ Calculates and returns the neutrosophic intersection of a family of neutrosophic sets
+        defined on the same universe, streaming over them without creating intermediate sets.
+        ----
+        Parameters:
+        - nsets: iterable (e.g. list or generator) of neutrosophic sets
+        ----
+        Returns: the neutrosophic intersection of all the neutrosophic sets of the family
+        """
+        C = NSset.__NSreduction(nsets, min, min, max)
+        return C
+
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che impila i gradi di una famiglia di insiemi neutrosofici in un unico tensore
+    @staticmethod
+    def __stack(nsets):
+        """ private method that stacks the degrees of a family of neutrosophic sets defined on the same
+        universe into a single numpy array, writing the degrees of sparse sets without densifying them.
+        ----
+        Parameters:
+        - nsets: list of neutrosophic sets
+        ----
+        Returns: the (N,n,3) numpy array whose k-th matrix contains the degrees of the k-th neutrosophic set
+        """
+        tensor = np.empty((len(nsets), nsets[0].cardinality(), 3), dtype=np.float64)
+        for k, nset in enumerate(nsets):
+            if nset.__default is not None:
+                tensor[k] = nset.__default
+                if nset.__degrees:
+                    tensor[k, list(nset.__degrees.keys())] = list(nset.__degrees.values())
+            else:
+                tensor[k] = nset.__degrees
+        return tensor
+
+
+    # metodo privato che calcola la matrice di una relazione tra tutte le coppie di una famiglia di insiemi neutrosofici
+    @staticmethod
+    def __relationMatrix(nsets, relation, symmetric, processes):
+        """ private method that returns the matrix of a relation between all the pairs of a family
+        of neutrosophic sets: with numpy the family is stacked into a single array and the relation is
+        computed by broadcasting on tiles of pairs, otherwise by the pairwise short-circuiting predicates.
+        ----
+        Parameters:
+        - nsets: iterable (e.g. list or generator) of neutrosophic sets
+        - relation: name of the relation ("inclusion", "equality" or "disjointness")
+        - symmetric: True if the relation is symmetric
+        - processes: number of worker processes or None to compute in the current process
+        ----
+        Returns: the (N,N) boolean numpy array or, without numpy, the list of N lists of N booleans
+        """
+        nsets = list(nsets)
+        for nset in nsets[1:]:
+            if nset.__universe != nsets[0].__universe:
+                raise ValueError("the neutrosophic sets cannot be defined on different universe sets")
+        N = len(nsets)
+        if np is None:
+            pred = {"inclusion": NSset.isNSsubset, "equality": NSset.__eq__, "disjointness": NSset.isNSdisjoint}[relation]
+            matrix = [[None] * N for i in range(N)]
+            for i in range(N):
+                for j in (range(i, N) if symmetric else range(N)):
+                    matrix[i][j] = pred(nsets[i], nsets[j])
+                    if symmetric:
+                        matrix[j][i] = matrix[i][j]
+            return matrix
+        if N == 0:
+            return np.empty((0, 0), dtype=bool)
+        return NSrelationMatrix(NSset.__stack(nsets), relation, symmetric, NSset.relationelements, processes)
+
+
+    # matrice di inclusione di una famiglia di insiemi neutrosofici
+    @staticmethod
+    def inclusionMatrix(nsets, processes=None):
+        """ Calculates the inclusion relation between all the pairs of a family of neutrosophic sets
+        defined on the same universe.
+        ----
+        Parameters:
+        - nsets: iterable (e.g. list or generator) of neutrosophic sets
+        - processes: number of worker processes for very large families or None (default)
+        ----
+        Returns: the (N,N) boolean matrix whose entry (i,j) is True if the i-th neutrosophic set
+        is contained in the j-th one (a numpy array, or a list of lists without numpy)
+        """
+        matrix = NSset.__relationMatrix(nsets, "inclusion", False, processes)
+        return matrix
+
+
+    # matrice di uguaglianza di una famiglia di insiemi neutrosofici
+    @staticmethod
+    def equalityMatrix(nsets, processes=None):
+        """ Calculates the equality relation between all the pairs of a family of neutrosophic sets
+        defined on the same universe.
+        ----
+        Parameters:
+        - nsets: iterable (e.g. list or generator) of neutrosophic sets
+        - processes: number of worker processes for very large families or None (default)
+        ----
+        Returns: the (N,N) symmetric boolean matrix whose entry (i,j) is True if the i-th neutrosophic set
+        is equal to the j-th one (a numpy array, or a list of lists without numpy)
+        """
+        matrix = NSset.__relationMatrix(nsets, "equality", True, processes)
+        return matrix
+
+
+    # matrice di disgiunzione di una famiglia di insiemi neutrosofici
+    @staticmethod
+    def disjointnessMatrix(nsets, processes=None):
+        """ Calculates the disjointness relation between all the pairs of a family of neutrosophic sets
+        defined on the same universe.
+        ----
+        Parameters:
+        - nsets: iterable (e.g. list or generator) of neutrosophic sets
+        - processes: number of worker processes for very large families or None (default)
+        ----
+        Returns: the (N,N) symmetric boolean matrix whose entry (i,j) is True if the i-th neutrosophic set
+        is disjoint from the j-th one (a numpy array, or a list of lists without numpy)
+        """
+        matrix = NSset.__relationMatrix(nsets, "disjointness", True, processes)
+        return matrix
+
+
     #------------------------------------------------------------------------------------
 
     # verifica se un insieme neutrosofico è disgiunto da un altro
@@ -401,8 +1536,14 @@ class NSset:
         - nset second neutrosophic set
         Returns: True if the current neutrosophic set is neutrosophically disjoint from the second one
         """
-        nsempty = NSset(self.__universe)  # prepare the empty neutrosophic set
-        disjoint = self.NSintersection(nset) == nsempty
+        nset = NSset.__evaluated(nset)
+        if self.__universe != nset.__universe:   # confronto in tempo costante tra universi condivisi
+            raise ValueError("the two neutrosophic sets cannot be defined on different universe sets")
+        # l'intersezione è vuota se in ogni elemento almeno uno dei due insiemi ha mu=0, almeno uno ha sigma=0
+        # ed almeno uno ha omega=1, e questo si verifica senza costruire l'intersezione
+        disjoint = self.__allPairs(nset, lambda a, b: (a[0] == 0 or b[0] == 0) and (a[1] == 0 or b[1] == 0) and (a[2] == 1 or b[2] == 1),
+                                   lambda A, B: not (np.any((A[:, 0] != 0) & (B[:, 0] != 0)) or np.any((A[:, 1] != 0) & (B[:, 1] != 0))
+                                                     or np.any((A[:, 2] != 1) & (B[:, 2] != 1))))
         return disjoint
 
 
@@ -410,21 +1551,28 @@ class NSset:
 
 
     # complementare neutrosofico
+    @NScache.cached("NScomplement")
     def NScomplement(self):
         """ Calculates and returns the neutrosophic complement of the current neutrosophic set.
         ----
         Returns: the neutrosophic complement of the current neutrosophic set
         """
-        C = NSset(self.__universe)
-        for e in self.getUniverse():
-            (muA, sigmaA, omegaA) = self.getElement(e)
-            #----
-            triple = [omegaA, 1 - sigmaA, muA]    # i.e. (muC, sigmaC, omegaC)
-            C.setElement(e, triple)
-        return C
+        A = self.__degrees
+        if self.__default is not None:   # il complementare di un insieme sparso è sparso
+            complement = lambda t: [float(t[2]), float(1 - t[1]), float(t[0])]
+            return self.__newSet({k: complement(t) for k, t in A.items()}, complement(self.__default))
+        if self.__isArray():
+            degrees = np.empty_like(A)
+            degrees[:, 0] = A[:, 2]
+            np.subtract(1, A[:, 1], out=degrees[:, 1])
+            degrees[:, 2] = A[:, 0]
+        else:
+            degrees = [[float(omegaA), float(1 - sigmaA), float(muA)] for (muA, sigmaA, omegaA) in A]    # i.e. (muC, sigmaC, omegaC)
+        return self.__newSet(degrees)
 
 
     # differenza neutrosofica
+    @NScache.cached("NSdifference")
     def NSdifference(self, nset):
         """ Calculates and returns the neutrosophic difference of the current set with the second one
         passed as parameter.
@@ -434,16 +1582,25 @@ class NSset:
         ----
         Returns: the neutrosophic difference of the current neutrosophic set with the second one
         """
-        if self.getUniverse() != nset.getUniverse():
+        nset = NSset.__evaluated(nset)
+        if self.__universe != nset.__universe:   # confronto in tempo costante tra universi condivisi
             raise ValueError("the two neutrosophic sets cannot be defined on different universe sets")
-        C = NSset(self.__universe)
-        for e in self.getUniverse():
-            (muA, sigmaA, omegaA) = self.getElement(e)
-            (muB, sigmaB, omegaB) = nset.getElement(e)
-            #----
-            triple = [min(muA, omegaB), min(sigmaA, 1 - sigmaB), max(omegaA, muB)]   # i.e. (muC, sigmaC, omegaC)
-            C.setElement(e, triple)
-        return C
+        if self.__default is not None:
+            if nset.__default is not None:
+                op = lambda a, b: [float(min(a[0], b[2])), float(min(a[1], 1 - b[1])), float(max(a[2], b[0]))]
+                return self.__sparseOperation(nset, op)
+            return self.__densified(nset.__isArray()).NSdifference(nset)
+        A = self.__degrees
+        B = self.__degreesOf(nset)
+        if self.__isArray():
+            degrees = np.empty_like(A)
+            np.minimum(A[:, 0], B[:, 2], out=degrees[:, 0])
+            np.minimum(A[:, 1], 1 - B[:, 1], out=degrees[:, 1])
+            np.maximum(A[:, 2], B[:, 0], out=degrees[:, 2])
+        else:
+            degrees = [[float(min(muA, omegaB)), float(min(sigmaA, 1 - sigmaB)), float(max(omegaA, muB))]   # i.e. (muC, sigmaC, omegaC)
+                       for (muA, sigmaA, omegaA), (muB, sigmaB, omegaB) in zip(A, B)]
+        return self.__newSet(degrees)
 
 
     #------------------------------------------------------------------------------------
@@ -458,9 +1615,14 @@ class NSset:
         ----
         Returns: True if the current neutrosophic set neutrosofically coincides with the second one
         """
-        if self.getUniverse() != nset.getUniverse():
+        nset = NSset.__evaluated(nset)
+        if self.__universe != nset.__universe:   # confronto in tempo costante tra universi condivisi
             raise ValueError("the two neutrosophic sets cannot be defined on different universe sets")
-        equal = self.isNSsubset(nset) and nset.isNSsubset(self)
+        if self.__fingerprint is not None and nset.__fingerprint is not None and self.__fingerprint != nset.__fingerprint:
+            return False   # impronte diverse (già calcolate) implicano insiemi diversi
+        if self.__default is None and nset.__default is None and not self.__isArray() and not nset.__isArray():
+            return self.__degrees == nset.__degrees   # confronto tra liste che si ferma alla prima tripla diversa
+        equal = self.__allPairs(nset, lambda a, b: a == b, lambda A, B: bool(np.array_equal(A, B)))
         return equal
 
 
@@ -474,18 +1636,75 @@ class NSset:
         ----
         Returns: True if the current neutrosophic set neutrosofically is different from the second one
         """
-        if self.getUniverse() != nset.getUniverse():
+        nset = NSset.__evaluated(nset)
+        if self.__universe != nset.__universe:   # confronto in tempo costante tra universi condivisi
             raise ValueError("the two neutrosophic sets cannot be defined on different universe sets")
         different = not (self == nset)
         return different
 
 
+    # restituisce l'impronta a 64 bit del contenuto dell'insieme neutrosofico
+    def fingerprint(self):
+        """
+        Method that returns a 64-bit fingerprint of the universe and of the degrees of the neutrosophic set:
+        equal neutrosophic sets (also with different storages) have the same fingerprint, which is the same
+        in every process. It is computed at the first request and then updated in constant time by the
+        methods setMembership, setIndeterminacy, setNonMembership and setElement.
+        Sets adopting external buffers (fromArrays, fromMatrix) must not be modified through them.
+        ----
+        Returns: the fingerprint as an integer in [0, 2^64)
+        """
+        if self.__fingerprint is None:
+            self.__fingerprint = self.__contentHash()
+        return self.__fingerprint ^ self.__universe.fingerprint()
+
+
+    # metodo privato che calcola la somma pesata degli hash delle triple
+    def __contentHash(self):
+        """ private method that returns the sum modulo 2^64 of the hashes of the triples of all the elements
+        multiplied by the weights of their positions; for a sparse set the contribution of the default
+        triple is computed at once, since the weights are summed separately.
+        ----
+        Returns: the sum as an integer in [0, 2^64)
+        """
+        n = self.cardinality()
+        if self.__default is not None:
+            default = NStripleHash(self.__default)
+            weights = NSpositionWeights(n)
+            total = NSweightSum(n) * default
+            for k, triple in self.__degrees.items():
+                total += int(weights[k]) * (NStripleHash(triple) - default)
+            return total & NS_MASK64
+        if np is not None:
+            return NSweightedSum(NStripleHashes(self.__degrees))
+        cache = dict()   # i gradi si ripetono spesso: ogni tripla distinta viene codificata una sola volta
+        hashes = list()
+        for triple in self.__degrees:
+            key = tuple(triple)
+            if key not in cache:
+                cache[key] = NStripleHash(key)
+            hashes.append(cache[key])
+        return NSweightedSum(hashes)
+
+
+    # restituisce l'hash dell'insieme neutrosofico col metodo speciale __hash__
+    def __hash__(self):
+        """ Method that returns the hash of the neutrosophic set, derived from its fingerprint, so that
+        it can be used as a key of dictionaries or as an element of sets (it must not be modified meanwhile).
+        ----
+        Returns: the hash of the current neutrosophic set
+        """
+        return hash(self.fingerprint())
+
+
     #--------------------------
 
     # operatore unione (+) con overloading sul metodo __add__
     def __add__(self, nset):
         """ neutrosophic union
         """
+        if NSset.lazy or isinstance(nset, NSexpression):
+            return NSexpression(self) + nset
         return self.NSunion(nset)
 
 
@@ -493,6 +1712,8 @@ class NSset:
     def __and__(self, nset):
         """ neutrosophic intersection
         """
+        if NSset.lazy or isinstance(nset, NSexpression):
+            return NSexpression(self) & nset
         return self.NSintersection(nset)
 
 
@@ -500,6 +1721,8 @@ class NSset:
     def __invert__(self):
         """ neutrosophic complement
         """
+        if NSset.lazy:
+            return ~NSexpression(self)
         return self.NScomplement()
 
 
@@ -507,6 +1730,8 @@ class NSset:
     def __sub__(self, nset):
         """ neutrosophic difference
         """
+        if NSset.lazy or isinstance(nset, NSexpression):
+            return NSexpression(self) - nset
         return self.NSdifference(nset)
 
 
@@ -539,23 +1764,115 @@ class NSset:
         Returns: string containing a table representing the degree of membership, indeterminacy and
                  non-membership of every element of the neutrosophic set
         """
+        s = "\n".join(self.iterLines(tabularFormat))   # le righe sono prodotte in tempo lineare
+        return s
+
+
+    # restituisce una per volta le righe della rappresentazione testuale dell'insieme neutrosofico
+    def iterLines(self, tabularFormat=False, limit=None):
+        """ Method that generates one at a time the lines of the textual representation of the neutrosophic set,
+        in linear time and without building the whole text.
+        ----
+        Parameters:
+        - tabularFormat: False (default) for the simplified format, True for the tabular one
+        - limit: maximum number of elements to show (the first and the last ones) or None (default) to show all of them
+        ----
+        Returns: an iterator of the lines (without line terminators) whose join by newlines gives str(self)
+        """
+        n = self.cardinality()
+        if limit is not None and n > limit:   # anteprima troncata: primi ed ultimi elementi
+            head = (limit + 1) // 2
+            parts = [(0, head), (n - (limit - head), n)]
+        else:
+            parts = [(0, n)]
+        omitted = n - sum(stop - start for start, stop in parts)
         if tabularFormat == True:
-            # stampa in formato tabulare
             (dashes, elemwidth, valwidth) = ("-"*64, 10, 14)
-            s = "\n            |   membership   |  indeterminacy | non-membership |\n" + dashes + "\n"
-            for e in self.getUniverse():
-                (mu, sigma, omega) = self.getElement(e)
-                s += f" {str(e):{elemwidth}} | {mu:{valwidth}} | {sigma:{valwidth}} | {omega:{valwidth}} |\n"
-            s += dashes + "\n"
+            yield ""
+            yield "            |   membership   |  indeterminacy | non-membership |"
+            yield dashes
+            for i, (start, stop) in enumerate(parts):
+                if i > 0:
+                    yield f" ...({omitted} more)..."
+                for e, (mu, sigma, omega) in self.__items(start, stop):
+                    yield f" {str(e):{elemwidth}} | {mu:{valwidth}} | {sigma:{valwidth}} | {omega:{valwidth}} |"
+            yield dashes
+            yield ""
         else:
-            # stampa in formato semplificato
-            elems = []
-            for e in self.getUniverse():
-                (mu, sigma, omega) = self.getElement(e)
-                elems.append(f"{e}/({mu},{sigma},{omega})")
-            s = "< " + ", ".join(elems) + " >"
-            s = NSsplitText(s, self.reprmaxlength)
-        return s
+            yield from NSwrapWords(self.__words(parts, omitted), self.reprmaxlength)
+
+
+    # metodo privato che restituisce le parole della rappresentazione testuale semplificata
+    def __words(self, parts, omitted):
+        """ private method that generates the words (separated by spaces) of the simplified textual
+        representation of the elements of some ranges of the universe.
+        ----
+        Parameters:
+        - parts: list of the ranges (start, stop) of the positions of the elements to show
+        - omitted: number of elements not shown between two consecutive ranges
+        ----
+        Returns: an iterator of words
+        """
+        yield "<"
+        universe = self.__universe
+        last = parts[-1][1]   # l'ultimo elemento mostrato non è seguito dalla virgola
+        for i, (start, stop) in enumerate(parts):
+            if i > 0:
+                yield f"...({omitted} more)...,"
+            for begin in range(start, stop, 4096):   # converte i gradi un blocco alla volta
+                end = min(begin + 4096, stop)
+                pieces = [f"{e}/({mu},{sigma},{omega})," for e, (mu, sigma, omega) in zip(universe[begin:end], self.__triples(begin, end))]
+                if end == last:
+                    pieces[-1] = pieces[-1][:-1]
+                yield from " ".join(pieces).split()
+        yield ">"
+
+
+    # metodo privato che restituisce gli elementi di un intervallo di posizioni con le loro triple
+    def __items(self, start, stop, chunksize=4096):
+        """ private method that generates the elements of a range of positions of the universe together with
+        their triples, converting the degrees one chunk at a time.
+        ----
+        Parameters:
+        - start, stop: range of the positions of the elements
+        - chunksize: number of triples converted at a time (default 4096)
+        ----
+        Returns: an iterator of pairs (element, triple)
+        """
+        universe = self.__universe
+        for begin in range(start, stop, chunksize):
+            end = min(begin + chunksize, stop)
+            yield from zip(universe[begin:end], self.__triples(begin, end))
+
+
+    # metodo privato che restituisce le triple di un intervallo di posizioni
+    def __triples(self, start, stop):
+        """ private method that returns the triples of the elements of a range of positions of the universe.
+        ----
+        Parameters:
+        - start, stop: range of the positions of the elements
+        ----
+        Returns: the list of the triples [mu, sigma, omega]
+        """
+        if self.__default is not None:
+            return [self.__degrees.get(k, self.__default) for k in range(start, stop)]
+        elif self.__isArray():
+            return self.__degrees[start:stop].tolist()
+        return self.__degrees[start:stop]
+
+
+    # scrive la rappresentazione testuale dell'insieme neutrosofico su un flusso
+    def write(self, stream, tabularFormat=False, limit=None):
+        """ Method that writes the textual representation of the neutrosophic set to a file-like object
+        one line at a time (as print does, the text is followed by a newline).
+        ----
+        Parameters:
+        - stream: text file object
+        - tabularFormat: False (default) for the simplified format, True for the tabular one
+        - limit: maximum number of elements to show or None (default) to show all of them
+        """
+        for line in self.iterLines(tabularFormat, limit):
+            stream.write(line + "\n")
 
 
     # metodo privato per la stampa formattata
@@ -583,6 +1900,12 @@ class NSset:
         """ Method that returns the neutrosophic set in string format for other implementations
         (e.g., for use in other classes).
         ----
-        Returns: a detailed representation of the current neutrosophic set
+        Returns: a detailed representation of the current neutrosophic set, showing
+        at most reprelements elements (the first and the last ones)
         """
-        return f"Neutrosophic set: {str(self)}"
\ No newline at end of file
+        preview = "\n".join(self.iterLines(limit=self.reprelements))
+        return f"Neutrosophic set: {preview}"
+
+
+# importato alla fine del modulo perché ns_expression utilizza la classe NSset
+from .ns_expression import NSexpression
@@ -0,0 +1,565 @@
+from math import isqrt
+#--
+from .ns_set import NSset
+from .ns_util import NStripleHashes, NSpositionWeights
+#--
+try:
+    import numpy as np
+except ImportError:   # numpy è una dipendenza opzionale richiesta solo dal motore colonnare
+    np = None
+
+class NStopology:
+    """
+    Package Python Neutrosophic Sets (PYNS)
+    ns_topology.py
+    Class that defines a family of distinct neutrosophic sets over a given universe and verifies
+    if it is a neutrosophic topology, or generates the neutrosophic topology of a subbase
+    ----------------------------------------------------------------------------------
+    author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+    www.nordo.it   |  giorgio.nordo@unime.it
+    """
+
+    #------------------ variabili di classe
+    blockelements = 1 << 18   # massimo numero di gradi combinati alla volta nelle verifiche di chiusura
+    tileheight = 16           # numero di membri consecutivi combinati alla volta con tutti i precedenti
+    memoentries = 4096        # massimo numero di risultati memorizzati di interior, closure e boundary
+
+    # costruttore
+    def __init__(self, nsets):
+        """
+        Constructor of the family of the distinct neutrosophic sets of a given family defined on the same universe:
+        the members having the same degrees are stored only once, recognized by a hash of their content.
+        ----
+        Parameters:
+        - nsets: iterable (e.g. list or generator) of neutrosophic sets
+        """
+        nsets = list(nsets)
+        if len(nsets) == 0:
+            raise ValueError("the family of neutrosophic sets cannot be empty")
+        self.__setup(NStopology.__universeOf(nsets))
+        self.__insert(self.__stack(nsets))
+
+
+    # metodo privato che controlla i membri di una famiglia e ne restituisce l'universo comune
+    @staticmethod
+    def __universeOf(nsets):
+        """ private method that checks that all the members of a non-empty family are neutrosophic sets
+        defined on the same universe.
+        ----
+        Parameters:
+        - nsets: list of neutrosophic sets
+        ----
+        Returns: the universe set object of the family
+        """
+        for nset in nsets:   # i tipi vanno controllati prima di leggere l'universo del primo membro
+            if not isinstance(nset, NSset):
+                raise ValueError("the members of a neutrosophic topology must be neutrosophic sets")
+        universe = nsets[0].getUniverseSet()
+        for nset in nsets:
+            if nset.getUniverseSet() != universe:   # confronto in tempo costante tra universi condivisi
+                raise ValueError("the neutrosophic sets cannot be defined on different universe sets")
+        return universe
+
+
+    # metodo privato che inizializza la famiglia vuota
+    def __setup(self, universe):
+        """ private method that initializes an empty family of neutrosophic sets on a universe.
+        ----
+        Parameters:
+        - universe: universe set object
+        """
+        n = universe.cardinality()
+        self.__universe = universe
+        self.__keys = dict()        # chiave del contenuto -> posizione del membro
+        self.__count = 0
+        self.__closedsets = None    # complementari dei membri, calcolati alla prima chiusura richiesta
+        self.__memo = dict()        # (operazione, chiave dell'insieme) -> (gradi dell'insieme, gradi del risultato)
+        if np is not None:
+            self.__members = np.empty((16, 3, n), dtype=np.float64)   # una riga per grado, capacità raddoppiata quando necessario
+            self.__collisions = list()   # posizioni dei membri con l'impronta a 64 bit di un altro membro
+        else:
+            self.__members = list()
+
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che impila i gradi di una famiglia di insiemi neutrosofici
+    def __stack(self, nsets):
+        """ private method that returns the degrees of a family of neutrosophic sets in the storage of the family.
+        ----
+        Parameters:
+        - nsets: list of neutrosophic sets
+        ----
+        Returns: an (N,3,n) numpy array (so that each degree is contiguous) or a list of N tuples of n triples
+        """
+        if np is not None:
+            block = np.empty((len(nsets), 3, self.__universe.cardinality()), dtype=np.float64)
+            for k, nset in enumerate(nsets):
+                block[k] = nset.toArray().T
+            return block + 0.0   # lo zero negativo diventa zero
+        return [tuple(tuple(float(x) + 0.0 for x in triple) for triple in nset.getDegrees()) for nset in nsets]
+
+
+    # metodo privato che restituisce le chiavi del contenuto di un blocco di insiemi neutrosofici
+    def __keysOf(self, block):
+        """ private method that returns the keys identifying the content of a block of neutrosophic sets:
+        with numpy their 64-bit fingerprints (see NSset.fingerprint), otherwise the triples themselves.
+        ----
+        Parameters:
+        - block: (q,3,n) numpy array or list of q tuples of triples
+        ----
+        Returns: the list of the q keys
+        """
+        if np is not None:
+            hashes = NStripleHashes(block, axis=1)
+            hashes *= NSpositionWeights(block.shape[2])
+            keys = hashes.sum(axis=1, dtype=np.uint64) ^ np.uint64(self.__universe.fingerprint())
+            return keys.tolist()
+        return block
+
+
+    # metodo privato che cerca i membri uguali agli insiemi neutrosofici di un blocco
+    def __find(self, block, keys):
+        """ private method that returns, for each neutrosophic set of a block, the position of the equal member.
+        ----
+        Parameters:
+        - block: (q,3,n) numpy array or list of q tuples of triples
+        - keys: keys of the content of the block
+        ----
+        Returns: the list of the positions of the equal members, or -1 for the sets which are not members
+        """
+        positions = [self.__keys.get(key, -1) for key in keys]
+        if np is None:
+            return positions
+        positions = np.array(positions, dtype=np.intp)
+        found = positions >= 0
+        if found.all():   # verifica esatta dei gradi dei membri con la stessa chiave
+            found = np.all(block == self.__members[positions], axis=(1, 2))
+        elif found.any():
+            found[found] = np.all(block[found] == self.__members[positions[found]], axis=(1, 2))
+        positions[~found] = -1
+        if self.__collisions:
+            for r in np.flatnonzero(~found):
+                for q in self.__collisions:
+                    if np.array_equal(block[r], self.__members[q]):
+                        positions[r] = q
+                        break
+        return positions.tolist()
+
+
+    # metodo privato che aggiunge alla famiglia un insieme neutrosofico se non è già un membro
+    def __append(self, row, key):
+        """ private method that adds a neutrosophic set to the family unless it is already a member.
+        ----
+        Parameters:
+        - row: (3,n) numpy array or tuple of triples of the degrees
+        - key: key of the content of row
+        ----
+        Returns: True if the set has been added
+        """
+        position = self.__keys.get(key)
+        if position is not None:
+            if np is None or np.array_equal(self.__members[position], row):
+                return False
+            if any(np.array_equal(self.__members[q], row) for q in self.__collisions):
+                return False
+            self.__collisions.append(self.__count)
+        else:
+            self.__keys[key] = self.__count
+        self.__closedsets = None   # la famiglia cambia: i dati precalcolati non sono più validi
+        self.__memo.clear()
+        if np is not None:
+            if self.__count == len(self.__members):
+                members = np.empty((2 * self.__count,) + self.__members.shape[1:], dtype=np.float64)
+                members[:self.__count] = self.__members
+                self.__members = members
+            self.__members[self.__count] = row
+        else:
+            self.__members.append(row)
+        self.__count += 1
+        return True
+
+
+    # metodo privato che aggiunge alla famiglia gli insiemi neutrosofici di un blocco che non sono già membri
+    def __insert(self, block):
+        """ private method that adds to the family the neutrosophic sets of a block which are not already members.
+        ----
+        Parameters:
+        - block: (q,3,n) numpy array or list of q tuples of triples
+        ----
+        Returns: the number of added members
+        """
+        keys = self.__keysOf(block)
+        added = 0
+        for r, position in enumerate(self.__find(block, keys)):
+            if position < 0 and self.__append(block[r], keys[r]):
+                added += 1
+        return added
+
+
+    # metodo privato che combina a coppie i membri di due intervalli di posizioni
+    def __combine(self, rows, columns, union):
+        """ private method that returns the neutrosophic unions or intersections of every member
+        of a range of positions with every member of a second range.
+        ----
+        Parameters:
+        - rows, columns: the two ranges of positions of the members
+        - union: True for the unions, False for the intersections
+        ----
+        Returns: a (len(rows)*len(columns),3,n) numpy array or a list of tuples of triples
+        """
+        M = self.__members
+        if np is not None:
+            f, g = (np.maximum, np.minimum) if union else (np.minimum, np.maximum)
+            A, B = M[rows.start:rows.stop, None], M[None, columns.start:columns.stop]
+            block = np.empty((len(rows), len(columns)) + M.shape[1:], dtype=np.float64)
+            f(A[:, :, :2], B[:, :, :2], out=block[:, :, :2])
+            g(A[:, :, 2], B[:, :, 2], out=block[:, :, 2])
+            return block.reshape((-1,) + M.shape[1:])
+        f, g = (max, min) if union else (min, max)
+        return [tuple((f(a[0], b[0]), f(a[1], b[1]), g(a[2], b[2])) for a, b in zip(M[i], M[j]))
+                for i in rows for j in columns]
+
+
+    # metodo privato che genera i blocchi di coppie di membri da combinare
+    def __tiles(self, start):
+        """ private method that generates tiles of pairs of members, made of a few consecutive members and
+        a range of previous ones, such that every pair of positions p <= q with q >= start belongs to a tile
+        and the number of degrees combined at a time is bounded by the class variable blockelements.
+        New members added while the tiles are generated are included.
+        ----
+        Parameters:
+        - start: first position of the members to combine with all the previous ones
+        ----
+        Returns: an iterator of pairs of ranges of positions
+        """
+        size = max(1, NStopology.blockelements // max(1, 3 * self.__universe.cardinality()))
+        height = max(1, min(NStopology.tileheight, size))
+        while start < self.__count:
+            rows = range(start, min(start + height, self.__count))
+            width = max(1, size // len(rows))
+            for first in range(0, rows.stop, width):   # coppie con i membri precedenti e con quelli del blocco
+                yield rows, range(first, min(first + width, rows.stop))
+            start = rows.stop
+
+
+    # metodo privato che verifica se la famiglia è chiusa rispetto all'unione o all'intersezione
+    def __isClosed(self, union):
+        """ private method that checks if the family is closed under the neutrosophic union or intersection
+        of any two members, stopping at the first tile containing a pair whose result is not a member.
+        ----
+        Parameters:
+        - union: True for the union, False for the intersection
+        ----
+        Returns: True if the family is closed
+        """
+        for rows, columns in self.__tiles(1):
+            block = self.__combine(rows, columns, union)
+            if min(self.__find(block, self.__keysOf(block))) < 0:
+                return False
+        return True
+
+
+    # metodo privato che chiude la famiglia rispetto all'unione o all'intersezione
+    def __close(self, union, limit):
+        """ private method that adds to the family the neutrosophic unions or intersections of its members
+        until it is closed, combining every new member with all the previous ones.
+        ----
+        Parameters:
+        - union: True for the union, False for the intersection
+        - limit: maximum number of members or None
+        """
+        for rows, columns in self.__tiles(1):
+            self.__insert(self.__combine(rows, columns, union))
+            if limit is not None and self.__count > limit:
+                raise ValueError(f"the generated family has more than {limit} neutrosophic sets")
+
+
+    #------------------------------------------------------------------------------------
+
+    # restituisce la topologia neutrosofica generata da una sottobase
+    @staticmethod
+    def generatedBy(subbase, limit=None):
+        """ Generates the neutrosophic topology having a given family of neutrosophic sets as subbase, i.e. the
+        unions of the finite intersections of its members, together with the empty and the absolute sets.
+        ----
+        Parameters:
+        - subbase: iterable (e.g. list or generator) of neutrosophic sets defined on the same universe
+        - limit: maximum number of open sets (default None: no limit); if it is exceeded a ValueError is raised
+        ----
+        Returns: the NStopology object of the generated neutrosophic topology
+        """
+        subbase = list(subbase)
+        if len(subbase) == 0:
+            raise ValueError("the subbase cannot be empty")
+        universe = NStopology.__universeOf(subbase)
+        absolute = NSset(universe)
+        absolute.setAbsolute()
+        topology = NStopology(subbase + [absolute])   # l'intersezione della famiglia vuota è l'insieme assoluto
+        topology.__close(False, limit)   # base: intersezioni finite
+        topology.__insert(topology.__stack([NSset(universe)]))
+        topology.__close(True, limit)    # la chiusura rispetto all'unione conserva quella rispetto all'intersezione
+        return topology
+
+
+    # restituisce l'universo come oggetto insieme universo
+    def getUniverseSet(self):
+        """
+        Method that returns the universe set of the neutrosophic sets of the family.
+        ----
+        Returns: the universe set object
+        """
+        return self.__universe
+
+
+    # restituisce il numero di insiemi neutrosofici distinti della famiglia
+    def cardinality(self):
+        """
+        Method that returns the number of distinct neutrosophic sets of the family.
+        ----
+        Returns: the number of members
+        """
+        return self.__count
+
+
+    # restituisce gli insiemi neutrosofici distinti della famiglia
+    def getMembers(self):
+        """
+        Method that returns the distinct neutrosophic sets of the family, as new independent objects.
+        ----
+        Returns: the list of the members
+        """
+        return [self.__toSet(self.__members[k]) for k in range(self.__count)]
+
+
+    # metodo privato che crea un nuovo insieme neutrosofico a partire dai gradi memorizzati
+    def __toSet(self, row):
+        """ private method that returns a new neutrosophic set with the given degrees.
+        ----
+        Parameters:
+        - row: (3,n) numpy array or tuple of triples of the degrees
+        ----
+        Returns: the new independent neutrosophic set
+        """
+        if np is not None:
+            return NSset.fromMatrix(self.__universe, row.T.copy())
+        return NSset(self.__universe, [list(triple) for triple in row])
+
+
+    # restituisce True se un insieme neutrosofico appartiene alla famiglia
+    def contains(self, nset):
+        """
+        Method that checks if a neutrosophic set is a member of the family.
+        ----
+        Parameters:
+        - nset: neutrosophic set
+        ----
+        Returns: True if a member of the family is equal to nset
+        """
+        if nset.getUniverseSet() != self.__universe:
+            raise ValueError("the neutrosophic set cannot be defined on a different universe set")
+        block = self.__stack([nset])
+        return self.__find(block, self.__keysOf(block))[0] >= 0
+
+
+    #------------------------------------------------------------------------------------
+
+    # metodo privato che restituisce i complementari dei membri della famiglia
+    def __closedSets(self):
+        """ private method that returns the neutrosophic complements of the members of the family
+        (the closed sets of the topology), computing them only once.
+        ----
+        Returns: an (N,3,n) numpy array or a list of tuples of triples
+        """
+        if self.__closedsets is None:
+            M = self.__members
+            if np is not None:
+                closed = np.empty((self.__count,) + M.shape[1:], dtype=np.float64)
+                closed[:, 0] = M[:self.__count, 2]
+                np.subtract(1, M[:self.__count, 1], out=closed[:, 1])
+                closed[:, 2] = M[:self.__count, 0]
+            else:
+                closed = [NStopology.__complement(row) for row in M]
+            self.__closedsets = closed
+        return self.__closedsets
+
+
+    # metodo privato che restituisce i gradi del complementare neutrosofico
+    @staticmethod
+    def __complement(row):
+        """ private method that returns the degrees of the neutrosophic complement of a set.
+        ----
+        Parameters:
+        - row: (3,n) numpy array or tuple of triples of the degrees
+        ----
+        Returns: the degrees of the complement, in the same format
+        """
+        if np is not None:
+            return np.stack([row[2], 1 - row[1], row[0]])
+        return tuple((float(omega), float(1 - sigma), float(mu)) for mu, sigma, omega in row)
+
+
+    # metodo privato che calcola l'interno o la chiusura di un insieme neutrosofico
+    def __hull(self, row, closure):
+        """ private method that returns the union of the members contained in a neutrosophic set (its interior)
+        or the intersection of the complements of the members containing it (its closure):
+        the members are filtered by a vectorized containment test and then reduced at once.
+        ----
+        Parameters:
+        - row: (3,n) numpy array or tuple of triples of the degrees of the neutrosophic set
+        - closure: False for the interior, True for the closure
+        ----
+        Returns: the degrees of the interior or of the closure, in the same format of row
+        """
+        M = self.__closedSets() if closure else self.__members
+        if np is None:
+            if closure:   # complementari contenenti l'insieme
+                selected = [F for F in M if all(a[0] <= b[0] and a[1] <= b[1] and a[2] >= b[2] for a, b in zip(row, F))]
+                return tuple((min((F[i][0] for F in selected), default=1.0), min((F[i][1] for F in selected), default=1.0),
+                              max((F[i][2] for F in selected), default=0.0)) for i in range(len(row)))
+            selected = [G for G in M if all(a[0] <= b[0] and a[1] <= b[1] and a[2] >= b[2] for a, b in zip(G, row))]
+            return tuple((max((G[i][0] for G in selected), default=0.0), max((G[i][1] for G in selected), default=0.0),
+                          min((G[i][2] for G in selected), default=1.0)) for i in range(len(row)))
+        M = M[:self.__count]
+        selected = np.empty(self.__count, dtype=bool)
+        step = max(1, NStopology.blockelements // max(1, row.size))
+        for start in range(0, self.__count, step):   # filtro di contenimento a blocchi di membri
+            B = M[start:start + step]
+            if closure:
+                selected[start:start + step] = np.all(B[:, :2] >= row[:2], axis=(1, 2)) & np.all(B[:, 2] <= row[2], axis=1)
+            else:
+                selected[start:start + step] = np.all(B[:, :2] <= row[:2], axis=(1, 2)) & np.all(B[:, 2] >= row[2], axis=1)
+        result = np.empty_like(row)
+        low, high = (1.0, 0.0) if closure else (0.0, 1.0)   # valori della famiglia vuota (assoluto o vuoto)
+        first, second = (np.min, np.max) if closure else (np.max, np.min)
+        first(M[:, :2], axis=0, initial=low, where=selected[:, None, None], out=result[:2])
+        second(M[:, 2], axis=0, initial=high, where=selected[:, None], out=result[2])
+        return result
+
+
+    # metodo privato che restituisce il risultato memorizzato di un operatore o lo calcola
+    def __memoized(self, operation, nset, compute):
+        """ private method that returns the result of an operator on a neutrosophic set, computing it
+        only if it is not stored for a set with the same fingerprint and degrees.
+        ----
+        Parameters:
+        - operation: name of the operator
+        - nset: neutrosophic set
+        - compute: function which returns the degrees of the result from those of the neutrosophic set
+        ----
+        Returns: the new neutrosophic set with the result
+        """
+        if nset.getUniverseSet() != self.__universe:   # confronto in tempo costante tra universi condivisi
+            raise ValueError("the neutrosophic set cannot be defined on a different universe set")
+        block = self.__stack([nset])
+        key = (operation, nset.fingerprint())
+        entry = self.__memo.get(key)
+        if entry is None or not (np.array_equal(entry[0], block[0]) if np is not None else entry[0] == block[0]):
+            entry = (block[0], compute(block[0]))
+            if len(self.__memo) >= NStopology.memoentries:
+                del self.__memo[next(iter(self.__memo))]   # elimina il risultato memorizzato da più tempo
+            self.__memo[key] = entry
+        return self.__toSet(entry[1])
+
+
+    # interno di un insieme neutrosofico
+    def interior(self, nset):
+        """
+        Method that calculates the neutrosophic interior of a neutrosophic set, i.e. the union of the
+        members of the family (open sets) contained in it.
+        ----
+        Parameters:
+        - nset: neutrosophic set
+        ----
+        Returns: the neutrosophic interior of nset
+        """
+        return self.__memoized("interior", nset, lambda row: self.__hull(row, False))
+
+
+    # chiusura di un insieme neutrosofico
+    def closure(self, nset):
+        """
+        Method that calculates the neutrosophic closure of a neutrosophic set, i.e. the intersection of the
+        complements of the members of the family (closed sets) containing it.
+        ----
+        Parameters:
+        - nset: neutrosophic set
+        ----
+        Returns: the neutrosophic closure of nset
+        """
+        return self.__memoized("closure", nset, lambda row: self.__hull(row, True))
+
+
+    # frontiera di un insieme neutrosofico
+    def boundary(self, nset):
+        """
+        Method that calculates the neutrosophic boundary of a neutrosophic set, i.e. the intersection
+        of its closure with the closure of its complement.
+        ----
+        Parameters:
+        - nset: neutrosophic set
+        ----
+        Returns: the neutrosophic boundary of nset
+        """
+        return self.__memoized("boundary", nset, self.__boundary)
+
+
+    # metodo privato che calcola la frontiera di un insieme neutrosofico
+    def __boundary(self, row):
+        """ private method that returns the degrees of the neutrosophic boundary of a set.
+        ----
+        Parameters:
+        - row: (3,n) numpy array or tuple of triples of the degrees
+        ----
+        Returns: the degrees of the boundary, in the same format
+        """
+        A = self.__hull(row, True)
+        B = self.__hull(NStopology.__complement(row), True)
+        if np is not None:
+            return np.stack([np.minimum(A[0], B[0]), np.minimum(A[1], B[1]), np.maximum(A[2], B[2])])
+        return tuple((min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2])) for a, b in zip(A, B))
+
+
+    # restituisce True se la famiglia è chiusa rispetto all'unione
+    def isUnionClosed(self):
+        """
+        Method that checks if the neutrosophic union of any two members of the family is a member
+        (for a finite family this is equivalent to the closure under arbitrary unions).
+        ----
+        Returns: True if the family is closed under neutrosophic union
+        """
+        return self.__isClosed(True)
+
+
+    # restituisce True se la famiglia è chiusa rispetto all'intersezione
+    def isIntersectionClosed(self):
+        """
+        Method that checks if the neutrosophic intersection of any two members of the family is a member
+        (which is equivalent to the closure under finite intersections).
+        ----
+        Returns: True if the family is closed under neutrosophic intersection
+        """
+        return self.__isClosed(False)
+
+
+    # restituisce True se la famiglia è una topologia neutrosofica
+    def isTopology(self):
+        """
+        Method that checks if the family is a neutrosophic topology, i.e. if it contains the empty
+        and the absolute neutrosophic sets and it is closed under unions and finite intersections.
+        ----
+        Returns: True if the family is a neutrosophic topology
+        """
+        empty = NSset(self.__universe)
+        absolute = NSset(self.__universe)
+        absolute.setAbsolute()
+        return self.contains(empty) and self.contains(absolute) and self.__isClosed(False) and self.__isClosed(True)
+
+
+    # restituisce la rappresentazione testuale della famiglia col metodo speciale __str__
+    def __str__(self):
+        """ Method that returns the members of the family, one for each line.
+        ----
+        Returns: string containing the members of the family
+        """
+        return "\n".join(str(member) for member in self.getMembers())
@@ -1,4 +1,7 @@
-from .ns_util import NSreplace
+from threading import Lock
+from weakref import WeakValueDictionary
+#----
+from .ns_util import NSstringToList, NStextFingerprint
 
 class NSuniverse:
     """
@@ -10,14 +13,53 @@ class NSuniverse:
     www.nordo.it   |  giorgio.nordo@unime.it
     """
 
+    #------------------ variabili di classe
+    # registro degli universi esistenti: universi uguali sono rappresentati da un unico oggetto immutabile
+    # condiviso da tutti gli insiemi neutrosofici e le funzioni che li utilizzano
+    __registry = WeakValueDictionary()
+    __registrylock = Lock()
+    reprelements = 20    # massimo numero di elementi mostrati (i primi e gli ultimi) dalla rappresentazione __repr__
+
     # costruttore
-    def __init__(self, *args):
+    def __new__(cls, *args):
         """
         Generic constructor of a universe which accepts list, tuple, string,
         list of af values, or other universe object.
+        Universe sets are immutable and interned, i.e. equal universe sets are the same object.
+        ----
+        Parameters:
+        - args: generic argument (list, tuple, string, list of values or an universe object)
+        """
+        if len(args) == 1 and type(args[0]) == NSuniverse:   # un universo esistente viene condiviso e non copiato
+            return args[0]
+        universe = tuple(NSuniverse.__elements(args))
+        with NSuniverse.__registrylock:
+            unv = NSuniverse.__registry.get(universe)
+            if unv is None:
+                # costruisce la tabella di corrispondenza elemento -> posizione e, con essa,
+                # controlla che non siano stati assegnati elementi ripetuti
+                index = {e: i for i, e in enumerate(universe)}
+                if len(universe) != len(index):
+                    raise ValueError("the universe set cannot contain repeated elements")
+                # memorizza i valori ottenuti nelle proprietà dell'oggetto
+                unv = super().__new__(cls)
+                unv.__universe = universe
+                unv.__index = index
+                unv.__hash = hash(universe)
+                unv.__fingerprint = None   # calcolata alla prima richiesta
+                NSuniverse.__registry[universe] = unv
+        return unv
+
+
+    # metodo privato che ricava la lista degli elementi dagli argomenti del costruttore
+    @staticmethod
+    def __elements(args):
+        """ private method that returns the elements of a universe from the arguments of the constructor.
         ----
         Parameters:
         - args: generic argument (list, tuple, string, list of values or an universe object)
+        ----
+        Returns: the list of the elements of the universe as strings
         """
         universe = list()   # lista di stringhe
         #--------------------
@@ -31,9 +73,7 @@ class NSuniverse:
             elif type(elem) == NSuniverse:
                 universe = elem.get()
             elif type(elem) == str:
-                sostituz = { "{":"", "}":"", "[":"", "]":"", "(":"", ")":"",
-                             ",":" ", ";":" " }
-                universe = NSreplace(elem, sostituz).split()
+                universe = NSstringToList(elem)
             elif type(elem) == set:
                 raise ValueError("type set is not suitable because the elements of the universe set must be assigned in a specific order")
             else:  # se si tratta di un solo elemento non di tipo stringa
@@ -41,12 +81,14 @@ class NSuniverse:
         else:   # se la lunghezza è maggiore di 1
             for i in range(length):
                 universe.append(str(args[i]))
-        # controlla che non siano stati assegnati elementi ripetuti
-        univset = set(universe)
-        if len(universe) != len(univset):
-            raise ValueError("the universe set cannot contain repeated elements")
-        # memorizza il valore ottenuto nella proprietà dell'oggetto
-        self.__universe = universe
+        return universe
+
+
+    # consente la copia e la serializzazione (pickle) passando per il registro degli universi
+    def __reduce__(self):
+        """ Method that allows copying and pickling of universe sets preserving their uniqueness.
+        """
+        return (NSuniverse, (list(self.__universe),))
 
 
     #------------------------------------------------------------------------------------
@@ -56,9 +98,9 @@ class NSuniverse:
         """
         Method that returns the universe as a list of strings.
         ----
-        Returns: list of the elements of the universe
+        Returns: new list of the elements of the universe
         """
-        return self.__universe
+        return list(self.__universe)
 
 
     # metodo che restituisce la cardinalità (il numero di elementi) dell'universo
@@ -70,6 +112,59 @@ class NSuniverse:
         """
         return len(self.__universe)
 
+
+    # restituisce True se l'elemento appartiene all'universo (in tempo costante)
+    def contains(self, u):
+        """
+        Checks if a given element belongs to the universe set.
+        ----
+        Parameters:
+        - u: generic element
+        ----
+        Returns: True if u is an element of the current universe set
+        """
+        return str(u) in self.__index
+
+
+    # restituisce la posizione dell'elemento nell'universo (in tempo costante)
+    def indexOf(self, u):
+        """
+        Method that returns the position of a given element in the universe set.
+        ----
+        Parameters:
+        - u: element of the universe
+        ----
+        Returns: the index of u in the ordered list of the elements of the universe
+        """
+        u = str(u)  # converte in stringa per confrontarla con gli elementi dell'universo che è lista di stringhe
+        if u not in self.__index:
+            raise IndexError("non-existent element")
+        return self.__index[u]
+
+
+    # operatore di appartenenza (in) con overloading sul metodo __contains__
+    def __contains__(self, u):
+        """ membership of an element to the universe set
+        """
+        return self.contains(u)
+
+
+    # accesso per posizione con overloading sul metodo __getitem__
+    def __getitem__(self, i):
+        """ element (or list of elements for a slice) of given position in the universe set
+        """
+        item = self.__universe[i]
+        if type(i) == slice:
+            item = list(item)
+        return item
+
+
+    # funzione len() con overloading sul metodo __len__
+    def __len__(self):
+        """ cardinality of the universe set
+        """
+        return len(self.__universe)
+
     #------------------------------------------------------------------------------------
 
     # restituisce True se l'insieme universo corrente è contenuto in quello
@@ -83,9 +178,7 @@ class NSuniverse:
         ----
         Returns: True if the current universe set is contained in the second one
         """
-        setself = set(self.get())
-        setunv = set(unv.get())
-        result = setself.issubset(setunv)
+        result = all(unv.contains(e) for e in self.__universe)
         return result
 
     #------------------------------------------------------------------------------------
@@ -94,13 +187,36 @@ class NSuniverse:
     # sovraccaricando l'operatore di uguaglianza == e restituisce True se sono uguali
     def __eq__(self, unv):
         """ Checks if the current universe is equal to another one.
+        Since equal universe sets are the same object, it is a constant time comparison.
         ----
         Returns: True if the universes are equal
         """
-        equal = (self.get() == unv.get())
+        equal = (self is unv)
         return equal
 
 
+    # restituisce l'hash dell'insieme universo (precalcolato alla sua creazione)
+    def __hash__(self):
+        """ Method that returns the hash of the universe set, so that it can be used as a key of dictionaries.
+        ----
+        Returns: the hash of the current universe set
+        """
+        return self.__hash
+
+
+    # restituisce l'impronta a 64 bit degli elementi dell'universo
+    def fingerprint(self):
+        """
+        Method that returns a 64-bit fingerprint of the elements of the universe set (in their order)
+        which, unlike its hash, is the same in every process.
+        ----
+        Returns: the fingerprint as an integer in [0, 2^64)
+        """
+        if self.__fingerprint is None:
+            self.__fingerprint = NStextFingerprint(self.__universe)
+        return self.__fingerprint
+
+
     # confronta due insiemi universo col metodo speciale __ne__
     # sovraccaricando l'operatore di non uguaglianza != e restituisce True se sono diversi
     def __ne__(self, unv):
@@ -116,24 +232,12 @@ class NSuniverse:
 
     #----------------- iteratore di oggetti NSuniverse
 
-    # definisce l'iteratore per l'oggetto insieme universo azzerando l'indice
+    # restituisce un iteratore sugli elementi dell'insieme universo
+    # (senza modificare l'oggetto, che è immutabile, e quindi anche per iterazioni annidate)
     def __iter__(self):
-        """ Method that initializes iterator on elements of the current universe set
+        """ Method that returns an iterator on elements of the current universe set
         """
-        self.__i = 0   # inizializza l'indice privato __i da usare come contatore
-        return self
-
-    # restituisce il prossimo elemento iterato dell'oggetto insieme universo
-    def __next__(self):
-        """ Method that returns the iterated element of the current universe set
-        ----
-        Returns: the element of index self.__i  of the universe set
-        """
-        if self.__i < len(self.__universe):    # se l'indice __i non eccede la lunghezza dell'insieme universo
-            elem = self.__universe[self.__i]  # preleva l'elemento di indice __i
-            self.__i +=1                       # incremente il contatore privato __i
-            return elem                        # e restituisce l'elemento
-        raise StopIteration                    # altrimenti interrompi l'iterazione
+        return iter(self.__universe)
 
 
     # ------------------------------------------------------------------------------------
@@ -144,8 +248,26 @@ class NSuniverse:
         ----
         Returns: string containing a list of the elements of the current universe set
         """
-        list_string_elements = [str(e) for e in self.__universe]
-        s = "{ " + ", ".join(list_string_elements) + " }"
+        s = "{ " + ", ".join(self.__universe) + " }"
+        return s
+
+
+    # restituisce l'universo come stringa mostrando al più un numero prefissato di elementi
+    def preview(self, limit):
+        """ Method that returns the universe in string format showing at most a given number of elements
+        (the first and the last ones) and the number of the omitted ones.
+        ----
+        Parameters:
+        - limit: maximum number of elements to show
+        ----
+        Returns: string containing a truncated list of the elements of the current universe set
+        """
+        n = len(self.__universe)
+        if n <= limit:
+            return str(self)
+        head = (limit + 1) // 2
+        elements = list(self.__universe[:head]) + [f"...({n - limit} more)..."] + list(self.__universe[n - (limit - head):])
+        s = "{ " + ", ".join(elements) + " }"
         return s
 
 
@@ -167,6 +289,7 @@ class NSuniverse:
         """ Method that returns the universe in string format for other implementations
             (e.g., for use in other classes).
         ----
-        Returns: a detailed representation of the current universe set
+        Returns: a detailed representation of the current universe set, showing
+        at most reprelements elements (the first and the last ones)
         """
-        return f"Universe set: {str(self)}"
\ No newline at end of file
+        return f"Universe set: {self.preview(self.reprelements)}"
\ No newline at end of file
@@ -1,5 +1,17 @@
-from re import findall
-from ast import literal_eval
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b
+from math import isqrt
+from mmap import mmap as MemoryMap, ACCESS_COPY
+from struct import Struct
+import sys
+#----
+try:
+    import numpy as np
+except ImportError:   # numpy è una dipendenza opzionale richiesta solo dal motore colonnare
+    np = None
 
 """
 Package Python Neutrosophic Sets (PYNS)
@@ -10,6 +22,42 @@ author: Giorgio Nordo - Dipartimento MIFT. Università di Messina, Italy
 www.nordo.it   |  giorgio.nordo@unime.it
 """
 
+#------------------ formato binario dei file di insiemi neutrosofici e funzioni
+BINARY_VERSION = 1
+BINARY_HEADER = Struct("<8sHHI")     # identificativo, versione, numero di sezioni, ordine dei byte little-endian
+BINARY_SECTION = Struct("<c7xQQQ")   # tipo della sezione, numero di valori, posizione e lunghezza in byte
+BINARY_ITEMSIZE = {"f": 4, "d": 8, "i": 4, "q": 8}
+
+#------------------ espressioni per la scansione delle stringhe in un'unica passata
+NS_TUPLE = re.compile(r"\(([^()\[\]]*)\)|\[([^()\[\]]*)\]")   # tupla tra parentesi tonde o quadre
+NS_BRACKET = re.compile(r"[()\[\]]")
+NS_NAME = r"(?:[^\s,;:|-]|-(?!>)|\|(?!->))+"   # chiave o valore (non contiene separatori e frecce)
+NS_COUPLE = re.compile(rf"[\s,;]*(?P<key>{NS_NAME})\s*(?:\|->|->|:)\s*(?P<value>{NS_NAME})")
+NS_SPACES = re.compile(r"[\s,;]*")
+NS_ARROW = re.compile(r"\s*:\s*")
+NS_SEPARATORS = str.maketrans(",;", "  ", "()[]{}")   # virgole e punti e virgola diventano spazi, le parentesi sono rimosse
+NS_QUOTES = str.maketrans("", "", "()[]{}'\"")
+
+#------------------ relazioni tra famiglie di insiemi neutrosofici impilate in un tensore (N,n,3)
+# ogni relazione confronta i gradi di due blocchi di insiemi X (k,1,b,3) e Y (1,h,b,3) elemento per elemento
+NS_RELATIONS = {
+    "inclusion": lambda X, Y: (X[..., 0] <= Y[..., 0]) & (X[..., 1] <= Y[..., 1]) & (X[..., 2] >= Y[..., 2]),
+    "equality": lambda X, Y: (X[..., 0] == Y[..., 0]) & (X[..., 1] == Y[..., 1]) & (X[..., 2] == Y[..., 2]),
+    "disjointness": lambda X, Y: (((X[..., 0] == 0) | (Y[..., 0] == 0)) & ((X[..., 1] == 0) | (Y[..., 1] == 0))
+                                  & ((X[..., 2] == 1) | (Y[..., 2] == 1))),
+}
+NS_SHARED = dict()   # tensore condiviso dai processi che calcolano le relazioni
+
+#------------------ impronte (fingerprint) a 64 bit del contenuto di universi, insiemi neutrosofici e funzioni
+# l'impronta di una sequenza di valori è sum(peso(i) * hash(valore_i)) mod 2^64, quindi si aggiorna
+# in tempo costante quando cambia un solo valore
+NS_MASK64 = (1 << 64) - 1
+NS_DEGREEKEYS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9)   # distinguono i tre gradi
+NS_POSITIONKEY = 0x27D4EB2F165667C5   # genera i pesi delle posizioni
+NS_VALUEKEY = 0x85EBCA77C2B2AE63      # distingue i valori delle funzioni
+NS_FLOAT = Struct("<d")
+NS_UINT64 = Struct("<Q")
+
 # rimpiazza le chiavi coi valori del dizionario nel testo passato
 def NSreplace(text, sostituz):
     """ returns the text string after performing all replacements
@@ -26,21 +74,83 @@ def NSreplace(text, sostituz):
     return text
 
 
-# converte una stringa in una tripla di liste
+# converte una stringa in una lista di triple
 def NSstringToTriplesList(text):
     """
-    Converts a string containing a list of tuples to the corresponding data structure
+    Converts a string containing a list of tuples (delimited by round or square brackets) to the
+    corresponding data structure, scanning the string only once and converting the degrees directly
+    into real numbers; the text outside the brackets (e.g. the names of the elements) is ignored.
     ----
     Parameters:
     - text: string
     Returns: the list of triples of real numbers
     """
-    pattern = r'\[.*?\]|\(.*?\)'  # usa le espressioni regolari per isolare le triple
-    str_list = findall(pattern, text)  # usa il modulo ast per convertire le strutture
-    tpl_list = [tuple(literal_eval(s)) for s in str_list]
+    tpl_list = list()
+    pos = 0
+    for match in NS_TUPLE.finditer(text):
+        NScheckBrackets(text, pos, match.start())
+        content = match.group(1) if match.group(1) is not None else match.group(2)
+        fields = content.split(",")
+        if len(fields) > 1 and fields[-1].strip() == "":   # ammette una virgola finale
+            fields.pop()
+        try:
+            tpl_list.append(tuple(map(float, fields)))
+        except ValueError:
+            start = match.start() + 1
+            for field in fields:   # individua il valore non valido per segnalarne la posizione
+                if not NSisNumber(field):
+                    raise ValueError(f"invalid number '{field.strip()}' at position {start + len(field) - len(field.lstrip())}")
+                start += len(field) + 1
+        pos = match.end()
+    NScheckBrackets(text, pos, len(text))
     return tpl_list
 
 
+# converte una stringa in una lista di elementi
+def NSstringToList(text):
+    """
+    Converts a string containing elements separated by spaces, commas or semicolons to the list
+    of the elements, ignoring the brackets possibly enclosing them.
+    ----
+    Parameters:
+    - text: string
+    Returns: the list of the elements as strings
+    """
+    elements = text.translate(NS_SEPARATORS).split()   # un'unica passata sostituisce i separatori e rimuove le parentesi
+    return elements
+
+
+# verifica che una porzione di testo non contenga parentesi
+def NScheckBrackets(text, start, end):
+    """
+    Checks that a portion of a string does not contain round or square brackets,
+    i.e. that all the tuples of the string are correctly opened and closed.
+    ----
+    Parameters:
+    - text: string
+    - start, end: limits of the portion of the string to check
+    """
+    bracket = NS_BRACKET.search(text, start, end)
+    if bracket is not None:
+        raise ValueError(f"unbalanced bracket '{bracket.group()}' at position {bracket.start()}")
+
+
+# restituisce True se la stringa rappresenta un numero reale
+def NSisNumber(text):
+    """
+    Checks if a string represents a real number.
+    ----
+    Parameters:
+    - text: string
+    Returns: True if text can be converted to float
+    """
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
 # restituisce True se il valore è una stringa che rappresenta un dizionario esteso (con :, -> o |->)
 def NSisExtDict(obj):
     """
@@ -59,29 +169,49 @@ def NSisExtDict(obj):
 # converte una stringa in un dizionario corrispondente
 def NSstringToDict(text):
     """
-    Removes superscripts and quotation marks as well as parentheses of pairs and allows the use of
-    alternate use of ; as a separator between pairs and of quotation marks as a match
-    always obtaining a string containing a sequence of key:obj pairs separated by commas
+    Converts a string containing a sequence of key:value pairs (the correspondence can also be expressed
+    by -> or |->) separated by commas, semicolons or spaces to the corresponding dictionary.
+    Quotation marks and brackets enclosing keys, values or pairs are ignored.
     ----
     Parameters:
     - text: string
     ----
     Returns: the dictionary corresponding to the structure defined in the string
     """
-    sostituz = {"'": "", '"': "", "(": "", ")": "", "[": "", "]": "",
-                "{": "", "}": "", " ": ",", ";": ",", ",,": ",",
-                "|->": ":", "->": ':'}
-    text = NSreplace(text, sostituz)
-    # avendo rimosso le stringhe (e i delimitatori) trasforma prima le chiavi in formato stringa
-    listcouples = text.split(',')  # spezza le coppie
-    # elabora ciascuna coppia chiave-valore per costruire la nuova stringa
-    diz = dict()
-    for couple in listcouples:
-        key, value = couple.split(':')
-        diz[key] = value
+    source = text
+    if any(c in text for c in "()[]{}'\""):   # rimuove virgolette e parentesi solo se presenti
+        text = text.translate(NS_QUOTES)
+    if "->" in text:
+        text = text.replace("|->", ":").replace("->", ":")
+    if " :" in text or ": " in text:   # ammette spazi attorno alla corrispondenza
+        text = NS_ARROW.sub(":", text)
+    couples = filter(None, ",".join(text.replace(";", ",").split()).split(","))   # spazi, virgole e punti e virgola separano le coppie
+    try:
+        diz = dict([couple.split(":") for couple in couples])
+    except ValueError:
+        diz = dict()
+    if len(diz) == 0 or "" in diz or "" in diz.values():
+        raise ValueError(f"invalid key-value pair at position {NSpairErrorPosition(source)}")
     return diz
 
 
+# restituisce la posizione della prima coppia chiave-valore non valida
+def NSpairErrorPosition(text):
+    """
+    Scans a string containing a sequence of key:value pairs to find the first invalid one.
+    ----
+    Parameters:
+    - text: string
+    Returns: the position in the string of the first invalid pair
+    """
+    pos = 0
+    couple = NS_COUPLE.match(text)
+    while couple is not None and couple.group("key").translate(NS_QUOTES) and couple.group("value").translate(NS_QUOTES):
+        pos = couple.end()
+        couple = NS_COUPLE.match(text, pos)
+    return NS_SPACES.match(text, pos).end()
+
+
 # divide il testo in linee di lunghezza massima max_length
 def NSsplitText(text, max_length):
     """
@@ -93,16 +223,362 @@ def NSsplitText(text, max_length):
     ----
     Returns: the text splitted in more lines long at most max_length
     """
-    words = text.split()
-    lines = []
-    current_line = ""
+    lines = NSwrapWords(text.split(), max_length)
+    result = "\n".join(lines)    # unisce le righe col carattere di andata a capo
+    return result
+
+
+# raggruppa una sequenza di parole in linee di lunghezza massima max_length
+def NSwrapWords(words, max_length):
+    """
+    Generates one at a time the lines of predetermined maximum length obtained by joining
+    a sequence of words with single spaces, in linear time (a word longer than max_length
+    fills a line by itself).
+    ----
+    Parameters:
+    - words: iterable of strings without spaces
+    - max_length : the predetermined maximum length
+    ----
+    Returns: an iterator of the lines
+    """
+    line = []
+    length = 0   # lunghezza della riga corrente comprensiva di uno spazio dopo ogni parola
     for word in words:
-        if len(current_line) + len(word) <= max_length:
-            current_line += word + " "  #  aggiungi la parola alla riga corrente
+        if length + len(word) <= max_length:
+            line.append(word)  #  aggiungi la parola alla riga corrente
+            length += len(word) + 1
         else:
-            lines.append(current_line.strip())    # aggiungi la riga corrente alle righe
-            current_line = word + " "  # Inizia una nuova riga con la parola attuale
-    lines.append(current_line.strip())    # aggiungi l'ultima riga rimanente
-    result = "\n".join(lines)    # unisce le righe col carattere di andata a capo
+            yield " ".join(line)    # restituisci la riga corrente
+            line = [word]  # inizia una nuova riga con la parola attuale
+            length = len(word) + 1
+    yield " ".join(line)    # restituisci l'ultima riga rimanente
+
+
+# contrassegna una funzione come applicabile ad intere colonne di gradi
+def NSvectorizable(f):
+    """
+    Decorator that marks a binary function on degrees as vectorizable, i.e. applicable
+    both to two real numbers and to two whole numpy arrays of degrees, element-wise.
+    ----
+    Parameters:
+    - f: binary function
+    ----
+    Returns: the same function f marked as vectorizable
+    """
+    f.vectorizable = True
+    return f
+
+
+# restituisce True se la funzione è stata contrassegnata come vettoriale
+def NSisVectorizable(f):
+    """
+    Checks if a function has been marked as vectorizable by the NSvectorizable decorator.
+    ----
+    Parameters:
+    - f: a generic function
+    Returns: True if f can be applied to whole numpy arrays of degrees
+    """
+    return getattr(f, "vectorizable", False) == True
+
+
+# scrive un file binario composto da sezioni di stringhe e di array numerici
+def NSwriteBinary(path, magic, sections):
+    """
+    Writes a binary container made of a header, a table of sections and the sections themselves,
+    each of them aligned to 8 bytes: a section is either a table of strings (encoded in UTF-8 and
+    separated by the null character) or an array of numbers stored in the native byte order.
+    ----
+    Parameters:
+    - path: name of the file
+    - magic: 8 bytes identifying the type of the content
+    - sections: list whose items are lists of strings or pairs (typecode, buffer) where typecode is
+                one of 'f', 'd', 'i', 'q' (as for array.array) and buffer is a contiguous array of such numbers
+    """
+    blocks = list()
+    for section in sections:
+        if type(section) == list:
+            if any("\0" in s for s in section):
+                raise ValueError("the elements of a universe set saved in binary format cannot contain the null character")
+            blocks.append((b"s", len(section), "\0".join(section).encode("utf-8")))
+        else:
+            typecode, buffer = section
+            data = memoryview(buffer).cast("B")
+            blocks.append((typecode.encode(), len(data) // BINARY_ITEMSIZE[typecode], data))
+    offset = BINARY_HEADER.size + BINARY_SECTION.size * len(blocks)
+    table = list()
+    for typecode, count, data in blocks:
+        offset += -offset % 8   # allinea ogni sezione a 8 byte
+        table.append(BINARY_SECTION.pack(typecode, count, offset, len(data)))
+        offset += len(data)
+    with open(path, "wb") as file:
+        file.write(BINARY_HEADER.pack(magic, BINARY_VERSION, len(blocks), sys.byteorder == "little"))
+        file.write(b"".join(table))
+        for (typecode, count, data), entry in zip(blocks, table):
+            file.write(b"\0" * (BINARY_SECTION.unpack(entry)[2] - file.tell()))
+            file.write(data)
+
+
+# legge un file binario scritto da NSwriteBinary eventualmente mappandolo in memoria
+def NSreadBinary(path, magic, mmap=True):
+    """
+    Reads a binary container written by NSwriteBinary. The arrays are memory-mapped in copy-on-write mode
+    (so that loading takes constant time and changes are never written back to the file) or read in memory.
+    ----
+    Parameters:
+    - path: name of the file
+    - magic: 8 bytes identifying the expected type of the content
+    - mmap: True (default) to map the arrays in memory, False to read them
+    ----
+    Returns: the list of the sections, i.e. lists of strings and numpy arrays
+             (array.array objects or memoryviews if numpy is not installed)
+    """
+    with open(path, "rb") as file:
+        header = file.read(BINARY_HEADER.size)
+        if len(header) != BINARY_HEADER.size or header[:8] != magic:
+            raise ValueError("the file does not contain an object of the expected type")
+        _, version, count, little = BINARY_HEADER.unpack(header)
+        if version != BINARY_VERSION or little != (sys.byteorder == "little"):
+            raise ValueError("unsupported version or byte order of the binary file")
+        table = [BINARY_SECTION.unpack(file.read(BINARY_SECTION.size)) for i in range(count)]
+        mapped = MemoryMap(file.fileno(), 0, access=ACCESS_COPY) if mmap else None
+        sections = list()
+        for typecode, count, offset, length in table:
+            typecode = typecode.decode()
+            if typecode == "s":
+                file.seek(offset)
+                text = file.read(length).decode("utf-8")
+                sections.append(text.split("\0") if count > 0 else list())
+            elif mapped is not None:
+                if np is not None:
+                    sections.append(np.frombuffer(mapped, dtype=typecode, count=count, offset=offset) if count > 0
+                                    else np.empty(0, dtype=typecode))
+                else:
+                    sections.append(memoryview(mapped)[offset:offset + length].cast(typecode))
+            else:
+                file.seek(offset)
+                if np is not None:
+                    sections.append(np.fromfile(file, dtype=typecode, count=count))
+                else:
+                    values = array(typecode)
+                    values.frombytes(file.read(length))
+                    sections.append(values)
+    return sections
+
+
+# calcola una relazione tra due blocchi di insiemi neutrosofici impilati
+def NSrelationTile(X, Y, relation, blocksize):
+    """
+    Computes a relation between every set of a block of stacked neutrosophic sets and every set of
+    a second block, examining the universe in blocks of elements to bound the memory used.
+    ----
+    Parameters:
+    - X, Y: numpy arrays (k,n,3) and (h,n,3) of the degrees of two blocks of neutrosophic sets
+    - relation: name of the relation ("inclusion", "equality" or "disjointness")
+    - blocksize: number of elements of the universe compared at a time
+    ----
+    Returns: the (k,h) boolean numpy array whose entry (i,j) is True if X[i] and Y[j] are in relation
+    """
+    compare = NS_RELATIONS[relation]
+    result = np.ones((len(X), len(Y)), dtype=bool)
+    for start in range(0, X.shape[1], blocksize):
+        stop = start + blocksize
+        result &= compare(X[:, None, start:stop], Y[None, :, start:stop]).all(axis=2)
+        if not result.any():   # nessuna coppia del blocco può più essere in relazione
+            break
     return result
 
+
+# inizializza un processo di calcolo delle relazioni col tensore condiviso
+def NSshareTensor(tensor):
+    """
+    Initializer of the worker processes computing relations, which stores the stacked neutrosophic sets.
+    ----
+    Parameters:
+    - tensor: numpy array (N,n,3) of the degrees of the family of neutrosophic sets
+    """
+    NS_SHARED["tensor"] = tensor
+
+
+# calcola in un processo una relazione tra due blocchi del tensore condiviso
+def NSrelationTask(task):
+    """
+    Computes in a worker process a relation between two blocks of the shared stacked neutrosophic sets.
+    ----
+    Parameters:
+    - task: tuple (i, j, tile, relation, blocksize) where i and j are the first rows of the two blocks
+    ----
+    Returns: the boolean numpy array computed by NSrelationTile
+    """
+    i, j, tile, relation, blocksize = task
+    tensor = NS_SHARED["tensor"]
+    return NSrelationTile(tensor[i:i + tile], tensor[j:j + tile], relation, blocksize)
+
+
+# calcola la matrice di una relazione tra tutte le coppie di una famiglia di insiemi neutrosofici impilati
+def NSrelationMatrix(tensor, relation, symmetric, maxelements, processes=None):
+    """
+    Computes the matrix of a relation between all the pairs of a family of stacked neutrosophic sets,
+    by square tiles of pairs such that at most maxelements triples are compared at a time,
+    optionally distributing the tiles over a pool of processes.
+    ----
+    Parameters:
+    - tensor: numpy array (N,n,3) of the degrees of the family of neutrosophic sets
+    - relation: name of the relation ("inclusion", "equality" or "disjointness")
+    - symmetric: True if the relation is symmetric, so that only the tiles over the diagonal are computed
+    - maxelements: maximum number of triples compared at a time in a tile
+    - processes: number of worker processes or None (default) to compute in the current process
+    ----
+    Returns: the (N,N) boolean numpy array of the relation
+    """
+    N, n = tensor.shape[0], tensor.shape[1]
+    blocksize = max(1, min(n, maxelements))
+    tile = max(1, isqrt(maxelements // blocksize))
+    tiles = [(i, j) for i in range(0, N, tile) for j in range(i if symmetric else 0, N, tile)]
+    matrix = np.empty((N, N), dtype=bool)
+    if processes is not None and processes > 1 and len(tiles) > 1:
+        with ProcessPoolExecutor(processes, initializer=NSshareTensor, initargs=(tensor,)) as pool:
+            results = list(pool.map(NSrelationTask, [(i, j, tile, relation, blocksize) for i, j in tiles],
+                                    chunksize=max(1, len(tiles) // (4 * processes))))
+    else:
+        results = (NSrelationTile(tensor[i:i + tile], tensor[j:j + tile], relation, blocksize) for i, j in tiles)
+    for (i, j), tileresult in zip(tiles, results):
+        matrix[i:i + tile, j:j + tile] = tileresult
+        if symmetric:
+            matrix[j:j + tile, i:i + tile] = tileresult.T
+    return matrix
+
+
+# mescola i bit di un intero a 64 bit
+def NSmix64(z):
+    """
+    Mixes the bits of a 64-bit unsigned integer (the finalizer of SplitMix64), so that
+    close values have unrelated results.
+    ----
+    Parameters:
+    - z: integer in [0, 2^64) or numpy array of type uint64 (which is modified in place)
+    ----
+    Returns: the mixed integer or the numpy array of mixed integers
+    """
+    if np is not None and isinstance(z, np.ndarray):
+        z ^= z >> np.uint64(30)
+        z *= np.uint64(0xBF58476D1CE4E5B9)   # il prodotto tra array di uint64 è calcolato modulo 2^64
+        z ^= z >> np.uint64(27)
+        z *= np.uint64(0x94D049BB133111EB)
+        z ^= z >> np.uint64(31)
+        return z
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & NS_MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & NS_MASK64
+    return z ^ (z >> 31)
+
+
+# restituisce l'hash a 64 bit di una tripla di gradi
+def NStripleHash(triple):
+    """
+    Returns the 64-bit hash of a triple of degrees, computed on their bits as double precision reals
+    (so that equal degrees, e.g. 1 and 1.0 or 0.0 and -0.0, have the same hash).
+    ----
+    Parameters:
+    - triple: membership, indeterminacy and non-membership degree
+    ----
+    Returns: the hash as an integer in [0, 2^64)
+    """
+    h = 0
+    for x, key in zip(triple, NS_DEGREEKEYS):
+        bits = NS_UINT64.unpack(NS_FLOAT.pack(float(x) + 0.0))[0]
+        h += NSmix64((bits + key) & NS_MASK64)
+    return h & NS_MASK64
+
+
+# restituisce gli hash a 64 bit di un array di triple di gradi
+def NStripleHashes(degrees, axis=-1):
+    """
+    Returns the 64-bit hashes of an array of triples of degrees, equal to those computed by NStripleHash.
+    ----
+    Parameters:
+    - degrees: numpy array (or list) containing the three degrees along a given axis
+    - axis: axis of the degrees (default: the last one)
+    ----
+    Returns: the numpy array of type uint64 of the hashes, with the same shape of degrees without axis
+    """
+    bits = (np.asarray(degrees, dtype=np.float64) + 0.0).view(np.uint64)   # copia con lo zero negativo normalizzato
+    hashes = None
+    for j, key in enumerate(NS_DEGREEKEYS):
+        h = np.take(bits, j, axis=axis)
+        h += np.uint64(key)
+        h = NSmix64(h)
+        if hashes is None:
+            hashes = h
+        else:
+            hashes += h
+    return hashes
+
+
+# restituisce i pesi delle posizioni delle impronte
+@lru_cache(maxsize=16)
+def NSpositionWeights(n):
+    """
+    Returns the odd 64-bit weights of the first n positions used by the fingerprints.
+    ----
+    Parameters:
+    - n: number of positions
+    ----
+    Returns: a read-only numpy array of type uint64 or, without numpy, an array of unsigned integers
+    """
+    if np is not None:
+        weights = NSmix64(np.arange(n, dtype=np.uint64) + np.uint64(NS_POSITIONKEY))
+        weights |= np.uint64(1)
+        weights.flags.writeable = False
+        return weights
+    return array("Q", [NSmix64((i + NS_POSITIONKEY) & NS_MASK64) | 1 for i in range(n)])
+
+
+# restituisce la somma dei pesi delle prime n posizioni
+@lru_cache(maxsize=16)
+def NSweightSum(n):
+    """
+    Returns the sum modulo 2^64 of the weights of the first n positions, i.e. the fingerprint
+    of a sequence of n values whose hash is 1.
+    ----
+    Parameters:
+    - n: number of positions
+    ----
+    Returns: the sum as an integer in [0, 2^64)
+    """
+    weights = NSpositionWeights(n)
+    if np is not None:
+        return int(weights.sum(dtype=np.uint64))
+    return sum(weights) & NS_MASK64
+
+
+# restituisce la somma pesata modulo 2^64 degli hash di una sequenza di valori
+def NSweightedSum(hashes):
+    """
+    Returns the fingerprint of a sequence of values, i.e. the sum modulo 2^64 of their hashes
+    multiplied by the weights of their positions.
+    ----
+    Parameters:
+    - hashes: numpy array of type uint64 or list of the hashes of the values
+    ----
+    Returns: the fingerprint as an integer in [0, 2^64)
+    """
+    weights = NSpositionWeights(len(hashes))
+    if np is not None and isinstance(hashes, np.ndarray):
+        return int((weights * hashes).sum(dtype=np.uint64))
+    if np is not None:
+        weights = weights.tolist()   # prodotti tra interi Python senza limiti di precisione
+    return sum(w * h for w, h in zip(weights, hashes)) & NS_MASK64
+
+
+# restituisce l'impronta a 64 bit di una sequenza di stringhe
+def NStextFingerprint(strings):
+    """
+    Returns a 64-bit fingerprint of a sequence of strings, which does not depend on the process
+    (unlike the built-in function hash).
+    ----
+    Parameters:
+    - strings: sequence of strings
+    ----
+    Returns: the fingerprint as an integer in [0, 2^64)
+    """
+    digest = blake2b("\0".join(strings).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
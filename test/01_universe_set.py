@@ -34,6 +34,7 @@ print(V2)
 V3 = NSuniverse(V2)
 print(V3)
 print(f"{V2==V3} ?")
+print(f"V2 and NSuniverse('2,4,5') are the same shared object ? {V2 is NSuniverse('2,4,5')}")
 Z = NSuniverse("a")
 print(Z)
 
@@ -41,4 +42,7 @@ T = NSuniverse(" ( a b c , d ; e )")
 T = NSuniverse(" { a b c , d ; e }")
 T = NSuniverse(" [ a b c , d ; e ]")
 print(T)
-print(f"Cardinality of T is è {T.cardinality()}")
\ No newline at end of file
+print(f"Cardinality of T is è {T.cardinality()}")
+print(f"d belongs to T ? {'d' in T}")
+print(f"z belongs to T ? {T.contains('z')}")
+print(f"the position of d in T is {T.indexOf('d')} and T has {len(T)} elements")
@@ -44,4 +44,9 @@ print(f"indeterminacy = {B.getIndeterminacy('d')}")
 
 F = NSset(V)
 F.setAbsolute()
-print("F=", F)
\ No newline at end of file
+print("F=", F)
+
+try:
+    G = NSset(V, "(0.5,0.3,0.2), (0.6,O.2,0.3), (0.4,0.2,0.7)")   # lettera O al posto dello zero
+except ValueError as e:
+    print("error:", e)
\ No newline at end of file
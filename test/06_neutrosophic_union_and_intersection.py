@@ -35,3 +35,7 @@ print(f"intersezione =\n{D}")
 print(f"intersezione =\n{A & B}")  # con l'overloading degli operatori
 
 
+
+E = NSset(U, "(0.5,0.1,0.5), (0.3,0.9,0.2), (0.6,0.4,0.3)")
+print(f"unione di A, B, E =\n{NSset.unionAll([A, B, E])}")   # un solo insieme risultante senza insiemi intermedi
+print(f"intersezione di A, B, E =\n{NSset.intersectionAll(X for X in (A, B, E))}")   # anche mediante un generatore
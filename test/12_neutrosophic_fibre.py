@@ -18,4 +18,6 @@ print("f =", f)
 
 print(f"La fibra di 1 mediante la f è {f.getFibre(1)}")
 print(f"La fibra di 3 mediante la f è {f.getFibre(3)}")
-print(f"La fibra di 4 mediante la f è {f.getFibre(4)}")
\ No newline at end of file
+print(f"La fibra di 4 mediante la f è {f.getFibre(4)}")
+f.setValue('c', 4)   # l'indice inverso delle fibre viene aggiornato in modo incrementale
+print(f"Le fibre mediante la f sono {f.getFibres()}")
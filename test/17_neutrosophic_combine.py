@@ -0,0 +1,33 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+neutrosophic operations defined by custom t-norms and t-conorms
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_util import NSvectorizable
+
+@NSvectorizable
+def product(a, b):   # t-norma prodotto
+    return a * b
+
+@NSvectorizable
+def probsum(a, b):   # t-conorma somma probabilistica
+    return a + b - a * b
+
+U = NSuniverse(1,2,3)
+A = NSset(U, "(0.4,0.3,0.4), (0.2,0.2,1), (0.1,0.1,0.9)")
+B = NSset(U, "(0.7,0.3,0.1), (0.4,0.6,0.8), (0.2,0.2,0.9)")
+print("A =", A)
+print("B =", B)
+
+C = A.combine(B, probsum, probsum, product)   # unione probabilistica
+print("A + B (probabilistic) =", C)
+
+D = A.combine(B, lambda a, b: max(0, a + b - 1), lambda a, b: max(0, a + b - 1), lambda a, b: min(1, a + b))   # Łukasiewicz
+print("A & B (Łukasiewicz) =", D)
+
+print(f"A + B = combine(A, B, max, max, min) ? {A + B == A.combine(B, max, max, min)}")
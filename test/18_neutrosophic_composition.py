@@ -0,0 +1,29 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+composition of neutrosophic mappings and images by chains of mappings
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_mapping import NSmapping
+
+U = NSuniverse("a,b,c,d,e")
+V = NSuniverse(1,2,3,4)
+W = NSuniverse("x,y")
+
+f = NSmapping(U, V, (1,3,1,2,1))
+g = NSmapping(V, W, "x,y,x,y")
+h = g @ f     # funzione composta g∘f (prima la f e poi la g)
+print("g∘f =", h)
+print(f"f.compose(g) = g∘f ? {f.compose(g) == h}")
+
+A = NSset(U, "(0.7,0.3,0.1), (0.4,0.6,0.9), (0,0,1), (0.1,0.4,0.5), (0.2,0.2,0.3)")
+print("A =", A)
+print("g(f(A)) =", g.NSimage(f.NSimage(A)))
+print("g(f(A)) =", NSmapping.chain([f, g], A))   # senza insiemi intermedi
+
+C = NSset(W, "(0.6,0.2,0.3), (0.1,0.5,0.8)")
+print("f^-1(g^-1(C)) =", NSmapping.chain([f, g], C, counterimage=True))
@@ -0,0 +1,25 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+sparse neutrosophic sets on a large universe
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+
+U = NSuniverse(list(range(1, 100001)))   # universo di centomila elementi
+
+A = NSset.sparse(U)              # insieme vuoto che memorizza solo gli elementi diversi da (0,0,1)
+A.setElement(7, (0.8,0.1,0.2))
+A.setElement(42, (0.3,0.5,0.6))
+B = NSset.sparse(U, "absolute")  # insieme assoluto che memorizza solo gli elementi diversi da (1,1,0)
+B.setElement(42, (0.4,0.2,0.1))
+
+C = A & B
+print(f"A & B is sparse ? {C.isSparse()}")
+print(f"(A & B)(7) = {C.getElement(7)},  (A & B)(42) = {C.getElement(42)},  (A & B)(99) = {C.getElement(99)}")
+print(f"A <= B ? {A <= B}")
+print(f"~A = B ? {~A == B}")
+print(f"(~A)(100) = {(~A).getElement(100)}")
@@ -0,0 +1,29 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+neutrosophic sets built from columns and matrices of degrees
+"""
+from array import array
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+
+U = NSuniverse("a,b,c,d")
+
+mu    = array("d", [0.1, 0.7, 1.0, 0.0])
+sigma = array("d", [0.2, 0.3, 0.0, 0.5])
+omega = array("d", [0.9, 0.1, 0.0, 1.0])
+A = NSset.fromArrays(U, mu, sigma, omega)
+print("A =", A)
+
+M = array("d", [0.1,0.2,0.9,  0.7,0.3,0.1,  1.0,0.0,0.0,  0.0,0.5,1.0])   # triple memorizzate riga per riga
+B = NSset.fromMatrix(U, M)
+print("B =", B)
+print(f"A = B ? {A == B}")
+
+try:
+    NSset.fromArrays(U, mu, sigma, array("d", [0.9, 0.1, 1.5, 1.0]))
+except ValueError as e:
+    print("error:", e)
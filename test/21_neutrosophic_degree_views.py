@@ -0,0 +1,22 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+read-only views of the degrees of a neutrosophic set
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+
+U = NSuniverse("a,b,c")
+A = NSset(U, "(0.5,0.3,0.2), (0.6,0.2,0.3), (0.4,0.2,0.7)")
+print("A =", A)
+
+print("degrees of A:", A.toArray().tolist())
+print("memberships of A:", [float(x) for x in A.memberships()])
+print("indeterminacies of A:", [float(x) for x in A.indeterminacies()])
+print("non-memberships of A:", [float(x) for x in A.nonMemberships()])
+
+A.setMembership('c', 0.9)
+print("memberships of A after setting c:", [float(x) for x in A.memberships()])
@@ -0,0 +1,42 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+saving and loading neutrosophic sets and mappings in binary files
+"""
+import os
+import struct
+import tempfile
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_mapping import NSmapping
+
+folder = tempfile.mkdtemp()
+
+U = NSuniverse("a,b,c")
+A = NSset(U, "(0.5,0.3,0.2), (0.6,0.2,0.3), (0.4,0.2,0.7)")
+print("A =", A)
+A.save(os.path.join(folder, "A.nss"))
+B = NSset.load(os.path.join(folder, "A.nss"))
+print("B =", B)
+print(f"A = B ? {A == B}")
+
+f = NSmapping(U, "x,y", "x y x")
+print("f =", f)
+f.save(os.path.join(folder, "f.nsm"))
+g = NSmapping.load(os.path.join(folder, "f.nsm"))
+print(f"f = g ? {f == g}")
+print("g(A) =", g.NSimage(A))
+
+# un file alterato viene rifiutato sia mappandolo in memoria che leggendolo
+with open(os.path.join(folder, "A.nss"), "rb") as file:
+    data = file.read()
+with open(os.path.join(folder, "C.nss"), "wb") as file:
+    file.write(data.replace(struct.pack("d", 0.6), struct.pack("d", 1.5)))
+for mmap in [True, False]:
+    try:
+        NSset.load(os.path.join(folder, "C.nss"), mmap)
+    except ValueError as error:
+        print(f"loading a file containing a degree 1.5 (mmap={mmap}): {error}")
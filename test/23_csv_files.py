@@ -0,0 +1,30 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+reading and writing neutrosophic sets as delimited text files (CSV and TSV)
+"""
+import io
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+
+U = NSuniverse("a,b,c,d,e")
+A = NSset(U, "(0.5,0.3,0.2), (0.6,0.2,0.3), (0.4,0.2,0.7), (1,0,0), (0,0,1)")
+print("A =", A)
+
+file = io.StringIO()
+A.writeCSV(file)
+print(file.getvalue())
+
+file.seek(0)
+B = NSset.readCSV(file)
+print(f"A = B ? {A == B}")
+
+file.seek(0)
+for C in NSset.iterCSV(file, chunksize=2):   # un insieme neutrosofico per ogni blocco di due righe
+    print(C)
+
+file = io.StringIO("a\t0.5\t0.3\t0.2\nb\t0.6\t0.2\t0.3\n")
+print(NSset.readCSV(file, delimiter="\t"))
@@ -0,0 +1,23 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+streamed and truncated textual representation of neutrosophic sets and mappings
+"""
+import sys
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_mapping import NSmapping
+
+U = NSuniverse([f"e{i}" for i in range(100)])
+A = NSset.fromArrays(U, [i/100 for i in range(100)], [0.5]*100, [round(1 - i/100, 2) for i in range(100)])
+
+for line in A.iterLines(limit=6):   # primi ed ultimi tre elementi
+    print(line)
+
+A.write(sys.stdout, tabularFormat=True, limit=4)
+
+f = NSmapping(U, "even, odd", ["even", "odd"] * 50)
+print(repr(f))
@@ -0,0 +1,33 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+profiling the operations on neutrosophic sets and mappings
+"""
+from threading import Thread
+from NS.pyns import profile
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_mapping import NSmapping
+
+with profile() as p:
+    U = NSuniverse("a,b,c,d")
+    A = NSset(U, "(0.5,0.3,0.2), (0.6,0.2,0.3), (0.4,0.2,0.7), (1,0,0)")
+    B = NSset(U, "(0.2,0.3,0.4), (0.1,0.1,0.9), (0.8,0.1,0.1), (0,0,1)")
+    C = A + B
+    f = NSmapping("a->x, b->y, c->x, d->z")
+    D = f.NSimage(C)
+
+for operation, stats in p.summary().items():   # i tempi variano ad ogni esecuzione e non vengono stampati
+    print(f"{operation:<24} calls: {stats['calls']:>3}   elements: {stats['elements']:>4}")
+
+# il profilo è globale per il processo: registra anche le operazioni degli altri thread
+original = NSset.NSintersection
+with profile() as q:
+    worker = Thread(target=lambda: A & B)
+    worker.start()
+    worker.join()
+print("intersections recorded from another thread:", q.summary()["NSset.NSintersection"]["calls"])
+print("methods restored after the with blocks ?", NSset.NSintersection is original)
@@ -0,0 +1,26 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+inclusion, equality and disjointness matrices of a family of neutrosophic sets
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+
+U = NSuniverse("a,b,c,d")
+family = [NSset(U),
+          NSset(U, "(0.5,0.3,0.2), (0,0,1), (0.4,0.2,0.7), (0,0,1)"),
+          NSset(U, "(0.6,0.3,0.1), (0,0,1), (0.4,0.5,0.7), (0,0,1)"),
+          NSset(U, "(0,0,1), (0.2,0.1,0.8), (0,0,1), (1,0,0)"),
+          NSset(U, "(0,0,1), (0.2,0.1,0.8), (0,0,1), (1,0,0)")]
+for k, A in enumerate(family):
+    print(f"A{k} = {A}")
+
+for name, matrix in [("inclusion", NSset.inclusionMatrix(family)),
+                     ("equality", NSset.equalityMatrix(family)),
+                     ("disjointness", NSset.disjointnessMatrix(family))]:
+    print(f"\n{name} matrix:")
+    for row in matrix:
+        print(" ".join("1" if x else "0" for x in row))
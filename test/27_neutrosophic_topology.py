@@ -0,0 +1,41 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+verification of neutrosophic topologies and topology generated by a subbase
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_topology import NStopology
+
+U = NSuniverse("a,b,c")
+A = NSset(U, "(0.5,0.2,0.4), (0.3,0.1,0.6), (0,0,1)")
+B = NSset(U, "(0.2,0.3,0.5), (0.6,0.1,0.2), (0.4,0.2,0.5)")
+print("A =", A)
+print("B =", B)
+
+E = NSset(U)
+X = NSset(U)
+X.setAbsolute()
+family = NStopology([E, A, A, X])   # i membri ripetuti vengono memorizzati una sola volta
+print(f"\nthe family {{0, A, A, 1}} has {family.cardinality()} distinct members")
+print(f"is it a neutrosophic topology ? {family.isTopology()}")
+
+family = NStopology([E, A, B, X])
+print(f"\nis {{0, A, B, 1}} closed under union ? {family.isUnionClosed()}")
+print(f"is {{0, A, B, 1}} closed under intersection ? {family.isIntersectionClosed()}")
+print(f"is it a neutrosophic topology ? {family.isTopology()}")
+
+T = NStopology.generatedBy([A, B])
+print(f"\nthe neutrosophic topology generated by the subbase {{A, B}} has {T.cardinality()} open sets:")
+print(T)
+print(f"is it a neutrosophic topology ? {T.isTopology()}")
+print(f"does it contain A+B ? {T.contains(A + B)}")
+
+C = NSset(U, "(0.5,0.3,0.4), (0.6,0.2,0.3), (0.4,0.2,0.5)")
+print("\nC =", C)
+print("interior of C  =", T.interior(C))
+print("closure of C   =", T.closure(C))
+print("boundary of C  =", T.boundary(C))
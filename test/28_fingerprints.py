@@ -0,0 +1,66 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+fingerprints of neutrosophic sets and mappings, used as keys of dictionaries
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_mapping import NSmapping
+
+try:
+    import numpy
+except ImportError:   # la memorizzazione float32 richiede il pacchetto numpy
+    numpy = None
+
+U = NSuniverse("a,b,c,d")
+A = NSset(U, "(0.5,0.3,0.2), (0,0,1), (0.4,0.2,0.7), (0,0,1)")
+B = NSset.sparse(U, "empty")   # stesso contenuto di A memorizzato in forma sparsa
+B.setElement("a", (0.5, 0.3, 0.2))
+B.setElement("c", (0.4, 0.2, 0.7))
+print("A =", A)
+print(f"fingerprint of A = {A.fingerprint():016x}")
+print(f"fingerprint of B = {B.fingerprint():016x}")
+print(f"A = B ? {A == B}")
+
+B.setMembership("d", 0.1)   # l'impronta viene aggiornata in tempo costante
+print(f"\nafter setting the membership of d in B to 0.1:")
+print(f"fingerprint of B = {B.fingerprint():016x}")
+print(f"A = B ? {A == B}")
+
+names = {A: "A", B: "B"}   # gli insiemi neutrosofici possono essere chiavi di un dizionario
+C = NSset(U, "(0.5,0.3,0.2), (0,0,1), (0.4,0.2,0.7), (0,0,1)")
+print(f"\nthe set C equal to A is found in the dictionary as {names[C]}")
+print(f"distinct sets among A, B, C: {len({A, B, C})}")
+
+triple = C.getElement("b")   # le triple restituite sono copie: modificarle non altera C né la sua impronta
+triple[0] = 0.8
+C.get()["c"][0] = 0.9
+print("\nafter editing the triples returned by getElement and get:")
+print("C =", C)
+print(f"A = C ? {A == C},  same fingerprint ? {A.fingerprint() == C.fingerprint()}")
+
+if numpy is None:
+    print("\nnumpy is not installed: float32 storage is not available")
+else:
+    NSset.backend, NSset.dtype = "numpy", "float32"   # i gradi assegnati vengono arrotondati a float32
+    D = NSset(U, "(0.5,0.3,0.2), (0,0,1), (0.4,0.2,0.7), (0,0,1)")
+    E = NSset(U, "(0.5,0.3,0.2), (0,0,1), (0.4,0.2,0.7), (0,0,1)")
+    NSset.backend, NSset.dtype = "python", "float64"
+    D.fingerprint()   # l'impronta di D, già calcolata, viene aggiornata dalla modifica seguente
+    D.setMembership("b", 0.1)
+    E.setMembership("b", 0.1)
+    print("\nafter setting the membership of b to 0.1 in two float32 sets D and E:")
+    print(f"D = E ? {D == E},  same fingerprint ? {D.fingerprint() == E.fingerprint()},  distinct sets: {len({D, E})}")
+
+f = NSmapping("a,b,c,d", "x,y,z", ["x", "y", "x", "z"])
+g = NSmapping("a,b,c,d", "x,y,z", ["x", "y", "x", "z"])
+print(f"\nf = {f}")
+print(f"fingerprint of f = {f.fingerprint():016x}")
+print(f"f = g ? {f == g},  same fingerprint ? {f.fingerprint() == g.fingerprint()}")
+g.setValue("d", "x")
+print(f"after g(d)=x: f = g ? {f == g},  same fingerprint ? {f.fingerprint() == g.fingerprint()}")
+print("fibres of f:", f.getFibres())
+print("fibres of g:", g.getFibres())
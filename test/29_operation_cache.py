@@ -0,0 +1,55 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+caching the results of the operations on neutrosophic sets and mappings
+"""
+from NS.pyns import cache
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_mapping import NSmapping
+
+try:
+    import numpy
+except ImportError:   # il motore numpy richiede il pacchetto numpy
+    numpy = None
+
+U = NSuniverse("a,b,c,d")
+A = NSset(U, "(0.5,0.3,0.2), (0.6,0.2,0.3), (0.4,0.2,0.7), (1,0,0)")
+B = NSset(U, "(0.2,0.3,0.4), (0.1,0.1,0.9), (0.8,0.1,0.1), (0,0,1)")
+f = NSmapping("a,b,c,d", "x,y,z", ["x", "y", "x", "z"])
+
+with cache(maxentries=3) as c:
+    for i in range(3):   # le stesse operazioni sugli stessi operandi vengono calcolate una sola volta
+        C = A + B
+        D = B + A        # l'unione è commutativa e condivide il risultato di A + B
+        E = f.NSimage(C)
+    print("A + B =", C)
+    print("f(A + B) =", E)
+    print(f"hits: {c.stats()['hits']}   misses: {c.stats()['misses']}   entries: {len(c)}")
+
+    A.getElement("d")[0] = 0.5   # le triple restituite sono copie: A e il risultato memorizzato non cambiano
+    print("\nafter editing the triple of d returned by A.getElement:")
+    print("A + B =", A + B)
+
+    A.setMembership("d", 0.9)   # cambiando un operando cambia la sua impronta e il risultato viene ricalcolato
+    print("\nafter setting the membership of d in A to 0.9:")
+    print("A + B =", A + B)
+    print("~A =", ~A)
+    print("A - B =", A - B)
+    s = c.stats()
+    print(f"hits: {s['hits']}   misses: {s['misses']}   evictions: {s['evictions']}   entries: {len(c)}")
+
+if numpy is None:
+    print("\nnumpy is not installed: operands with different storages are not available")
+else:
+    NSset.backend = "numpy"
+    G = NSset(U, "(0.2,0.3,0.4), (0.1,0.1,0.9), (0.8,0.1,0.1), (0,0,1)")   # stesso contenuto di B in un array numpy
+    NSset.backend = "python"
+    with cache() as c:   # il risultato usa la memorizzazione del primo operando: A + G e G + A non condividono la voce
+        H = A + G
+        K = G + A
+        print("\nstorage of A + G:", type(H.getDegrees()).__name__, "  storage of G + A:", type(K.getDegrees()).__name__)
+        print(f"A + G = G + A ? {H == K}   hits: {c.stats()['hits']}   misses: {c.stats()['misses']}")
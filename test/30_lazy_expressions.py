@@ -0,0 +1,35 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+lazy expressions of neutrosophic sets evaluated in a single pass
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+
+U = NSuniverse("a,b,c,d")
+A = NSset(U, "(0.5,0.3,0.2), (0.6,0.2,0.3), (0.4,0.2,0.7), (1,0,0)")
+B = NSset(U, "(0.2,0.3,0.4), (0.1,0.1,0.9), (0.8,0.1,0.1), (0,0,1)")
+C = NSset(U, "(0.7,0.1,0.2), (0.3,0.4,0.5), (0.5,0.5,0.5), (0.2,0.2,0.6)")
+D = NSset(U, "(0.1,0.2,0.8), (0.9,0.1,0.1), (0.3,0.3,0.3), (0.4,0.1,0.4)")
+E = NSset.sparse(U, "empty")
+
+NSset.lazy = True   # gli operatori costruiscono espressioni senza calcolare insiemi intermedi
+X = ~(A + B) & (C - D)
+Y = ~~A + (A & B) + E
+NSset.lazy = False
+print("X =", repr(X))
+print("Y =", repr(Y))
+
+print("\nvalue of X =", X)
+print("degrees of b in X:", X.getElement("b"))
+print("X = ~(A + B) & (C - D) ?", X == ~(A + B) & (C - D))   # confronto con il calcolo diretto
+print("Y = A ?", Y == A)   # doppio complementare, assorbimento e insieme vuoto vengono semplificati
+print("A != X ?", A != X, "  A >= X ?", A >= X, "  X <= A + B ?", X <= A + B)   # anche gli insiemi accettano espressioni
+print("A.NSunion(X) =", A.NSunion(X))
+
+A.setMembership("a", 0.9)   # le espressioni vengono valutate sui gradi correnti
+print("\nafter setting the membership of a in A to 0.9:")
+print("value of Y =", Y.evaluate())
@@ -0,0 +1,46 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+columnar numpy storage of the degrees of neutrosophic sets
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+
+try:
+    import numpy
+except ImportError:   # il motore numpy richiede il pacchetto numpy
+    numpy = None
+
+U = NSuniverse("a,b,c,d")
+A = NSset(U, "(0.5,0.3,0.2), (0.6,0.2,0.3), (0.4,0.2,0.7), (1,0,0)")   # motore "python": lista di triple
+
+if numpy is None:
+    print("numpy is not installed: only the python backend is available")
+else:
+    NSset.backend = "numpy"   # i nuovi insiemi memorizzano i gradi in un array (n,3) contiguo
+    B = NSset(U, "(0.2,0.3,0.4), (0.1,0.1,0.9), (0.8,0.1,0.1), (0,0,1)")
+    C = NSset(U)
+    NSset.backend = "python"
+    print("storage of A:", type(A.getDegrees()).__name__)
+    print("storage of B:", type(B.getDegrees()).__name__, B.getDegrees().shape)
+    print("B =", B)
+    print("empty set C =", C)
+    print("A + B =", A + B)   # il risultato usa la memorizzazione del primo operando
+    print("B + A =", B + A, " storage:", type((B + A).getDegrees()).__name__)
+    print("B & A =", B & A)
+    print("~B =", ~B)
+    print("B - A =", B - A)
+    print("A + B = B + A ?", A + B == B + A)
+    B.setMembership("d", 0.5)
+    print("membership of d in B:", B.getMembership("d"))
+    # i costruttori vettoriali rispettano il motore anche quando ricevono array numpy
+    D = NSset.fromArrays(U, numpy.array([0.1,0.2,0.3,0.4]), numpy.zeros(4), numpy.ones(4))
+    print("storage of fromArrays with the python backend:", type(D.getDegrees()).__name__)
+    NSset.backend = "numpy"
+    E = NSset.fromArrays(U, numpy.array([0.1,0.2,0.3,0.4]), numpy.zeros(4), numpy.ones(4))
+    NSset.backend = "python"
+    print("storage of fromArrays with the numpy backend:", type(E.getDegrees()).__name__)
+    print("D = E ?", D == E)
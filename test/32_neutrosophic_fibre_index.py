@@ -0,0 +1,29 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+inverse index of the fibres of a mapping
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_mapping import NSmapping
+
+U = NSuniverse("a,b,c,d,e,f")
+V = NSuniverse("x,y,z,w")
+
+f = NSmapping(U, V, ("x", "y", "x", "z", "x", "y"))
+print("f =", f)
+print("fibres of f:", f.getFibres())   # tutte le fibre, anche quelle vuote, dall'indice inverso
+print("fibre of x:", f.getFibre("x"))  # gli elementi di una fibra sono nell'ordine del dominio
+print("fibre of w:", f.getFibre("w"))
+
+f.setValue("a", "w")   # l'elemento viene spostato dalla fibra di x a quella di w
+f.setValue("e", "z")
+print("\nafter f(a)=w and f(e)=z:")
+print("fibres of f:", f.getFibres())
+print("fibre of z:", f.getFibre("z"))
+
+f.setValue("e", "x")   # il ripristino di un valore reinserisce l'elemento nella posizione corretta
+print("\nafter f(e)=x:")
+print("fibre of x:", f.getFibre("x"))
@@ -0,0 +1,33 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+neutrosophic image computed in a single grouped pass with both backends
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_mapping import NSmapping
+
+try:
+    import numpy
+except ImportError:   # il motore numpy richiede il pacchetto numpy
+    numpy = None
+
+U = NSuniverse("a,b,c,d,e")
+V = NSuniverse(1,2,3,4)
+degrees = "(0.7,0.3,0.1), (0.4,0.6,0.9), (0,0,1), (0.1,0.4,0.5), (0.2,0.2,0.3)"
+
+for backend in ["python", "numpy"]:
+    if backend == "numpy" and numpy is None:
+        print("numpy is not installed: the numpy backend is not available")
+        continue
+    NSset.backend = backend   # il motore determina la memorizzazione dei gradi e delle posizioni dei valori
+    A = NSset(U, degrees)
+    f = NSmapping(U, V, (1,3,1,2,1))
+    B = f.NSimage(A)   # massimi e minimi dei gradi di ogni fibra accumulati in un'unica scansione del dominio
+    print(f"{backend} backend:")
+    print("f(A) =", B)
+    print("the image of 4, whose fibre is empty, is", B.getElement(4))
+NSset.backend = "python"
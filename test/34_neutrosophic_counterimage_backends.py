@@ -0,0 +1,34 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+neutrosophic counterimage computed as a gather with both backends
+"""
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_mapping import NSmapping
+
+try:
+    import numpy
+except ImportError:   # il motore numpy richiede il pacchetto numpy
+    numpy = None
+
+U = NSuniverse("a,b,c,d,e")
+V = NSuniverse(1,2,3,4)
+degrees = "(0.7,0.3,0.1), (0.4,0.6,0.9), (0.5,0.5,0.5), (0.1,0.4,0.5)"
+
+for backend in ["python", "numpy"]:
+    if backend == "numpy" and numpy is None:
+        print("numpy is not installed: the numpy backend is not available")
+        continue
+    NSset.backend = backend
+    B = NSset(V, degrees)
+    f = NSmapping(U, V, (1,3,1,2,1))
+    A = f.NScounterimage(B)   # ogni elemento del dominio riceve i gradi del proprio valore
+    print(f"{backend} backend:")
+    print("f^-1(B) =", A)
+    f.setValue("e", 4)   # la posizione del nuovo valore viene aggiornata e usata dalla controimmagine successiva
+    print("after f(e)=4: f^-1(B) =", f.NScounterimage(B))
+NSset.backend = "python"
@@ -0,0 +1,35 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+interned universe sets shared by neutrosophic sets and mappings
+"""
+import pickle
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+from NS.pyns.ns_mapping import NSmapping
+
+U = NSuniverse("a,b,c")
+print("NSuniverse('a,b,c') is NSuniverse(['a','b','c']) ?", U is NSuniverse(["a", "b", "c"]))
+print("NSuniverse('a,b,c') is NSuniverse('a','b','c') ?", U is NSuniverse("a", "b", "c"))
+print("NSuniverse('a,b,c') is NSuniverse('c,b,a') ?", U is NSuniverse("c,b,a"))
+
+A = NSset("a,b,c")
+B = NSset(U, "(0.1,0.2,0.3), (0.4,0.5,0.6), (0.7,0.8,0.9)")
+f = NSmapping(U, "1,2", (1,2,1))
+print("A and B share their universe ?", A.getUniverseSet() is B.getUniverseSet())
+print("f is defined on the same universe ?", f.getDomain() is U)
+
+# gli universi sono oggetti immutabili e possono essere usati come chiavi di un dizionario
+labels = {U: "letters", NSuniverse(1,2): "numbers"}
+print("label of the universe of A:", labels[A.getUniverseSet()])
+
+# getUniverse restituisce una nuova lista, la cui modifica non altera l'universo condiviso
+elements = A.getUniverse()
+elements.append("d")
+print("edited list:", elements, "  universe of A:", A.getUniverseSet(), "  universe of B:", B.getUniverseSet())
+
+# la deserializzazione restituisce l'universo già esistente
+print("the unpickled universe is U ?", pickle.loads(pickle.dumps(U)) is U)
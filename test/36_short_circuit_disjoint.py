@@ -0,0 +1,39 @@
+"""
+Package Python Neutrosophic Sets (PYNS)
+----------------------------------------------------------------------------------
+author: Giorgio Nordo - Dipartimento MIFT, Università di Messina, Italy
+www.nordo.it   |  giorgio.nordo@unime.it
+----------------------------------------------------------------------------------
+neutrosophic disjointness checked in blocks stopping at the first counterexample
+"""
+from time import perf_counter
+from NS.pyns.ns_universe import NSuniverse
+from NS.pyns.ns_set import NSset
+
+n = 200000
+U = NSuniverse([f"u{i}" for i in range(n)])
+A = NSset.fromArrays(U, [0.5] + [0.0] * (n-1), [0.0] * n, [0.5] + [1.0] * (n-1))   # solo u0 appartiene ad A
+B = NSset.fromArrays(U, [0.0] * (n-1) + [0.5], [0.0] * n, [1.0] * (n-1) + [0.5])   # solo l'ultimo elemento appartiene a B
+C = NSset(B)
+C.setElement("u0", [0.3, 0.0, 0.6])   # C interseca A nel primo elemento
+D = NSset(A)
+D.setElement(f"u{n-1}", [0.3, 0.0, 0.6])   # D interseca B solo nell'ultimo elemento
+
+print("A and B disjoint ?", A.isNSdisjoint(B))   # tutti gli elementi vengono esaminati
+start = perf_counter()
+print("A and C disjoint ?", A.isNSdisjoint(C))   # controesempio nel primo blocco di elementi
+first = perf_counter() - start
+start = perf_counter()
+print("D and B disjoint ?", D.isNSdisjoint(B))   # controesempio nell'ultimo blocco di elementi
+last = perf_counter() - start
+# i tempi variano ad ogni esecuzione e non vengono stampati
+print("a counterexample among the first elements is found without scanning the others ?", 10 * first < last)
+
+# per due insiemi sparsi vengono esaminati solo gli elementi espliciti
+E = NSset.sparse(U)
+E.setElement("u1", [0.2, 0.0, 0.7])
+F = NSset.sparse(U)
+F.setElement("u2", [0.4, 0.0, 0.5])
+print("sparse E and F disjoint ?", E.isNSdisjoint(F))
+F.setElement("u1", [0.1, 0.1, 0.8])
+print("after setting u1 in F, sparse E and F disjoint ?", E.isNSdisjoint(F))